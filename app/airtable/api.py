@@ -1,18 +1,246 @@
-from pyairtable import api
-from pyairtable.api.params import options_to_params
+import asyncio
+from typing import Any, AsyncIterator, Iterable, Optional
+from urllib.parse import quote
 
+import httpx
+from pyairtable.api.params import options_to_json_and_params, options_to_params
 
-class Api(api.Api):
-    def paginate(self, base_id: str, table_name: str, offset: None, **options):
-        table = self.table(base_id=base_id, table_name=table_name)
+from ..log import logger
+from . import formulas
+from .cursors import PageCursors
+from .rate_limit import RateLimiter
+
+
+def is_unknown_field_error(response: httpx.Response) -> bool:
+    if response.status_code != 422:
+        return False
+    try:
+        return response.json().get("error", {}).get("type") == "UNKNOWN_FIELD_NAME"
+    except ValueError:
+        return False
+
+
+class Table:
+    def __init__(self, api: "Api", base_id: str, table_name: str):
+        self.api = api
+        self.base_id = base_id
+        self.table_name = table_name
+
+    @property
+    def url(self) -> str:
+        return self.api.build_url(self.base_id, quote(self.table_name, safe=""))
+
+    def record_url(self, record_id: str) -> str:
+        return f"{self.url}/{quote(record_id, safe='')}"
+
+    async def iterate(self, **options) -> AsyncIterator[list[dict]]:
+        offset = None
+        while True:
+            data = await self.api.list_records(self.url, offset=offset, **options)
+            yield data.get("records", [])
+
+            offset = data.get("offset")
+            if not offset:
+                break
+
+    async def all(self, **options) -> list[dict]:
+        records = []
+        async for page in self.iterate(**options):
+            records.extend(page)
+        return records
+
+    async def first(self, **options) -> Optional[dict]:
+        options.update({"max_records": 1, "page_size": 1})
+        async for page in self.iterate(**options):
+            for record in page:
+                return record
+        return None
+
+    async def get_many(self, record_ids: Iterable[str], **options) -> list[dict]:
+        """
+        Fetch records by ID, returned in the order their IDs were given (IDs without a record are skipped)
+
+        IDs are matched with RECORD_ID() in chunks whose formula stays under MAX_FORMULA_LENGTH, chunks are
+        fetched concurrently (paced by the API's rate limiter). No request is made for an empty list.
+        """
+        record_ids = list(dict.fromkeys(r_id for r_id in record_ids if r_id))
+        if len(record_ids) == 0:
+            return []
+
+        # Length of OR() less the separator the first formula doesn't need, each formula adds its length + a comma
+        empty_length = len(formulas.OR()) - 1
+
+        chunks: list[list[str]] = [[]]
+        chunk_length = empty_length
+        for r_id in record_ids:
+            match_formula = formulas.EQUAL(formulas.STR_VALUE(r_id), formulas.RECORD_ID())
+            if len(chunks[-1]) > 0 and chunk_length + len(match_formula) + 1 > self.api.MAX_FORMULA_LENGTH:
+                chunks.append([])
+                chunk_length = empty_length
+            chunks[-1].append(match_formula)
+            chunk_length += len(match_formula) + 1
+
+        pages = await asyncio.gather(*[self.all(formula=formulas.OR(*chunk), **options) for chunk in chunks])
+
+        records_by_id = {r["id"]: r for page in pages for r in page}
+        return [records_by_id[r_id] for r_id in record_ids if r_id in records_by_id]
+
+    async def get(self, record_id: str, **options) -> dict:
+        return await self.api.request("get", self.record_url(record_id), params=options_to_params(options))
+
+    async def create(self, fields: dict, typecast: bool = False) -> dict:
+        return await self.api.request("post", self.url, json={"fields": fields, "typecast": typecast})
+
+    async def update(self, record_id: str, fields: dict, replace: bool = False, typecast: bool = False) -> dict:
+        method = "put" if replace else "patch"
+        return await self.api.request(method, self.record_url(record_id), json={"fields": fields, "typecast": typecast})
+
+    async def _batch_write(self, method: str, records: list[dict], typecast: bool, **body) -> list[dict]:
+        """Write records MAX_RECORDS_PER_WRITE per request, chunks are sent concurrently and results keep input order"""
+        size = self.api.MAX_RECORDS_PER_WRITE
+        chunks = [records[i : i + size] for i in range(0, len(records), size)]
+
+        responses = await asyncio.gather(
+            *[
+                self.api.request(method, self.url, json={"records": chunk, "typecast": typecast, **body})
+                for chunk in chunks
+            ]
+        )
+        return [record for response in responses for record in response["records"]]
+
+    async def batch_create(self, records: list[dict], typecast: bool = False) -> list[dict]:
+        """Create one record per fields dict, no request is made for an empty list"""
+        return await self._batch_write("post", [{"fields": fields} for fields in records], typecast=typecast)
+
+    async def batch_update(self, records: list[dict], replace: bool = False, typecast: bool = False) -> list[dict]:
+        """Update records given as {"id": ..., "fields": {...}} dicts"""
+        return await self._batch_write("put" if replace else "patch", records, typecast=typecast)
+
+
+class Api:
+    API_URL = "https://api.airtable.com/v0"
+
+    # Airtable rejects GET requests with URLs longer than this, list requests fall back to POST /listRecords
+    MAX_URL_LENGTH = 16000
+
+    # Keeps multi-get formulas well under the URL limit once encoded, longer ID lists are split across requests
+    MAX_FORMULA_LENGTH = 4000
+
+    # Airtable creates/updates at most this many records per request
+    MAX_RECORDS_PER_WRITE = 10
+
+    MAX_RETRIES = 5
+    RETRY_BACKOFF_FACTOR = 0.25
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout: Optional[float] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        rate_limit: float = 5,
+    ):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+        self._session: Optional[httpx.AsyncClient] = None
+        # Table URLs whose field projection named a field the table doesn't have, they're fetched unprojected
+        self.unprojected_urls: set[str] = set()
+        # Requests beyond Airtable's per base rate limit are queued here rather than sent and rejected with a 429
+        self.rate_limiter = RateLimiter(rate=rate_limit)
+        self.cursors = PageCursors()
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        # The pooled session is created lazily so it binds to the event loop that first uses it
+        if self._session is None or self._session.is_closed:
+            self._session = httpx.AsyncClient(
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=self.timeout,
+                limits=self.limits,
+            )
+        return self._session
+
+    async def aclose(self):
+        if self._session is not None and not self._session.is_closed:
+            await self._session.aclose()
+        self._session = None
+
+    def build_url(self, *components: str) -> str:
+        return "/".join([self.API_URL, *components])
+
+    def table(self, base_id: str, table_name: str) -> Table:
+        return Table(self, base_id=base_id, table_name=table_name)
+
+    def base_id(self, url: str) -> str:
+        return url[len(self.API_URL) :].lstrip("/").split("/", 1)[0]
+
+    async def request(self, method: str, url: str, params: Optional[dict] = None, json: Optional[dict] = None) -> Any:
+        base_id = self.base_id(url)
+
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire(base_id)
+
+            response = await self.session.request(method, url, params=params, json=json)
+            if response.status_code == 429 and attempt < self.MAX_RETRIES:
+                backoff = self.RETRY_BACKOFF_FACTOR * (2**attempt)
+                try:
+                    backoff = max(backoff, float(response.headers.get("Retry-After", 0)))
+                except ValueError:
+                    pass
+
+                # Hold back the whole base, not just this request, other requests would be rejected all the same
+                self.rate_limiter.throttled(base_id, backoff)
+                attempt += 1
+                continue
+
+            response.raise_for_status()
+            return response.json()
+
+    async def list_records(self, url: str, offset: Optional[str] = None, **options) -> dict:
+        if options.get("fields") is None or url in self.unprojected_urls:
+            options.pop("fields", None)
+            return await self._list_records(url, offset=offset, **options)
+
+        try:
+            return await self._list_records(url, offset=offset, **options)
+        except httpx.HTTPStatusError as ex:
+            if not is_unknown_field_error(ex.response):
+                raise
+
+            # A model alias without a matching column shouldn't break reads, fall back to every column
+            logger.warning(f"Field projection rejected for {url}, fetching all fields: {ex.response.text}")
+            self.unprojected_urls.add(url)
+            options.pop("fields")
+            return await self._list_records(url, offset=offset, **options)
+
+    async def _list_records(self, url: str, offset: Optional[str] = None, **options) -> dict:
         params = options_to_params(options)
+        if offset:
+            params["offset"] = offset
+
+        if len(str(httpx.URL(url, params=params))) <= self.MAX_URL_LENGTH:
+            return await self.request("get", url, params=params)
+
+        json, params = options_to_json_and_params(options)
+        if offset:
+            json["offset"] = offset
+        return await self.request("post", f"{url}/listRecords", params=params, json=json)
+
+    async def paginate(self, base_id: str, table_name: str, offset: Optional[str] = None, **options):
+        """
+        One page of records and the cursor of the next page ("" on the last page), offset is a cursor returned by a
+        previous call. Once a cursor is followed the page after it is prefetched in the background, see PageCursors.
+        """
+        table = self.table(base_id=base_id, table_name=table_name)
 
-        table_url = table.url  # .get_table_url(base_id, table_name)
-        if isinstance(offset, str) and str.strip(offset) != "":
-            params.update({"offset": str.strip(offset)})
+        if isinstance(offset, str):
+            offset = str.strip(offset)
 
-        data = table.api.request("get", table_url, params=params)
-        records = data.get("records", [])
-        next_offset = data.get("offset", "")
+        async def fetch(airtable_offset: Optional[str]):
+            data = await self.list_records(table.url, offset=airtable_offset, **options)
+            return data.get("records", []), data.get("offset")
 
-        return records, next_offset
+        key = (base_id, repr(sorted(options.items())))
+        return await self.cursors.page(table_name, key, offset or None, fetch)
@@ -18,3 +18,16 @@ FIELD_MAPPING_TABLE_NAME = "tblRcHWEmqiPH8BlJ"  # "Field Mapping"
 SSJ_TYPEFORM_START_A_SCHOOL_RESPONSES_TABLE_NAME = "tblnfrO3xEGQq94Em"  # "SSJ Typeforms: Start a School"
 SSJ_FILLOUT_GET_INVOLVED_RESPONSES_TABLE_NAME = "tblvgyMdMcidh8k6u"  # "SSJ Fillout Form: Get Involved"
 NEWSLETTERS_TABLE_NAME = "tblq6HIpOolt1sd6L"  # "Mailing lists"
+
+# Tables mirrored by the read replica when AIRTABLE_REPLICA_ENABLED is set
+REPLICATED_TABLE_NAMES = [
+    HUBS_TABLE_NAME,
+    SCHOOLS_TABLE_NAME,
+    EDUCATORS_TABLE_NAME,
+    PARTNERS_TABLE_NAME,
+    GUIDES_SCHOOLS_TABLE_NAME,
+    EDUCATORS_SCHOOLS_TABLE_NAME,
+    MONTESSORI_CERTIFICATIONS_TABLE_NAME,
+    LANGUAGES_TABLE_NAME,
+    NEWSLETTERS_TABLE_NAME,
+]
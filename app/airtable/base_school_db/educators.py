@@ -10,6 +10,7 @@ from . import (
 )
 from app.airtable.attachment import AirtableAttachment
 from app.airtable.base_model import BaseModel
+from app.airtable.loader import RelationshipLoader, batch_load_relationships
 from app.airtable.response import AirtableResponse
 from app.airtable.validators import get_first_or_default_none, get_first_or_default_dict
 
@@ -144,137 +145,73 @@ class AirtableEducatorFields(CreateAirtableEducatorFields):
     @field_validator("all_emails", mode="before")
     @classmethod
     def split_all_emails(cls, v):
-        return v.split(",") if v is not None else None
+        return v.split(",") if isinstance(v, str) else v
 
     # noinspection PyMethodParameters
     @field_validator("other_personal_emails", mode="before")
     @classmethod
     def split_other_personal_emails(cls, v):
-        return v.split(",") if v is not None else None
+        return v.split(",") if isinstance(v, str) else v
 
     # noinspection PyMethodParameters
     @field_validator("lgbtqia_identifying", mode="before")
     @classmethod
     def normalize_lgbtqia(cls, v):
-        if v == "TRUE":
+        if isinstance(v, bool):
+            return v
+        elif v == "TRUE":
             return True
         elif v == "FALSE":
             return False
         else:
             return None
 
-    def load_educators_schools_relationship(self):
+    def queue_relationships(self, loader: RelationshipLoader):
         from ..client import AirtableClient
 
         airtable_client = AirtableClient()
 
-        _ids = []
-        _records = []
-
-        if self.educators_schools is None:
-            return _records
-
-        for id_or_record in self.educators_schools:
-            if isinstance(id_or_record, educators_schools_models.AirtableEducatorsSchoolsResponse):
-                _records.append(id_or_record)
-            elif isinstance(id_or_record, str):
-                _ids.append(id_or_record)
-
-        list_airtable_guides_schools = airtable_client.list_educator_schools_by_ids(educator_school_ids=_ids)
-        _records += list_airtable_guides_schools.root
-
-        self.educators_schools = _records
-        return _records
-
-    def load_montessori_certifications_relationship(self):
-        from ..client import AirtableClient
-
-        airtable_client = AirtableClient()
-
-        _ids = []
-        _records = []
-
-        if self.montessori_certifications is None:
-            return _records
-
-        for id_or_record in self.montessori_certifications:
-            if isinstance(
-                id_or_record, airtable_montessori_certifications_models.AirtableMontessoriCertificationResponse
-            ):
-                _records.append(id_or_record)
-            elif isinstance(id_or_record, str):
-                _ids.append(id_or_record)
-
-        list_airtable_montessori_certifications = airtable_client.list_montessori_certifications_by_ids(
-            montessori_certification_ids=_ids
+        loader.queue("educators_schools", self.educators_schools, airtable_client.list_educator_schools_by_ids)
+        loader.queue(
+            "montessori_certifications",
+            self.montessori_certifications,
+            airtable_client.list_montessori_certifications_by_ids,
         )
-        _records += list_airtable_montessori_certifications.root
+        loader.queue("languages", self.languages, airtable_client.list_languages_by_ids)
+        loader.queue("newsletters", self.newsletters, airtable_client.list_newsletters_by_ids)
 
-        return _records
+    def resolve_relationships(self, loader: RelationshipLoader):
+        self.educators_schools = loader.resolve("educators_schools", self.educators_schools)
+        self.montessori_certifications = loader.resolve("montessori_certifications", self.montessori_certifications)
+        self.languages = loader.resolve("languages", self.languages)
+        self.newsletters = loader.resolve("newsletters", self.newsletters)
 
-    def load_languages_relationship(self):
-        from ..client import AirtableClient
+    async def load_relationships(self):
+        await batch_load_relationships(self)
 
-        airtable_client = AirtableClient()
 
-        _ids = []
-        _records = []
+class AirtableEducatorResponse(AirtableResponse):
+    fields: AirtableEducatorFields
 
-        if self.languages is None:
-            return _records
+    async def load_relationships(self):
+        await self.fields.load_relationships()
 
-        for id_or_record in self.languages:
-            if isinstance(id_or_record, airtable_languages_models.AirtableLanguageResponse):
-                _records.append(id_or_record)
-            elif isinstance(id_or_record, str):
-                _ids.append(id_or_record)
 
-        list_language_certifications = airtable_client.list_languages_by_ids(language_ids=_ids)
-        _records += list_language_certifications.root
+class ListAirtableEducatorResponse(RootModel):
+    root: list[AirtableEducatorResponse]
 
-        self.languages = _records
-        return _records
+    async def load_relationships(self):
+        await batch_load_relationships(*[r.fields for r in self.root])
 
-    def load_newsletters_relationship(self):
+    async def load_newsletters(self):
+        """Load only newsletters, the API model's newsletter flags read their slugs even without relationships"""
         from ..client import AirtableClient
 
-        airtable_client = AirtableClient()
-
-        _ids = []
-        _records = []
-
-        if self.newsletters is None:
-            return _records
-
-        for id_or_record in self.newsletters:
-            if isinstance(id_or_record, airtable_newsletters_models.AirtableNewsletterResponse):
-                _records.append(id_or_record)
-            elif isinstance(id_or_record, str):
-                _ids.append(id_or_record)
-
-        list_airtable_newsletters = airtable_client.list_newsletters_by_ids(newsletter_ids=_ids)
-        _records += list_airtable_newsletters.root
-
-        self.newsletters = _records
-        return _records
-
-    def load_relationships(self):
-        self.load_educators_schools_relationship()
-        self.load_montessori_certifications_relationship()
-        self.load_languages_relationship()
-        self.load_newsletters_relationship()
-
-
-class AirtableEducatorResponse(AirtableResponse):
-    fields: AirtableEducatorFields
-
-    def load_relationships(self):
-        self.fields.load_relationships()
-
+        loader = RelationshipLoader()
+        for r in self.root:
+            loader.queue("newsletters", r.fields.newsletters, AirtableClient().list_newsletters_by_ids)
 
-class ListAirtableEducatorResponse(RootModel):
-    root: list[AirtableEducatorResponse]
+        await loader.load()
 
-    def load_relationships(self):
         for r in self.root:
-            r.load_relationships()
+            r.fields.newsletters = loader.resolve("newsletters", r.fields.newsletters)
@@ -1,3 +1,4 @@
+import functools
 from datetime import date
 from typing import Optional, Union
 
@@ -7,6 +8,7 @@ from pydantic import ConfigDict, Field, field_validator, RootModel
 from . import educators as educators_models
 from . import schools as schools_models
 from app.airtable.base_model import BaseModel
+from app.airtable.loader import RelationshipLoader, batch_load_relationships
 from app.airtable.response import AirtableResponse
 from app.airtable.validators import get_first_or_default_none
 
@@ -39,65 +41,35 @@ class AirtableEducatorsSchoolsFields(CreateUpdateAirtableEducatorsSchoolsFields)
 
     # _get_first_or_default_none = validator("educator", "school", pre=True, allow_reuse=True)(get_first_or_default_none)
 
-    def load_educator_relationship(self):
+    def queue_relationships(self, loader: RelationshipLoader):
         from ..client import AirtableClient
 
         airtable_client = AirtableClient()
 
-        if self.educator is None:
-            return None
+        loader.queue(
+            "educator",
+            self.educator,
+            functools.partial(airtable_client.list_educators_by_ids, load_relationships=False),
+        )
+        loader.queue("school", self.school, airtable_client.list_schools_by_ids)
 
-        _record = None
-        _id = None
-        if isinstance(self.educator, educators_models.AirtableEducatorResponse):
-            _record = self.educator
-        elif isinstance(self.educator, str):
-            _id = self.educator
+    def resolve_relationships(self, loader: RelationshipLoader):
+        self.educator = loader.resolve_one("educator", self.educator)
+        self.school = loader.resolve_one("school", self.school)
 
-        if _record is None:
-            airtable_educator = airtable_client.get_educator_by_id(educator_id=_id, load_relationships=False)
-            _record = airtable_educator
-
-        self.educator = _record
-        return _record
-
-    def load_school_relationship(self):
-        from ..client import AirtableClient
-
-        airtable_client = AirtableClient()
-
-        if self.school is None:
-            return None
-
-        _record = None
-        _id = None
-        if isinstance(self.school, schools_models.AirtableSchoolResponse):
-            _record = self.school
-        elif isinstance(self.school, str):
-            _id = self.school
-
-        if _record is None:
-            airtable_school = airtable_client.get_school_by_id(school_id=_id)
-            _record = airtable_school
-
-        self.school = _record
-        return _record
-
-    def load_relationships(self):
-        self.load_educator_relationship()
-        self.load_school_relationship()
+    async def load_relationships(self):
+        await batch_load_relationships(self)
 
 
 class AirtableEducatorsSchoolsResponse(AirtableResponse):
     fields: AirtableEducatorsSchoolsFields
 
-    def load_relationships(self):
-        self.fields.load_relationships()
+    async def load_relationships(self):
+        await self.fields.load_relationships()
 
 
 class ListAirtableEducatorsSchoolsResponse(RootModel):
     root: list[AirtableEducatorsSchoolsResponse]
 
-    def load_relationships(self):
-        for r in self.root:
-            r.load_relationships()
+    async def load_relationships(self):
+        await batch_load_relationships(*[r.fields for r in self.root])
@@ -39,5 +39,6 @@ class ListAirtableFieldCategoriesResponse(ListAirtableResponse):
     root: list[AirtableFieldCategoriesResponse]
 
     def get_records_for_field_category_ids(self, field_category_ids) -> "ListAirtableFieldCategoriesResponse":
+        field_category_ids = set(field_category_ids or [])
         category_match = list(filter(lambda c: c.id in field_category_ids, self.root))
         return ListAirtableFieldCategoriesResponse(root=category_match)
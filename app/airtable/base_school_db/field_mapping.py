@@ -1,9 +1,13 @@
-from typing import Optional, Union
+from typing import Hashable, Optional, Union
 
 from pydantic import Field, field_validator
 
 from app.airtable.base_model import BaseModel
-from app.airtable.base_school_db.field_categories import FieldCategoryType
+from app.airtable.base_school_db.field_categories import (
+    AirtableFieldCategoriesResponse,
+    FieldCategoryType,
+    ListAirtableFieldCategoriesResponse,
+)
 from app.airtable.response import AirtableResponse, ListAirtableResponse
 from app.airtable.validators import get_first_or_default_none
 
@@ -45,3 +49,116 @@ class ListAirtableFieldMappingResponse(ListAirtableResponse):
             return mapping_match[0]
 
         return None
+
+
+def normalize_mapping_value(value: str) -> str:
+    return value.strip().lower()
+
+
+class FieldMappingIndex:
+    """
+    Field mappings compiled for lookup: each mapping's categories are resolved once, keyed by
+    (normalized field category type, normalized response), so mapping a response is a dictionary lookup
+
+    Built from a ListAirtableFieldMappingResponse/ListAirtableFieldCategoriesResponse pair, rebuild it when either
+    is refreshed
+    """
+
+    def __init__(
+        self,
+        field_mappings: ListAirtableFieldMappingResponse,
+        field_categories: ListAirtableFieldCategoriesResponse,
+    ):
+        self.field_mappings = field_mappings
+        self.field_categories = field_categories
+
+        # Category ID -> (position in field_categories, category), matches keep the categories table's order
+        self.categories_by_id: dict[str, tuple[int, AirtableFieldCategoriesResponse]] = {
+            c.id: (position, c) for position, c in enumerate(field_categories.root)
+        }
+
+        self.mappings: dict[tuple[str, str], tuple[AirtableFieldMappingResponse, list]] = {}
+        for mapping in field_mappings.root:
+            if mapping.fields.field_category_type is None or mapping.fields.response is None:
+                continue
+
+            key = (
+                normalize_mapping_value(mapping.fields.field_category_type),
+                normalize_mapping_value(mapping.fields.response),
+            )
+            # The first mapping for a response wins, as map_response_value's linear scan did
+            if key not in self.mappings:
+                self.mappings[key] = (mapping, self.get_records_for_field_category_ids(mapping.fields.field_categories))
+
+    def get_records_for_field_category_ids(self, field_category_ids) -> list[AirtableFieldCategoriesResponse]:
+        matches = [
+            self.categories_by_id[c_id] for c_id in set(field_category_ids or []) if c_id in self.categories_by_id
+        ]
+        return [category for _, category in sorted(matches, key=lambda m: m[0])]
+
+    def map_response_value(
+        self, field_category_type: FieldCategoryType, response_value
+    ) -> Optional[AirtableFieldMappingResponse]:
+        if response_value is None:
+            return None
+
+        match = self.mappings.get(
+            (normalize_mapping_value(field_category_type), normalize_mapping_value(response_value))
+        )
+        return match[0] if match is not None else None
+
+    def map_response_to_field_category_values(
+        self, field_category_type: FieldCategoryType, response_value: Union[str, list[str]]
+    ) -> list[dict]:
+        """
+        Categories a form response maps to, see AirtableClient.map_response_to_field_category_values. List responses
+        are mapped value by value.
+        """
+        if response_value is None:
+            return []
+
+        if isinstance(response_value, list):
+            response_mappings = []
+            for v in response_value:
+                response_mappings.extend(self.map_response_to_field_category_values(field_category_type, v))
+            return response_mappings
+
+        field_category_type = normalize_mapping_value(field_category_type)
+
+        all_matches = []
+        match = self.mappings.get((field_category_type, normalize_mapping_value(response_value)))
+        if match is None:
+            # Append a match with a lookup_value that equals the mapped_value
+            all_matches.append(
+                {
+                    "lookup_value": response_value,
+                    "is_custom_value": True,
+                    "is_non_specific_category": False,
+                    "mapped_value": response_value,
+                }
+            )
+
+            # Without a match, fall back to the field_category_type's "Other" category if one exists
+            match = self.mappings.get((field_category_type, "other"))
+
+        if match is not None:
+            for category_match in match[1]:
+                all_matches.append(
+                    {
+                        "lookup_value": response_value,
+                        "is_custom_value": False,
+                        "is_non_specific_category": category_match.fields.non_specific_category,
+                        "mapped_value": category_match.fields.value,
+                    }
+                )
+
+        return all_matches
+
+    def map_responses_to_field_category_values(
+        self, responses: dict[Hashable, tuple[FieldCategoryType, Union[str, list[str], None]]]
+    ) -> dict[Hashable, list[dict]]:
+        """Map a whole form's responses in one pass, responses maps any key to (field category type, response)"""
+        return {
+            key: self.map_response_to_field_category_values(field_category_type, response_value)
+            for key, (field_category_type, response_value) in responses.items()
+        }
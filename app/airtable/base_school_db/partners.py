@@ -3,6 +3,7 @@ from typing import Optional, Union
 from pydantic import Field, RootModel
 
 from app.airtable.base_model import BaseModel
+from app.airtable.loader import RelationshipLoader, batch_load_relationships
 from app.airtable.base_school_db import guides_schools as airtable_guides_schools_models
 from app.airtable.response import AirtableResponse
 
@@ -21,40 +22,29 @@ class AirtablePartnerFields(BaseModel):
     ] = Field(None, alias="Guides x Schools")
     educators_partner_guiding: Optional[list[str]] = Field(None, alias="TLs")
 
-    def load_schools_guides_relationship(self):
+    def queue_relationships(self, loader: RelationshipLoader):
         from ..client import AirtableClient
 
         airtable_client = AirtableClient()
 
-        _ids = []
-        _records = []
-        if self.schools_partner_guiding is not None:
-            for id_or_record in self.schools_partner_guiding:
-                if isinstance(id_or_record, airtable_guides_schools_models.AirtableGuidesSchoolsResponse):
-                    _records.append(id_or_record)
-                elif isinstance(id_or_record, str):
-                    _ids.append(id_or_record)
+        loader.queue("schools_partner_guiding", self.schools_partner_guiding, airtable_client.list_guide_schools_by_ids)
 
-        list_airtable_guides_schools = airtable_client.list_guide_schools_by_ids(guide_school_ids=_ids)
-        _records += list_airtable_guides_schools.root
+    def resolve_relationships(self, loader: RelationshipLoader):
+        self.schools_partner_guiding = loader.resolve("schools_partner_guiding", self.schools_partner_guiding)
 
-        self.schools_partner_guiding = _records
-        return _records
-
-    def load_relationships(self):
-        self.load_schools_guides_relationship()
+    async def load_relationships(self):
+        await batch_load_relationships(self)
 
 
 class AirtablePartnerResponse(AirtableResponse):
     fields: AirtablePartnerFields
 
-    def load_relationships(self):
-        self.fields.load_relationships()
+    async def load_relationships(self):
+        await self.fields.load_relationships()
 
 
 class ListAirtablePartnerResponse(RootModel):
     root: list[AirtablePartnerResponse]
 
-    def load_relationships(self):
-        for r in self.root:
-            r.load_relationships()
+    async def load_relationships(self):
+        await batch_load_relationships(*[r.fields for r in self.root])
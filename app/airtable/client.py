@@ -1,9 +1,22 @@
-from cachetools import cached, TTLCache
-from typing import Generator
+import asyncio
+
+from cachetools import TTLCache
+from typing import AsyncIterator, Generator, Hashable
 
 from .base_map_by_geographic_area.auto_response_email_template import AirtableAutoResponseEmailTemplateResponse
+from ..cache import (
+    cached,
+    get_shared_backend,
+    invalidate,
+    on_invalidate,
+    record_tag,
+    records_tags,
+    shared_cache_key,
+    table_tag,
+)
 from ..utils.singleton import Singleton
 from .api import Api
+from .replica import Replica, ReplicaTable
 from . import formulas
 from .base_school_db import *
 from .base_map_by_geographic_area import (
@@ -16,24 +29,152 @@ from .base_map_by_geographic_area import (
 
 
 class AirtableClient(metaclass=Singleton):
+    # Partner ID translations are kept this long in the shared cache backend, record IDs never change but a
+    # partner can be deleted and synced again under a new ID
+    PARTNER_ID_TRANSLATION_TTL = 24 * 60 * 60
+
     def __init__(self, access_token=const.AIRTABLE_ACCESS_TOKEN):
-        self.client_api = Api(access_token)
+        self.client_api = Api(access_token, rate_limit=const.AIRTABLE_RATE_LIMIT)
+        on_invalidate(self._evict_table_pages)
+
+        self._field_mapping_index: Optional[FieldMappingIndex] = None
+        # Partner "Synced Record ID" (the partner's record ID in bases the Partners table is synced into) -> record
+        # ID in this base, only used without a shared cache backend (CACHE_BACKEND "memory")
+        self._partner_ids_by_synced_record_id: dict[str, str] = {}
+
+        self.replica = None
+        if const.AIRTABLE_REPLICA_ENABLED:
+            self.replica = Replica(
+                self.client_api,
+                base_id=BASE_ID,
+                table_names=REPLICATED_TABLE_NAMES,
+                refresh_interval=const.AIRTABLE_REPLICA_REFRESH_INTERVAL,
+                full_sync_interval=const.AIRTABLE_REPLICA_FULL_SYNC_INTERVAL,
+            )
 
-    @cached(cache=TTLCache(maxsize=32, ttl=600))
-    def list_hubs(self) -> ListAirtableHubResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=HUBS_TABLE_NAME).all()
+    async def aclose(self):
+        await self.client_api.aclose()
+
+    def _evict_table_pages(self, tag):
+        """Pagination cursors cache pages outside cached(), a table's pages go when its table_tag is invalidated"""
+        kind, table_name = tag
+        if kind == "table":
+            self.client_api.cursors.evict(table_name)
+
+    def warm_replica(self):
+        """Start syncing the read replica in the background, if it's enabled"""
+        if self.replica is not None:
+            self.replica.warm()
+
+    async def _replica_table(self, table_name) -> Optional[ReplicaTable]:
+        if self.replica is None:
+            return None
+
+        return await self.replica.table(table_name)
+
+    def _put_replica_record(self, table_name, raw: dict):
+        if self.replica is not None:
+            self.replica.put(table_name, raw)
+
+    async def _invalidate_educator(self, educator_id=None, partner_ids=None):
+        """Evict cached reads an educator write can change, including partners' educator lists it's newly linked to"""
+        tags = [table_tag(EDUCATORS_TABLE_NAME), *[record_tag("partner", p_id) for p_id in partner_ids or []]]
+        if educator_id is not None:
+            tags.append(record_tag("educator", educator_id))
+
+        await invalidate(*tags)
+
+    async def _invalidate_educator_school(self, educator_school_id, educator_ids, school_ids):
+        """
+        Evict cached reads an educators_schools write can change, links are lists in payloads and single IDs in
+        responses so both are accepted
+        """
+
+        def _flatten(ids):
+            for i in ids:
+                if isinstance(i, list):
+                    yield from i
+                elif isinstance(i, str):
+                    yield i
+
+        await invalidate(
+            table_tag(EDUCATORS_SCHOOLS_TABLE_NAME),
+            record_tag("educator_school", educator_school_id),
+            *[record_tag("educator", e_id) for e_id in set(_flatten(educator_ids))],
+            *[record_tag("school", s_id) for s_id in set(_flatten(school_ids))],
+        )
+
+    async def _all_records(self, table_name, fields=None) -> list[dict]:
+        replica_table = await self._replica_table(table_name)
+        if replica_table is not None:
+            return list(replica_table.records.values())
+
+        return await self.client_api.table(base_id=BASE_ID, table_name=table_name).all(fields=fields)
+
+    async def _get_record(self, table_name, record_id) -> dict:
+        replica_table = await self._replica_table(table_name)
+        if replica_table is not None:
+            raw = replica_table.get(record_id)
+            if raw is not None:
+                return raw
+
+        # Misses go to Airtable so unknown IDs still surface as a 404 HTTPStatusError
+        return await self.client_api.table(base_id=BASE_ID, table_name=table_name).get(record_id=record_id)
+
+    async def _list_records_by_ids(self, table_name, record_ids, fields=None) -> list[dict]:
+        replica_table = await self._replica_table(table_name)
+        if replica_table is not None:
+            return replica_table.get_many(record_ids)
+
+        return await self.client_api.table(base_id=BASE_ID, table_name=table_name).get_many(record_ids, fields=fields)
+
+    async def _find_records(self, table_name, filters: dict, fields=None) -> list[dict]:
+        """Records where every filter field INCLUDEs its value, a list of values matches any of them"""
+        replica_table = await self._replica_table(table_name)
+        if replica_table is not None:
+            return replica_table.find(filters)
+
+        match_formulas = []
+        for field, value in filters.items():
+            if isinstance(value, list):
+                sub_match_formulas = []
+                for v in value:
+                    sub_match_formulas.append(formulas.INCLUDE(formulas.STR_VALUE(v), formulas.FIELD(field)))
+
+                match_formulas.append(formulas.OR(*sub_match_formulas))
+            else:
+                match_formulas.append(formulas.INCLUDE(formulas.STR_VALUE(value), formulas.FIELD(field)))
+
+        formula = formulas.AND(*match_formulas)
+        return await self.client_api.table(base_id=BASE_ID, table_name=table_name).all(formula=formula, fields=fields)
+
+    async def _find_first_record(self, table_name, filters: dict, fields=None) -> Optional[dict]:
+        replica_table = await self._replica_table(table_name)
+        if replica_table is not None:
+            return next(iter(replica_table.find(filters)), None)
+
+        match_formulas = []
+        for field, value in filters.items():
+            match_formulas.append(formulas.INCLUDE(formulas.STR_VALUE(value), formulas.FIELD(field)))
+
+        formula = formulas.AND(*match_formulas)
+        return await self.client_api.table(base_id=BASE_ID, table_name=table_name).first(formula=formula, fields=fields)
+
+    @cached(cache=TTLCache(maxsize=32, ttl=3600), refresh_after=600)
+    async def list_hubs(self) -> ListAirtableHubResponse:
+        raw = await self._all_records(HUBS_TABLE_NAME, fields=AirtableHubResponse.projection())
         return ListAirtableHubResponse.model_validate(raw)
 
     @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_hub_by_id(self, hub_id) -> AirtableHubResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=HUBS_TABLE_NAME).get(record_id=hub_id)
+    async def get_hub_by_id(self, hub_id) -> AirtableHubResponse:
+        raw = await self._get_record(HUBS_TABLE_NAME, hub_id)
         return AirtableHubResponse.model_validate(raw)
 
     @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_hub_by_school_id(self, school_id) -> Optional[AirtableHubResponse]:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(school_id), formulas.FIELD("School Record IDs"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=HUBS_TABLE_NAME).all(formula=formula)
+    async def get_hub_by_school_id(self, school_id) -> Optional[AirtableHubResponse]:
+        raw = await self._find_records(
+            HUBS_TABLE_NAME, {"School Record IDs": school_id}, fields=AirtableHubResponse.projection()
+        )
 
         if len(raw) > 0:
             raw_item = raw[0]
@@ -56,10 +197,10 @@ class AirtableClient(metaclass=Singleton):
     #     return AirtableHubResponse.model_validate(raw_item)
 
     @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_hubs_by_entrepreneur_id(self, partner_id) -> ListAirtableHubResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(partner_id), formulas.FIELD("Regional Entrepreneur Record ID"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=HUBS_TABLE_NAME).all(formula=formula)
+    async def get_hubs_by_entrepreneur_id(self, partner_id) -> ListAirtableHubResponse:
+        raw = await self._find_records(
+            HUBS_TABLE_NAME, {"Regional Entrepreneur Record ID": partner_id}, fields=AirtableHubResponse.projection()
+        )
         return ListAirtableHubResponse.model_validate(raw)
 
     # @cached(cache=TTLCache(maxsize=32, ttl=600))
@@ -99,35 +240,51 @@ class AirtableClient(metaclass=Singleton):
     #     return ListAirtablePodResponse.model_validate(raw)
 
     @cached(cache=TTLCache(maxsize=32, ttl=600))
-    def list_schools(self, page_size=100, offset=None) -> (ListAirtableSchoolResponse, str):
-        raw, res_offset = self.client_api.paginate(
-            BASE_ID, table_name=SCHOOLS_TABLE_NAME, offset=offset, page_size=page_size
+    async def list_schools(self, page_size=100, offset=None) -> (ListAirtableSchoolResponse, str):
+        raw, res_offset = await self.client_api.paginate(
+            BASE_ID,
+            table_name=SCHOOLS_TABLE_NAME,
+            offset=offset,
+            page_size=page_size,
+            fields=AirtableSchoolResponse.projection(),
         )
         return ListAirtableSchoolResponse.model_validate(raw), res_offset
 
-    def find_schools(self, filters: dict) -> ListAirtableSchoolResponse:
-        match_formulas = []
-        for field, value in filters.items():
-            match_formulas.append(formulas.INCLUDE(formulas.STR_VALUE(value), formulas.FIELD(field)))
+    async def iterate_schools(self, page_size=100) -> AsyncIterator[ListAirtableSchoolResponse]:
+        """Every school, one Airtable page at a time"""
+        pages = self.client_api.table(base_id=BASE_ID, table_name=SCHOOLS_TABLE_NAME).iterate(
+            page_size=page_size, fields=AirtableSchoolResponse.projection()
+        )
+        async for raw in pages:
+            yield ListAirtableSchoolResponse.model_validate(raw)
 
-        formula = formulas.AND(*match_formulas)
-        raw = self.client_api.table(base_id=BASE_ID, table_name=SCHOOLS_TABLE_NAME).all(formula=formula)
+    async def find_schools(self, filters: dict) -> ListAirtableSchoolResponse:
+        raw = await self._find_records(SCHOOLS_TABLE_NAME, filters, fields=AirtableSchoolResponse.projection())
 
         if len(raw) == 0:
             return ListAirtableSchoolResponse()
 
         return ListAirtableSchoolResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_school_by_id(self, school_id) -> AirtableSchoolResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=SCHOOLS_TABLE_NAME).get(record_id=school_id)
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, school_id, **_: [record_tag("school", school_id)],
+    )
+    async def get_school_by_id(self, school_id) -> AirtableSchoolResponse:
+        raw = await self._get_record(SCHOOLS_TABLE_NAME, school_id)
         return AirtableSchoolResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=32, ttl=600))
-    def get_schools_by_hub_id(self, hub_id) -> ListAirtableSchoolResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(hub_id), formulas.FIELD("Hub Record ID"))
+    async def list_schools_by_ids(self, school_ids) -> ListAirtableSchoolResponse:
+        raw = await self._list_records_by_ids(
+            SCHOOLS_TABLE_NAME, school_ids, fields=AirtableSchoolResponse.projection()
+        )
+        return ListAirtableSchoolResponse.model_validate(raw)
 
-        raw = self.client_api.table(base_id=BASE_ID, table_name=SCHOOLS_TABLE_NAME).all(formula=formula)
+    @cached(cache=TTLCache(maxsize=32, ttl=600))
+    async def get_schools_by_hub_id(self, hub_id) -> ListAirtableSchoolResponse:
+        raw = await self._find_records(
+            SCHOOLS_TABLE_NAME, {"Hub Record ID": hub_id}, fields=AirtableSchoolResponse.projection()
+        )
         return ListAirtableSchoolResponse.model_validate(raw)
 
     # @cached(cache=TTLCache(maxsize=32, ttl=600))
@@ -137,79 +294,147 @@ class AirtableClient(metaclass=Singleton):
     #     raw = self.client_api.table(base_id=BASE_ID, table_name=SCHOOLS_TABLE_NAME).all(formula=formula)
     #     return ListAirtableSchoolResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_schools_by_educator_id(self, educator_id) -> ListAirtableSchoolResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(educator_id), formulas.FIELD("All Educator Record IDs"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=SCHOOLS_TABLE_NAME).all(formula=formula)
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, educator_id, **_: [
+            record_tag("educator", educator_id),
+            *records_tags("school", response),
+        ],
+    )
+    async def get_schools_by_educator_id(self, educator_id) -> ListAirtableSchoolResponse:
+        raw = await self._find_records(
+            SCHOOLS_TABLE_NAME, {"All Educator Record IDs": educator_id}, fields=AirtableSchoolResponse.projection()
+        )
         return ListAirtableSchoolResponse.model_validate(raw)
 
     @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_schools_by_guide_id(self, partner_id) -> ListAirtableSchoolResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(partner_id), formulas.FIELD("Guide Record IDs"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=SCHOOLS_TABLE_NAME).all(formula=formula)
+    async def get_schools_by_guide_id(self, partner_id) -> ListAirtableSchoolResponse:
+        raw = await self._find_records(
+            SCHOOLS_TABLE_NAME, {"Guide Record IDs": partner_id}, fields=AirtableSchoolResponse.projection()
+        )
         return ListAirtableSchoolResponse.model_validate(raw)
 
     @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_guide_school_by_id(self, guide_school_id) -> AirtableGuidesSchoolsResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=GUIDES_SCHOOLS_TABLE_NAME).get(
-            record_id=guide_school_id
-        )
+    async def get_guide_school_by_id(self, guide_school_id) -> AirtableGuidesSchoolsResponse:
+        raw = await self._get_record(GUIDES_SCHOOLS_TABLE_NAME, guide_school_id)
         return AirtableGuidesSchoolsResponse.model_validate(raw)
 
-    def list_guide_schools_by_ids(self, guide_school_ids=None) -> ListAirtableGuidesSchoolsResponse:
+    async def list_guide_schools_by_ids(self, guide_school_ids=None) -> ListAirtableGuidesSchoolsResponse:
         if guide_school_ids is None:
             guide_school_ids = []
 
-        match_formulas = []
-        for gs_id in guide_school_ids:
-            match_formulas.append(formulas.EQUAL(formulas.STR_VALUE(gs_id), formulas.FIELD("Record ID")))
-
-        formula = formulas.OR(*match_formulas)
-        raw = self.client_api.table(base_id=BASE_ID, table_name=GUIDES_SCHOOLS_TABLE_NAME).all(formula=formula)
+        raw = await self._list_records_by_ids(
+            GUIDES_SCHOOLS_TABLE_NAME, guide_school_ids, fields=AirtableGuidesSchoolsResponse.projection()
+        )
         return ListAirtableGuidesSchoolsResponse.model_validate(raw)
 
     @cached(cache=TTLCache(maxsize=32, ttl=600))
-    def list_partners(self, page_size=100, offset=None, load_relationships=True) -> (ListAirtablePartnerResponse, str):
-        raw, res_offset = self.client_api.paginate(
-            BASE_ID, table_name=PARTNERS_TABLE_NAME, offset=offset, page_size=page_size
+    async def list_partners(
+        self, page_size=100, offset=None, load_relationships=True
+    ) -> (ListAirtablePartnerResponse, str):
+        raw, res_offset = await self.client_api.paginate(
+            BASE_ID,
+            table_name=PARTNERS_TABLE_NAME,
+            offset=offset,
+            page_size=page_size,
+            fields=AirtablePartnerResponse.projection(),
         )
 
         response = ListAirtablePartnerResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response, res_offset
 
     @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_partner_by_id(self, school_id, load_relationships=True) -> AirtablePartnerResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=PARTNERS_TABLE_NAME).get(record_id=school_id)
+    async def get_partner_by_id(self, school_id, load_relationships=True) -> AirtablePartnerResponse:
+        raw = await self._get_record(PARTNERS_TABLE_NAME, school_id)
         response = AirtablePartnerResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    @cached(cache=TTLCache(maxsize=32, ttl=600))
-    def get_partner_by_synced_record_id(self, synced_record_id, load_relationships=True) -> AirtablePartnerResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(synced_record_id), formulas.FIELD("Synced Record ID"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=PARTNERS_TABLE_NAME).first(formula=formula)
+    @cached(cache=TTLCache(maxsize=32, ttl=3600), refresh_after=600)
+    async def get_partner_by_synced_record_id(
+        self, synced_record_id, load_relationships=True
+    ) -> AirtablePartnerResponse:
+        raw = await self._find_first_record(
+            PARTNERS_TABLE_NAME, {"Synced Record ID": synced_record_id}, fields=AirtablePartnerResponse.projection()
+        )
         response = AirtablePartnerResponse.model_validate(raw)
+        await self._put_partner_id_translations({synced_record_id: response.id})
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
-            return response
+        return response
 
-    @cached(cache=TTLCache(maxsize=32, ttl=600))
-    def get_partners_by_hub_id(self, hub_id, load_relationships=True) -> ListAirtablePartnerResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(hub_id), formulas.FIELD("Hub Record ID"))
+    async def _get_partner_id_translations(self, synced_record_ids) -> dict[str, str]:
+        backend = get_shared_backend()
+        if backend is None:
+            return {
+                s_id: self._partner_ids_by_synced_record_id[s_id]
+                for s_id in synced_record_ids
+                if s_id in self._partner_ids_by_synced_record_id
+            }
+
+        synced_record_ids = list(synced_record_ids)
+        values = await asyncio.gather(
+            *[backend.get(shared_cache_key("partner-id-by-synced-record-id", s_id)) for s_id in synced_record_ids]
+        )
+        return {s_id: value.decode("utf-8") for s_id, value in zip(synced_record_ids, values) if value is not None}
+
+    async def _put_partner_id_translations(self, partner_ids_by_synced_record_id: dict[str, str]):
+        backend = get_shared_backend()
+        if backend is None:
+            self._partner_ids_by_synced_record_id.update(partner_ids_by_synced_record_id)
+            return
+
+        await asyncio.gather(
+            *[
+                backend.set(
+                    shared_cache_key("partner-id-by-synced-record-id", s_id),
+                    p_id.encode("utf-8"),
+                    ttl=self.PARTNER_ID_TRANSLATION_TTL,
+                )
+                for s_id, p_id in partner_ids_by_synced_record_id.items()
+            ]
+        )
+
+    async def get_partner_ids_by_synced_record_ids(self, synced_record_ids) -> dict[str, str]:
+        """
+        Translate partner record IDs from bases the Partners table is synced into to this base's record IDs
+
+        Translations are shared between processes through the cache backend, IDs not translated before are looked
+        up together in a single request. IDs matching no partner are left out of the result.
+        """
+        synced_record_ids = set(synced_record_ids)
+        partner_ids_by_synced_record_id = await self._get_partner_id_translations(synced_record_ids)
+
+        missing = [s_id for s_id in synced_record_ids if s_id not in partner_ids_by_synced_record_id]
+        if len(missing) > 0:
+            raw = await self._find_records(
+                PARTNERS_TABLE_NAME, {"Synced Record ID": missing}, fields=["Synced Record ID"]
+            )
+            found = {}
+            for r in raw:
+                synced_record_id = r["fields"].get("Synced Record ID")
+                if synced_record_id in synced_record_ids:
+                    found[synced_record_id] = r["id"]
 
-        raw = self.client_api.table(base_id=BASE_ID, table_name=PARTNERS_TABLE_NAME).all(formula=formula)
+            await self._put_partner_id_translations(found)
+            partner_ids_by_synced_record_id.update(found)
+
+        return partner_ids_by_synced_record_id
+
+    @cached(cache=TTLCache(maxsize=32, ttl=600))
+    async def get_partners_by_hub_id(self, hub_id, load_relationships=True) -> ListAirtablePartnerResponse:
+        raw = await self._find_records(
+            PARTNERS_TABLE_NAME, {"Hub Record ID": hub_id}, fields=AirtablePartnerResponse.projection()
+        )
         response = ListAirtablePartnerResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
@@ -224,102 +449,135 @@ class AirtableClient(metaclass=Singleton):
     #
     #     return response
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_partners_by_educator_id(self, educator_id, load_relationships=True) -> ListAirtablePartnerResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(educator_id), formulas.FIELD("Educator Record IDs"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=PARTNERS_TABLE_NAME).all(formula=formula)
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, educator_id, **_: [record_tag("educator", educator_id)],
+    )
+    async def get_partners_by_educator_id(self, educator_id, load_relationships=True) -> ListAirtablePartnerResponse:
+        raw = await self._find_records(
+            PARTNERS_TABLE_NAME, {"Educator Record IDs": educator_id}, fields=AirtablePartnerResponse.projection()
+        )
         response = ListAirtablePartnerResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
     @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_guides_by_school_id(self, school_id, load_relationships=True) -> ListAirtablePartnerResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(school_id), formulas.FIELD("Guided School Record ID"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=PARTNERS_TABLE_NAME).all(formula=formula)
+    async def get_guides_by_school_id(self, school_id, load_relationships=True) -> ListAirtablePartnerResponse:
+        raw = await self._find_records(
+            PARTNERS_TABLE_NAME, {"Guided School Record ID": school_id}, fields=AirtablePartnerResponse.projection()
+        )
         response = ListAirtablePartnerResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    @cached(cache=TTLCache(maxsize=32, ttl=600))
-    def list_educators(
+    @cached(
+        cache=TTLCache(maxsize=32, ttl=600),
+        tags=lambda result, **_: [table_tag(EDUCATORS_TABLE_NAME)],
+    )
+    async def list_educators(
         self, page_size=100, offset=None, load_relationships=True
     ) -> (ListAirtableEducatorResponse, str):
-        raw, res_offset = self.client_api.paginate(
-            BASE_ID, table_name=EDUCATORS_TABLE_NAME, offset=offset, page_size=page_size
+        raw, res_offset = await self.client_api.paginate(
+            BASE_ID,
+            table_name=EDUCATORS_TABLE_NAME,
+            offset=offset,
+            page_size=page_size,
+            fields=AirtableEducatorResponse.projection(),
         )
         response = ListAirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response, res_offset
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_educator_by_id(self, educator_id, load_relationships=True) -> AirtableEducatorResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).get(record_id=educator_id)
+    async def iterate_educators(
+        self, page_size=100, load_relationships=False
+    ) -> AsyncIterator[ListAirtableEducatorResponse]:
+        """
+        Every educator, one Airtable page at a time, relationships are batch loaded per page. Newsletters are loaded
+        either way since APIEducatorData can't be built from their IDs.
+        """
+        pages = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).iterate(
+            page_size=page_size, fields=AirtableEducatorResponse.projection()
+        )
+        async for raw in pages:
+            response = ListAirtableEducatorResponse.model_validate(raw)
+            if load_relationships:
+                await response.load_relationships()
+            else:
+                await response.load_newsletters()
+            yield response
+
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, educator_id, **_: [record_tag("educator", educator_id)],
+    )
+    async def get_educator_by_id(self, educator_id, load_relationships=True) -> AirtableEducatorResponse:
+        raw = await self._get_record(EDUCATORS_TABLE_NAME, educator_id)
         response = AirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    def find_educators(self, filters: dict, load_relationships=True) -> ListAirtableEducatorResponse:
-        match_formulas = []
-        for field, value in filters.items():
-            if isinstance(value, list):
-                sub_match_formulas = []
-                for v in value:
-                    sub_match_formulas.append(formulas.INCLUDE(formulas.STR_VALUE(v), formulas.FIELD(field)))
+    async def list_educators_by_ids(self, educator_ids, load_relationships=True) -> ListAirtableEducatorResponse:
+        raw = await self._list_records_by_ids(
+            EDUCATORS_TABLE_NAME, educator_ids, fields=AirtableEducatorResponse.projection()
+        )
+        response = ListAirtableEducatorResponse.model_validate(raw)
+        if load_relationships:
+            await response.load_relationships()
 
-                match_formulas.append(formulas.OR(*sub_match_formulas))
-            else:
-                match_formulas.append(formulas.INCLUDE(formulas.STR_VALUE(value), formulas.FIELD(field)))
+        return response
 
-        formula = formulas.AND(*match_formulas)
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).all(formula=formula)
+    async def find_educators(self, filters: dict, load_relationships=True) -> ListAirtableEducatorResponse:
+        raw = await self._find_records(EDUCATORS_TABLE_NAME, filters, fields=AirtableEducatorResponse.projection())
 
         if len(raw) == 0:
             return ListAirtableEducatorResponse(root=[])
 
         response = ListAirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    def create_educator(
+    async def create_educator(
         self, payload: CreateAirtableEducatorFields, load_relationships=True
     ) -> AirtableEducatorResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).create(
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).create(
             fields=payload.dict(by_alias=True)
         )
+        self._put_replica_record(EDUCATORS_TABLE_NAME, raw)
+        await self._invalidate_educator(partner_ids=payload.assigned_partner)
         response = AirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    def update_educator(
+    async def update_educator(
         self, record_id: str, payload: CreateAirtableEducatorFields, load_relationships=True
     ) -> AirtableEducatorResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).update(
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).update(
             record_id=record_id, fields=payload.dict(by_alias=True, exclude_unset=True)
         )
+        self._put_replica_record(EDUCATORS_TABLE_NAME, raw)
+        await self._invalidate_educator(record_id, partner_ids=payload.assigned_partner)
         response = AirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    def add_typeform_start_a_school_response_to_educator(
+    async def add_typeform_start_a_school_response_to_educator(
         self, educator_id, typeform_start_a_school_response_id, load_relationships=True
     ) -> AirtableEducatorResponse:
-        educator = self.get_educator_by_id(educator_id)
+        educator = await self.get_educator_by_id(educator_id)
         start_school_typeforms = educator.fields.ssj_typeforms_start_a_school
 
         if typeform_start_a_school_response_id in start_school_typeforms:
@@ -327,20 +585,22 @@ class AirtableClient(metaclass=Singleton):
 
         start_school_typeforms.append(typeform_start_a_school_response_id)
 
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).update(
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).update(
             record_id=educator_id,
             fields={AirtableEducatorFields.__fields__["ssj_typeforms_start_a_school"].alias: start_school_typeforms},
         )
+        self._put_replica_record(EDUCATORS_TABLE_NAME, raw)
+        await self._invalidate_educator(educator_id)
         response = AirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    def add_fillout_get_involved_response_to_educator(
+    async def add_fillout_get_involved_response_to_educator(
         self, educator_id, fillout_get_involved_response_id, load_relationships=True
     ) -> AirtableEducatorResponse:
-        educator = self.get_educator_by_id(educator_id)
+        educator = await self.get_educator_by_id(educator_id)
         get_involved_fillout_forms = educator.fields.ssj_fillout_forms_get_involved
 
         if fillout_get_involved_response_id in get_involved_fillout_forms:
@@ -348,238 +608,278 @@ class AirtableClient(metaclass=Singleton):
 
         get_involved_fillout_forms.append(fillout_get_involved_response_id)
 
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).update(
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).update(
             record_id=educator_id,
             fields={
                 AirtableEducatorFields.__fields__["ssj_fillout_forms_get_involved"].alias: get_involved_fillout_forms
             },
         )
+        self._put_replica_record(EDUCATORS_TABLE_NAME, raw)
+        await self._invalidate_educator(educator_id)
         response = AirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_educators_by_guide_id(self, partner_id, load_relationships=True) -> ListAirtableEducatorResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(partner_id), formulas.FIELD("Assigned Partner Record ID"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).all(formula=formula)
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, partner_id, **_: [record_tag("partner", partner_id), *records_tags("educator", response)],
+    )
+    async def get_educators_by_guide_id(self, partner_id, load_relationships=True) -> ListAirtableEducatorResponse:
+        raw = await self._find_records(
+            EDUCATORS_TABLE_NAME,
+            {"Assigned Partner Record ID": partner_id},
+            fields=AirtableEducatorResponse.projection(),
+        )
 
         response = ListAirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_primary_contacts_by_school_id(self, school_id, load_relationships=True) -> ListAirtableEducatorResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(school_id), formulas.FIELD("Primary Contact School Record IDs"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).all(formula=formula)
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, school_id, **_: [record_tag("school", school_id), *records_tags("educator", response)],
+    )
+    async def get_primary_contacts_by_school_id(
+        self, school_id, load_relationships=True
+    ) -> ListAirtableEducatorResponse:
+        raw = await self._find_records(
+            EDUCATORS_TABLE_NAME,
+            {"Primary Contact School Record IDs": school_id},
+            fields=AirtableEducatorResponse.projection(),
+        )
         response = ListAirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_all_educators_by_school_id(self, school_id, load_relationships=True) -> ListAirtableEducatorResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(school_id), formulas.FIELD("School Record IDs"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).all(formula=formula)
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, school_id, **_: [record_tag("school", school_id), *records_tags("educator", response)],
+    )
+    async def get_all_educators_by_school_id(self, school_id, load_relationships=True) -> ListAirtableEducatorResponse:
+        raw = await self._find_records(
+            EDUCATORS_TABLE_NAME, {"School Record IDs": school_id}, fields=AirtableEducatorResponse.projection()
+        )
         response = ListAirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_current_educators_by_school_id(self, school_id, load_relationships=True) -> ListAirtableEducatorResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(school_id), formulas.FIELD("Current Educator School Record IDs"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).all(formula=formula)
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, school_id, **_: [record_tag("school", school_id), *records_tags("educator", response)],
+    )
+    async def get_current_educators_by_school_id(
+        self, school_id, load_relationships=True
+    ) -> ListAirtableEducatorResponse:
+        raw = await self._find_records(
+            EDUCATORS_TABLE_NAME,
+            {"Current Educator School Record IDs": school_id},
+            fields=AirtableEducatorResponse.projection(),
+        )
         response = ListAirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_current_tls_by_school_id(self, school_id, load_relationships=True) -> ListAirtableEducatorResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(school_id), formulas.FIELD("Current TL School Records IDs"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).all(formula=formula)
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, school_id, **_: [record_tag("school", school_id), *records_tags("educator", response)],
+    )
+    async def get_current_tls_by_school_id(self, school_id, load_relationships=True) -> ListAirtableEducatorResponse:
+        raw = await self._find_records(
+            EDUCATORS_TABLE_NAME,
+            {"Current TL School Records IDs": school_id},
+            fields=AirtableEducatorResponse.projection(),
+        )
         response = ListAirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_founders_by_school_id(self, school_id, load_relationships=True) -> ListAirtableEducatorResponse:
-        formula = formulas.INCLUDE(formulas.STR_VALUE(school_id), formulas.FIELD("Founder School Records IDs"))
-
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_TABLE_NAME).all(formula=formula)
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, school_id, **_: [record_tag("school", school_id), *records_tags("educator", response)],
+    )
+    async def get_founders_by_school_id(self, school_id, load_relationships=True) -> ListAirtableEducatorResponse:
+        raw = await self._find_records(
+            EDUCATORS_TABLE_NAME,
+            {"Founder School Records IDs": school_id},
+            fields=AirtableEducatorResponse.projection(),
+        )
         response = ListAirtableEducatorResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
 
         return response
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_educator_school_by_id(
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=600),
+        tags=lambda response, educator_school_id, **_: [record_tag("educator_school", educator_school_id)],
+    )
+    async def get_educator_school_by_id(
         self, educator_school_id, load_relationships=True
     ) -> AirtableEducatorsSchoolsResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_SCHOOLS_TABLE_NAME).get(
-            record_id=educator_school_id
-        )
+        raw = await self._get_record(EDUCATORS_SCHOOLS_TABLE_NAME, educator_school_id)
         response = AirtableEducatorsSchoolsResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
         return response
 
-    def create_educator_schools(
+    async def create_educator_schools(
         self, payload: CreateUpdateAirtableEducatorsSchoolsFields
     ) -> AirtableEducatorsSchoolsResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_SCHOOLS_TABLE_NAME).create(
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_SCHOOLS_TABLE_NAME).create(
             fields=payload.dict(by_alias=True)
         )
-        return AirtableEducatorsSchoolsResponse.model_validate(raw)
+        self._put_replica_record(EDUCATORS_SCHOOLS_TABLE_NAME, raw)
+        response = AirtableEducatorsSchoolsResponse.model_validate(raw)
+        await self._invalidate_educator_school(
+            response.id,
+            educator_ids=[payload.educator, response.fields.educator],
+            school_ids=[payload.school, response.fields.school],
+        )
+        return response
 
-    def update_educator_schools(
+    async def update_educator_schools(
         self, record_id: str, payload: CreateUpdateAirtableEducatorsSchoolsFields
     ) -> AirtableEducatorsSchoolsResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_SCHOOLS_TABLE_NAME).update(
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_SCHOOLS_TABLE_NAME).update(
             record_id=record_id,
             fields=payload.dict(by_alias=True),
         )
-        return AirtableEducatorsSchoolsResponse.model_validate(raw)
+        self._put_replica_record(EDUCATORS_SCHOOLS_TABLE_NAME, raw)
+        response = AirtableEducatorsSchoolsResponse.model_validate(raw)
+        await self._invalidate_educator_school(
+            record_id,
+            educator_ids=[payload.educator, response.fields.educator],
+            school_ids=[payload.school, response.fields.school],
+        )
+        return response
 
-    def list_educator_schools_by_ids(
+    async def list_educator_schools_by_ids(
         self, educator_school_ids, load_relationships=True
     ) -> ListAirtableEducatorsSchoolsResponse:
-        match_formulas = []
-        for es_id in educator_school_ids:
-            match_formulas.append(formulas.EQUAL(formulas.STR_VALUE(es_id), formulas.FIELD("Record ID")))
-
-        formula = formulas.OR(*match_formulas)
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_SCHOOLS_TABLE_NAME).all(formula=formula)
+        raw = await self._list_records_by_ids(
+            EDUCATORS_SCHOOLS_TABLE_NAME, educator_school_ids, fields=AirtableEducatorsSchoolsResponse.projection()
+        )
         response = ListAirtableEducatorsSchoolsResponse.model_validate(raw)
         if load_relationships:
-            response.load_relationships()
+            await response.load_relationships()
         return response
 
-    def find_educator_schools(self, filters: dict) -> ListAirtableEducatorsSchoolsResponse:
-        match_formulas = []
-        for field, value in filters.items():
-            match_formulas.append(formulas.INCLUDE(formulas.STR_VALUE(value), formulas.FIELD(field)))
-
-        formula = formulas.AND(*match_formulas)
-        # formula = match_formulas[0]
-        raw = self.client_api.table(base_id=BASE_ID, table_name=EDUCATORS_SCHOOLS_TABLE_NAME).all(formula=formula)
+    async def find_educator_schools(self, filters: dict) -> ListAirtableEducatorsSchoolsResponse:
+        raw = await self._find_records(
+            EDUCATORS_SCHOOLS_TABLE_NAME, filters, fields=AirtableEducatorsSchoolsResponse.projection()
+        )
 
         if len(raw) == 0:
-            return ListAirtableEducatorsSchoolsResponse(roots=[])
+            return ListAirtableEducatorsSchoolsResponse(root=[])
 
         return ListAirtableEducatorsSchoolsResponse.model_validate(raw)
 
     @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_montessori_education_by_id(self, montessori_certification_id) -> AirtableMontessoriCertificationResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=MONTESSORI_CERTIFICATIONS_TABLE_NAME).get(
-            record_id=montessori_certification_id
-        )
-        return AirtableMontessoriCertificationResponse.model_validate(raw)
-
-    def create_montessori_certification(
-        self, payload: CreateAirtableMontessoriCertificationFields
+    async def get_montessori_education_by_id(
+        self, montessori_certification_id
     ) -> AirtableMontessoriCertificationResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=MONTESSORI_CERTIFICATIONS_TABLE_NAME).create(
-            fields=payload.dict(by_alias=True)
-        )
+        raw = await self._get_record(MONTESSORI_CERTIFICATIONS_TABLE_NAME, montessori_certification_id)
         return AirtableMontessoriCertificationResponse.model_validate(raw)
 
-    def list_montessori_certifications_by_ids(
-        self, montessori_certification_ids
+    async def create_montessori_certifications(
+        self, payloads: list[CreateAirtableMontessoriCertificationFields]
     ) -> ListAirtableMontessoriCertificationResponse:
-        match_formulas = []
-        for m_id in montessori_certification_ids:
-            match_formulas.append(formulas.EQUAL(formulas.STR_VALUE(m_id), formulas.FIELD("Record ID")))
+        raw = await self.client_api.table(
+            base_id=BASE_ID, table_name=MONTESSORI_CERTIFICATIONS_TABLE_NAME
+        ).batch_create([payload.dict(by_alias=True) for payload in payloads])
+        for r in raw:
+            self._put_replica_record(MONTESSORI_CERTIFICATIONS_TABLE_NAME, r)
+        return ListAirtableMontessoriCertificationResponse.model_validate(raw)
 
-        formula = formulas.OR(*match_formulas)
-        raw = self.client_api.table(base_id=BASE_ID, table_name=MONTESSORI_CERTIFICATIONS_TABLE_NAME).all(
-            formula=formula
+    async def list_montessori_certifications_by_ids(
+        self, montessori_certification_ids
+    ) -> ListAirtableMontessoriCertificationResponse:
+        raw = await self._list_records_by_ids(
+            MONTESSORI_CERTIFICATIONS_TABLE_NAME,
+            montessori_certification_ids,
+            fields=AirtableMontessoriCertificationResponse.projection(),
         )
         return ListAirtableMontessoriCertificationResponse.model_validate(raw)
 
     @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_language_by_id(self, language_id) -> AirtableLanguageResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=LANGUAGES_TABLE_NAME).get(record_id=language_id)
+    async def get_language_by_id(self, language_id) -> AirtableLanguageResponse:
+        raw = await self._get_record(LANGUAGES_TABLE_NAME, language_id)
         return AirtableLanguageResponse.model_validate(raw)
 
-    def create_language(self, payload: CreateAirtableLanguageFields) -> AirtableLanguageResponse:
-        raw = (self.client_api.table(base_id=BASE_ID, table_name=LANGUAGES_TABLE_NAME)).create(
-            fields=payload.dict(by_alias=True)
+    async def create_languages(self, payloads: list[CreateAirtableLanguageFields]) -> ListAirtableLanguageResponse:
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=LANGUAGES_TABLE_NAME).batch_create(
+            [payload.dict(by_alias=True) for payload in payloads]
         )
-        return AirtableLanguageResponse.model_validate(raw)
-
-    def list_languages_by_ids(self, language_ids) -> ListAirtableLanguageResponse:
-        match_formulas = []
-        for l_id in language_ids:
-            match_formulas.append(formulas.EQUAL(formulas.STR_VALUE(l_id), formulas.FIELD("Record ID")))
+        for r in raw:
+            self._put_replica_record(LANGUAGES_TABLE_NAME, r)
+        return ListAirtableLanguageResponse.model_validate(raw)
 
-        formula = formulas.OR(*match_formulas)
-        raw = self.client_api.table(base_id=BASE_ID, table_name=LANGUAGES_TABLE_NAME).all(formula=formula)
+    async def list_languages_by_ids(self, language_ids) -> ListAirtableLanguageResponse:
+        raw = await self._list_records_by_ids(
+            LANGUAGES_TABLE_NAME, language_ids, fields=AirtableLanguageResponse.projection()
+        )
         return ListAirtableLanguageResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1, ttl=600))
-    def list_geo_areas(self) -> geo_areas_models.ListAirtableGeoAreaResponse:
-        raw = self.client_api.table(
+    @cached(cache=TTLCache(maxsize=1, ttl=3600), refresh_after=600)
+    async def list_geo_areas(self) -> geo_areas_models.ListAirtableGeoAreaResponse:
+        raw = await self.client_api.table(
             base_id=map_by_geographic_area_base.BASE_ID,
             table_name=map_by_geographic_area_base.GEOGRAPHIC_AREAS_TABLE_NAME,
-        ).all()
+        ).all(fields=geo_areas_models.AirtableGeoAreaResponse.projection())
         return geo_areas_models.ListAirtableGeoAreaResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1, ttl=600))
-    def get_geo_area_by_id(self, geo_area_id) -> geo_areas_models.AirtableGeoAreaResponse:
-        raw = self.client_api.table(
+    @cached(cache=TTLCache(maxsize=1, ttl=3600), refresh_after=600)
+    async def get_geo_area_by_id(self, geo_area_id) -> geo_areas_models.AirtableGeoAreaResponse:
+        raw = await self.client_api.table(
             base_id=map_by_geographic_area_base.BASE_ID,
             table_name=map_by_geographic_area_base.GEOGRAPHIC_AREAS_TABLE_NAME,
         ).get(record_id=geo_area_id)
         return geo_areas_models.AirtableGeoAreaResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1, ttl=600))
-    def list_geo_area_contacts(self) -> geo_area_contacts_models.ListAirtableGeoAreaContactResponse:
-        raw = self.client_api.table(
+    @cached(cache=TTLCache(maxsize=1, ttl=3600), refresh_after=600)
+    async def list_geo_area_contacts(self) -> geo_area_contacts_models.ListAirtableGeoAreaContactResponse:
+        raw = await self.client_api.table(
             base_id=map_by_geographic_area_base.BASE_ID, table_name=map_by_geographic_area_base.AREA_CONTACT_TABLE_NAME
-        ).all()
+        ).all(fields=geo_area_contacts_models.AirtableGeoAreaContactResponse.projection())
         return geo_area_contacts_models.ListAirtableGeoAreaContactResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=64, ttl=600))
-    def get_geo_area_contact_by_id(
+    @cached(cache=TTLCache(maxsize=64, ttl=3600), refresh_after=600)
+    async def get_geo_area_contact_by_id(
         self, geo_area_contact_id
     ) -> geo_area_contacts_models.AirtableGeoAreaContactResponse:
-        raw = self.client_api.table(
+        raw = await self.client_api.table(
             base_id=map_by_geographic_area_base.BASE_ID,
             table_name=map_by_geographic_area_base.AREA_CONTACT_TABLE_NAME,
         ).get(record_id=geo_area_contact_id)
         return geo_area_contacts_models.AirtableGeoAreaContactResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1, ttl=600))
-    def list_geo_area_target_communities(
+    @cached(cache=TTLCache(maxsize=1, ttl=3600), refresh_after=600)
+    async def list_geo_area_target_communities(
         self,
     ) -> geo_area_target_communities_models.ListAirtableGeoAreaTargetCommunityResponse:
-        raw = self.client_api.table(
+        raw = await self.client_api.table(
             base_id=map_by_geographic_area_base.BASE_ID,
             table_name=map_by_geographic_area_base.AREA_TARGET_COMMUNITY_TABLE_NAME,
-        ).all()
+        ).all(fields=geo_area_target_communities_models.AirtableGeoAreaTargetCommunityResponse.projection())
         return geo_area_target_communities_models.ListAirtableGeoAreaTargetCommunityResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=64, ttl=600))
-    def get_geo_area_target_community_by_id(
+    @cached(cache=TTLCache(maxsize=64, ttl=3600), refresh_after=600)
+    async def get_geo_area_target_community_by_id(
         self, geo_area_target_community_id
     ) -> geo_area_target_communities_models.AirtableGeoAreaTargetCommunityResponse:
-        raw = self.client_api.table(
+        raw = await self.client_api.table(
             base_id=map_by_geographic_area_base.BASE_ID,
             table_name=map_by_geographic_area_base.AREA_TARGET_COMMUNITY_TABLE_NAME,
         ).get(
@@ -587,40 +887,68 @@ class AirtableClient(metaclass=Singleton):
         )
         return geo_area_target_communities_models.AirtableGeoAreaTargetCommunityResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1, ttl=600))
-    def list_auto_response_email_templates(
+    @cached(cache=TTLCache(maxsize=1, ttl=3600), refresh_after=600)
+    async def list_auto_response_email_templates(
         self,
     ) -> auto_response_email_template_models.ListAirtableAutoResponseEmailTemplateResponse:
-        raw = self.client_api.table(
+        raw = await self.client_api.table(
             base_id=map_by_geographic_area_base.BASE_ID,
             table_name=map_by_geographic_area_base.AUTO_RESPONSE_EMAIL_TEMPLATE,
-        ).all()
+        ).all(fields=auto_response_email_template_models.AirtableAutoResponseEmailTemplateResponse.projection())
         return auto_response_email_template_models.ListAirtableAutoResponseEmailTemplateResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=600))
-    def get_auto_response_email_template_by_id(
+    @cached(cache=TTLCache(maxsize=1024, ttl=3600), refresh_after=600)
+    async def get_auto_response_email_template_by_id(
         self, auto_response_email_template_id
     ) -> auto_response_email_template_models.AirtableAutoResponseEmailTemplateResponse:
-        raw = self.client_api.table(
+        raw = await self.client_api.table(
             base_id=map_by_geographic_area_base.BASE_ID,
             table_name=map_by_geographic_area_base.AUTO_RESPONSE_EMAIL_TEMPLATE,
         ).get(record_id=auto_response_email_template_id)
         return AirtableAutoResponseEmailTemplateResponse.model_validate(raw)
 
-    def create_typeform_start_a_school_response(
+    async def get_auto_response_email_templates_by_ids(
+        self, auto_response_email_template_ids
+    ) -> dict[str, auto_response_email_template_models.AirtableAutoResponseEmailTemplateResponse]:
+        """
+        Templates by ID, served from the cached templates table. Templates created since it was cached are fetched
+        together in one request.
+        """
+        auto_response_email_template_ids = set(auto_response_email_template_ids)
+        if len(auto_response_email_template_ids) == 0:
+            return {}
+
+        templates = {
+            t.id: t
+            for t in (await self.list_auto_response_email_templates()).root
+            if t.id in auto_response_email_template_ids
+        }
+
+        missing = [t_id for t_id in auto_response_email_template_ids if t_id not in templates]
+        if len(missing) > 0:
+            raw = await self.client_api.table(
+                base_id=map_by_geographic_area_base.BASE_ID,
+                table_name=map_by_geographic_area_base.AUTO_RESPONSE_EMAIL_TEMPLATE,
+            ).get_many(missing)
+            for r in raw:
+                templates[r["id"]] = AirtableAutoResponseEmailTemplateResponse.model_validate(r)
+
+        return templates
+
+    async def create_typeform_start_a_school_response(
         self, payload: CreateAirtableSSJTypeformStartASchool
     ) -> AirtableSSJTypeformStartASchoolResponse:
-        raw = self.client_api.table(
+        raw = await self.client_api.table(
             base_id=BASE_ID, table_name=SSJ_TYPEFORM_START_A_SCHOOL_RESPONSES_TABLE_NAME
         ).create(fields=payload.dict(by_alias=True))
         return AirtableSSJTypeformStartASchoolResponse.model_validate(raw)
 
-    def create_fillout_get_involved_response(
+    async def create_fillout_get_involved_response(
         self, payload: CreateAirtableSSJFilloutGetInvolved
     ) -> AirtableSSJFilloutGetInvolvedResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=SSJ_FILLOUT_GET_INVOLVED_RESPONSES_TABLE_NAME).create(
-            fields=payload.dict(by_alias=True), typecast=True
-        )
+        raw = await self.client_api.table(
+            base_id=BASE_ID, table_name=SSJ_FILLOUT_GET_INVOLVED_RESPONSES_TABLE_NAME
+        ).create(fields=payload.dict(by_alias=True), typecast=True)
         return AirtableSSJFilloutGetInvolvedResponse.model_validate(raw)
 
     # 7/15/2022 - Moved away from Contact Info for a more flat structure in the Educator table itself
@@ -632,89 +960,76 @@ class AirtableClient(metaclass=Singleton):
     #     )
     #     return AirtableContactInfoResponse.model_validate(raw)
 
-    def create_socio_economic(
+    async def create_socio_economic(
         self, payload: CreateAirtableSocioEconomicBackgroundFields
     ) -> AirtableSocioEconomicBackgroundResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=SOCIO_ECONOMIC_BACKGROUNDS_TABLE_NAME).create(
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=SOCIO_ECONOMIC_BACKGROUNDS_TABLE_NAME).create(
             fields=payload.dict(by_alias=True)
         )
         return AirtableSocioEconomicBackgroundResponse.model_validate(raw)
 
-    def list_newsletters_by_ids(self, newsletter_ids) -> ListAirtableNewsletterResponse:
-        match_formulas = []
-        for n_id in newsletter_ids:
-            match_formulas.append(formulas.EQUAL(formulas.STR_VALUE(n_id), formulas.FIELD("Record ID")))
-
-        formula = formulas.OR(*match_formulas)
-        raw = self.client_api.table(base_id=BASE_ID, table_name=NEWSLETTERS_TABLE_NAME).all(formula=formula)
+    async def list_newsletters_by_ids(self, newsletter_ids) -> ListAirtableNewsletterResponse:
+        raw = await self._list_records_by_ids(
+            NEWSLETTERS_TABLE_NAME, newsletter_ids, fields=AirtableNewsletterResponse.projection()
+        )
         return ListAirtableNewsletterResponse.model_validate(raw)
 
-    def get_newsletters_by_slug(self, slugs: list[NewsletterSlugs]) -> ListAirtableNewsletterResponse:
+    async def get_newsletters_by_slug(self, slugs: list[NewsletterSlugs]) -> ListAirtableNewsletterResponse:
         match_formulas = []
         for s in slugs:
             match_formulas.append(formulas.EQUAL(formulas.STR_VALUE(s.value), formulas.FIELD("Slug")))
 
         formula = formulas.OR(*match_formulas)
-        raw = self.client_api.table(base_id=BASE_ID, table_name=NEWSLETTERS_TABLE_NAME).all(formula=formula)
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=NEWSLETTERS_TABLE_NAME).all(
+            formula=formula, fields=AirtableNewsletterResponse.projection()
+        )
         return ListAirtableNewsletterResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1, ttl=600))
-    def list_field_categories(self) -> ListAirtableFieldCategoriesResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=FIELD_CATEGORIES_TABLE_NAME).all()
+    @cached(cache=TTLCache(maxsize=1, ttl=3600), refresh_after=600)
+    async def list_field_categories(self) -> ListAirtableFieldCategoriesResponse:
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=FIELD_CATEGORIES_TABLE_NAME).all(
+            fields=AirtableFieldCategoriesResponse.projection()
+        )
         return ListAirtableFieldCategoriesResponse.model_validate(raw)
 
-    @cached(cache=TTLCache(maxsize=1, ttl=600))
-    def list_field_mappings(self) -> ListAirtableFieldMappingResponse:
-        raw = self.client_api.table(base_id=BASE_ID, table_name=FIELD_MAPPING_TABLE_NAME).all()
+    @cached(cache=TTLCache(maxsize=1, ttl=3600), refresh_after=600)
+    async def list_field_mappings(self) -> ListAirtableFieldMappingResponse:
+        raw = await self.client_api.table(base_id=BASE_ID, table_name=FIELD_MAPPING_TABLE_NAME).all(
+            fields=AirtableFieldMappingResponse.projection()
+        )
         return ListAirtableFieldMappingResponse.model_validate(raw)
 
-    def map_response_to_field_category_values(
+    async def field_mapping_index(self) -> FieldMappingIndex:
+        """FieldMappingIndex over the cached field mappings/categories, only rebuilt once either is refreshed"""
+        field_mappings, field_categories = await asyncio.gather(
+            self.list_field_mappings(), self.list_field_categories()
+        )
+
+        index = self._field_mapping_index
+        if (
+            index is None
+            or index.field_mappings is not field_mappings
+            or index.field_categories is not field_categories
+        ):
+            index = FieldMappingIndex(field_mappings, field_categories)
+            self._field_mapping_index = index
+        return index
+
+    async def map_response_to_field_category_values(
         self, field_category_type: FieldCategoryType, response_value: Union[str, list[str]]
-    ) -> (list[str], list[str], Union[str, list[str]]):
+    ) -> list[dict]:
         if response_value is None:
             return []
 
-        field_categories = self.list_field_categories()
-        field_mappings = self.list_field_mappings()
-
-        if isinstance(response_value, list):
-            response_mappings = []
-            for v in response_value:
-                response_mapping = self.map_response_to_field_category_values(field_category_type, v)
-                response_mappings.extend(response_mapping)
-
-            return response_mappings
-
-        all_matches = []
-        mapping = field_mappings.map_response_value(field_category_type, response_value)
-        if mapping is None:
-            # Append a match with a lookup_value that equals the mapped_value
-            all_matches.append(
-                {
-                    "lookup_value": response_value,
-                    "is_custom_value": True,
-                    "is_non_specific_category": False,
-                    "mapped_value": response_value,
-                }
-            )
-
-            # When the mapping is None, or there isn't a match, we try to add an "Other" category if one exists for the particular field_category_type
-            mapping = field_mappings.map_response_value(field_category_type, "Other")
-
-        if mapping is not None:
-            # Convert the mapping record to it's associated categories
-            category_matches = field_categories.get_records_for_field_category_ids(mapping.fields.field_categories)
-            for category_match in category_matches.root:
-                all_matches.append(
-                    {
-                        "lookup_value": response_value,
-                        "is_custom_value": False,
-                        "is_non_specific_category": category_match.fields.non_specific_category,
-                        "mapped_value": category_match.fields.value,
-                    }
-                )
+        return (await self.field_mapping_index()).map_response_to_field_category_values(
+            field_category_type, response_value
+        )
 
-        return all_matches
+    async def map_responses_to_field_category_values(
+        self, responses: dict[Hashable, tuple[FieldCategoryType, Union[str, list[str], None]]]
+    ) -> dict[Hashable, list[dict]]:
+        """Map several form responses at once, responses maps any key to (field category type, response)"""
+        return (await self.field_mapping_index()).map_responses_to_field_category_values(responses)
 
 
 def get_airtable_client_generator() -> Generator:
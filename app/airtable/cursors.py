@@ -0,0 +1,153 @@
+import asyncio
+import base64
+import concurrent.futures
+import threading
+from typing import Awaitable, Callable, Hashable, Optional
+
+from cachetools import TTLCache
+
+from ..log import logger
+
+Page = tuple[list[dict], Optional[str]]
+
+
+class PageCursors:
+    """
+    Server issued pagination cursors with next-page prefetch
+
+    Airtable's offsets differ on every walk through a table, so caching pages by offset never hits. Pages are
+    instead cached under the cursor that was handed out for them: once a client follows a cursor (it's walking the
+    table), serving that page starts fetching the next one in the background under the cursor returned with it, so
+    the client finds its next page already loaded (or in flight). First pages are neither cached nor prefetched
+    from, a client reading only page 1 costs a single request.
+
+    Pages are kept per table and evict() drops a table's pages, writers invalidating table_tag(table) drop them
+    along with the table's other cached reads (see AirtableClient).
+
+    Cursors embed the Airtable offset they stand for, a cursor issued by another process (or already evicted) is
+    still served, only without the prefetched page. Raw Airtable offsets are accepted as well.
+
+    Cursors are only a wrapper around that offset, they expire along with it: once Airtable stops accepting the
+    offset (a few minutes after it was issued) a cursor whose page is no longer cached fails like the raw offset
+    would.
+    """
+
+    PREFIX = "cur_"
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60):
+        # (table name, request key, cursor) -> page, as a future so a request can join its page's prefetch while
+        # it's in flight
+        self.pages: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def encode(cls, airtable_offset: Optional[str]) -> str:
+        if not airtable_offset:
+            return ""
+        return cls.PREFIX + base64.urlsafe_b64encode(airtable_offset.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: Optional[str]) -> Optional[str]:
+        """The Airtable offset a cursor stands for, anything that isn't a cursor is taken to be an Airtable offset"""
+        if not cursor:
+            return None
+        if not cursor.startswith(cls.PREFIX):
+            return cursor
+
+        try:
+            encoded = cursor[len(cls.PREFIX) :]
+            return base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode("utf-8")
+        except ValueError:
+            return cursor
+
+    def _start(
+        self, page_key: tuple[str, Hashable, str], fetch: Callable[[Optional[str]], Awaitable[Page]]
+    ) -> tuple[concurrent.futures.Future, bool]:
+        """
+        Fetch the page page_key's cursor stands for in the background, unless it's already cached or in flight
+
+        Returns the page's future and whether this call started it
+        """
+        cursor = page_key[2]
+        with self._lock:
+            future = self.pages.get(page_key)
+            if future is not None:
+                return future, False
+
+            future = concurrent.futures.Future()
+            self.pages[page_key] = future
+
+        def done(task: asyncio.Task):
+            self._tasks.discard(task)
+            if task.cancelled() or task.exception() is not None:
+                # Not cached, the next request with this cursor fetches the page again
+                with self._lock:
+                    if self.pages.get(page_key) is future:
+                        del self.pages[page_key]
+
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+
+        task = asyncio.ensure_future(fetch(self.decode(cursor)))
+        self._tasks.add(task)
+        task.add_done_callback(done)
+        return future, True
+
+    def evict(self, table_name: str):
+        """Drop every page of table_name, prefetches in flight still complete but their pages aren't served"""
+        with self._lock:
+            for page_key in [k for k in self.pages if k[0] == table_name]:
+                self.pages.pop(page_key, None)
+
+    async def page(
+        self,
+        table_name: str,
+        key: Hashable,
+        cursor: Optional[str],
+        fetch: Callable[[Optional[str]], Awaitable[Page]],
+    ) -> tuple[list[dict], str]:
+        """
+        Return the page cursor stands for (the first page when empty) and the cursor of the page after it
+
+        Args:
+            table_name: Table the pages belong to, see evict()
+            key: Identifies the request options, pages are only shared between calls with the same key
+            cursor: A cursor returned by a previous call, a raw Airtable offset or None
+            fetch: Coroutine function fetching a page from Airtable given an Airtable offset, returns (records, next
+                Airtable offset)
+        """
+        airtable_offset = self.decode(cursor)
+        if airtable_offset is None:
+            records, next_airtable_offset = await fetch(None)
+            return records, self.encode(next_airtable_offset)
+
+        future, started = self._start((table_name, key, self.encode(airtable_offset)), fetch)
+
+        try:
+            # Shielded, the page is shared with whoever else requested it
+            records, next_airtable_offset = await asyncio.shield(asyncio.wrap_future(future))
+        except asyncio.CancelledError:
+            # Only a cancelled fetch (shutdown...) cancels the shared future, this request itself goes on
+            if not future.cancelled():
+                raise
+
+            logger.warning("Prefetched page was cancelled, fetching it again")
+            records, next_airtable_offset = await fetch(airtable_offset)
+        except Exception as ex:
+            if started:
+                raise
+
+            # A prefetch can fail where a fresh request wouldn't (rate limited burst...), the caller's request decides
+            logger.warning(f"Prefetched page failed, fetching it again: {ex}")
+            records, next_airtable_offset = await fetch(airtable_offset)
+
+        next_cursor = self.encode(next_airtable_offset)
+        if next_cursor != "":
+            self._start((table_name, key, next_cursor), fetch)
+
+        return records, next_cursor
@@ -29,3 +29,55 @@ def OR(*args) -> str:
     'OR(1, 2, 3)'
     """
     return "OR({})".format(",".join(args))
+
+
+def RECORD_ID() -> str:
+    """
+    Creates a RECORD_ID statement, matches a record's ID without relying on a "Record ID" formula field
+
+    >>> EQUAL(STR_VALUE("rec123"), RECORD_ID())
+    "'rec123'=RECORD_ID()"
+    """
+    return "RECORD_ID()"
+
+
+def LAST_MODIFIED_TIME(*fields: str) -> str:
+    """
+    Creates a LAST_MODIFIED_TIME statement, optionally limited to the given fields
+
+    >>> LAST_MODIFIED_TIME()
+    'LAST_MODIFIED_TIME()'
+    >>> LAST_MODIFIED_TIME(FIELD("Name"))
+    'LAST_MODIFIED_TIME({Name})'
+    """
+    return "LAST_MODIFIED_TIME({})".format(",".join(fields))
+
+
+def CREATED_TIME() -> str:
+    """
+    Creates a CREATED_TIME statement
+
+    >>> CREATED_TIME()
+    'CREATED_TIME()'
+    """
+    return "CREATED_TIME()"
+
+
+def DATETIME_PARSE(date: str) -> str:
+    """
+    Creates a DATETIME_PARSE statement for an ISO 8601 timestamp
+
+    >>> DATETIME_PARSE("2022-07-15T00:00:00.000Z")
+    "DATETIME_PARSE('2022-07-15T00:00:00.000Z')"
+    """
+    return "DATETIME_PARSE({})".format(STR_VALUE(date))
+
+
+def IS_AFTER(date1: str, date2: str) -> str:
+    """
+    Creates an IS_AFTER statement
+
+    >>> IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE("2022-07-15T00:00:00.000Z"))
+    "IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('2022-07-15T00:00:00.000Z'))"
+    """
+    return "IS_AFTER({}, {})".format(date1, date2)
@@ -0,0 +1,90 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+
+BatchLoadFn = Callable[[list[str]], Awaitable[Iterable[Any]]]
+
+
+class RelationshipLoader:
+    """
+    Page-scoped DataLoader for linked Airtable records
+
+    Responses queue the linked record IDs of every record in a page, a single load() then fetches each related
+    table once (concurrently across tables) and resolve() swaps the IDs for the fetched records. This replaces
+    one round-trip per record per relationship with one round-trip per relationship.
+
+    >>> loader = RelationshipLoader()
+    >>> for r in page.root:
+    ...     loader.queue("languages", r.fields.languages, list_languages)
+    >>> await loader.load()
+    >>> for r in page.root:
+    ...     r.fields.languages = loader.resolve("languages", r.fields.languages)
+    """
+
+    def __init__(self):
+        self._batch_load_fns: dict[str, BatchLoadFn] = {}
+        self._pending: dict[str, dict[str, None]] = defaultdict(dict)
+        self._records: dict[str, dict[str, Any]] = defaultdict(dict)
+
+    def queue(self, relation: str, ids_or_records: Union[None, str, Iterable[Any]], batch_load_fn: BatchLoadFn):
+        if ids_or_records is None:
+            return
+
+        if isinstance(ids_or_records, str):
+            ids_or_records = [ids_or_records]
+
+        self._batch_load_fns.setdefault(relation, batch_load_fn)
+        for id_or_record in ids_or_records:
+            if isinstance(id_or_record, str) and id_or_record not in self._records[relation]:
+                # dict used as an insertion ordered set
+                self._pending[relation][id_or_record] = None
+
+    async def load(self):
+        relations = [relation for relation, ids in self._pending.items() if len(ids) > 0]
+        if len(relations) == 0:
+            return
+
+        results = await asyncio.gather(
+            *[self._batch_load_fns[relation](list(self._pending[relation])) for relation in relations]
+        )
+
+        for relation, records in zip(relations, results):
+            # client list_*_by_ids methods return RootModel lists
+            for record in getattr(records, "root", records):
+                self._records[relation][record.id] = record
+            self._pending[relation].clear()
+
+    def resolve(self, relation: str, ids_or_records: Optional[Iterable[Any]]) -> Optional[list[Any]]:
+        """Swap linked IDs for loaded records, IDs that couldn't be loaded are dropped"""
+        if ids_or_records is None:
+            return None
+
+        records = []
+        for id_or_record in ids_or_records:
+            if isinstance(id_or_record, str):
+                record = self._records[relation].get(id_or_record)
+                if record is not None:
+                    records.append(record)
+            else:
+                records.append(id_or_record)
+
+        return records
+
+    def resolve_one(self, relation: str, id_or_record: Optional[Any]) -> Optional[Any]:
+        """Swap a single linked ID for its loaded record, an ID that couldn't be loaded is returned as is"""
+        if isinstance(id_or_record, str):
+            return self._records[relation].get(id_or_record, id_or_record)
+
+        return id_or_record
+
+
+async def batch_load_relationships(*fields):
+    """Load the relationships of every given fields model with one request per related table"""
+    loader = RelationshipLoader()
+    for f in fields:
+        f.queue_relationships(loader)
+
+    await loader.load()
+
+    for f in fields:
+        f.resolve_relationships(loader)
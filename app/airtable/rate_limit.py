@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from typing import Optional
+
+from ..log import logger
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to `burst` tokens, refilled at `rate` tokens per second
+
+    Tokens are reserved rather than polled: a caller finding the bucket empty takes the next token that will be
+    refilled (driving the balance negative) and sleeps until it's due, so waiters are served in arrival order and
+    the bucket never releases more than `rate` requests per second however many are queued. Reservations are
+    guarded by a thread lock and waiting uses the caller's own event loop, so one bucket is shared by every thread.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.acquired = 0
+        self.queued = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """Take a token, returns how many seconds the caller must wait before using it"""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            self.acquired += 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def pause(self, seconds: float):
+        """Hold back tokens not yet reserved for `seconds`, e.g. once the server answered 429"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+            self.throttled += 1
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay <= 0:
+            return
+
+        with self._lock:
+            self.queue_depth += 1
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            self.wait_seconds += delay
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            with self._lock:
+                self.queue_depth -= 1
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "requests": self.acquired,
+                "queued_requests": self.queued,
+                "throttled_responses": self.throttled,
+                "wait_seconds": round(self.wait_seconds, 3),
+            }
+
+
+class RateLimiter:
+    """
+    One token bucket per Airtable base, Airtable's rate limit (5 requests/second) applies to each base separately
+
+    Limits are per process, deployments running several processes/containers against the same base should divide
+    the rate between them
+    """
+
+    # Log a warning whenever a base's queue grows past this many seconds worth of requests
+    QUEUE_WARNING_SECONDS = 5
+
+    def __init__(self, rate: float = 5, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst
+        self.buckets: dict[str, TokenBucket] = defaultdict(lambda: TokenBucket(self.rate, self.burst))
+
+    async def acquire(self, base_id: str):
+        bucket = self.buckets[base_id]
+        if bucket.queue_depth >= self.rate * self.QUEUE_WARNING_SECONDS:
+            logger.warning(
+                f"Airtable rate limiter queue for base '{base_id}' is {bucket.queue_depth} requests deep: "
+                f"{bucket.metrics()}"
+            )
+
+        await bucket.acquire()
+
+    def throttled(self, base_id: str, retry_after: float):
+        """Hold back base_id's requests for retry_after seconds after a 429, logging the base's limiter metrics"""
+        bucket = self.buckets[base_id]
+        bucket.pause(retry_after)
+        logger.warning(f"Airtable rate limited base '{base_id}', backing off {retry_after}s: {bucket.metrics()}")
@@ -0,0 +1,248 @@
+import asyncio
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Union
+
+from ..log import logger
+from . import formulas
+from .api import Api
+
+
+def _index_values(value) -> list[str]:
+    """
+    Mirror the values FIND(..., ARRAYJOIN({field})) is run against: linked record / lookup fields are lists and
+    "All Emails" style rollups are comma joined strings
+    """
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(v).strip() for v in value]
+    if isinstance(value, str):
+        return [v.strip() for v in value.split(",")]
+    return [str(value)]
+
+
+class ReplicaTable:
+    """
+    In-memory copy of one Airtable table keyed by record ID
+
+    Hash indexes over field values are built the first time a field is filtered on and maintained as records are
+    put/removed after that, so lookups on linked-record and email fields cost a dict access rather than a table scan
+    """
+
+    def __init__(self, table_name: str):
+        self.table_name = table_name
+        self.records: dict[str, dict] = {}
+        self.indexes: dict[str, dict[str, set[str]]] = {}
+        self.synced_at: Optional[float] = None
+        self.full_synced_at: Optional[float] = None
+
+        # Airtable time of the last sync, records modified after it are pulled by the next delta sync
+        self.high_water_mark: Optional[datetime] = None
+        # Any field known to exist, requested alone for the cheap record ID sweep
+        self.sweep_field: Optional[str] = None
+
+    def _index_record(self, index_field: str, record: dict):
+        for value in _index_values(record["fields"].get(index_field)):
+            self.indexes[index_field][value].add(record["id"])
+
+    def _unindex_record(self, index_field: str, record: dict):
+        for value in _index_values(record["fields"].get(index_field)):
+            ids = self.indexes[index_field].get(value)
+            if ids is not None:
+                ids.discard(record["id"])
+                if len(ids) == 0:
+                    del self.indexes[index_field][value]
+
+    def index(self, field: str) -> dict[str, set[str]]:
+        if field not in self.indexes:
+            self.indexes[field] = defaultdict(set)
+            for record in self.records.values():
+                self._index_record(field, record)
+        return self.indexes[field]
+
+    def put(self, record: dict):
+        self.remove(record["id"])
+        self.records[record["id"]] = record
+        for index_field in self.indexes:
+            self._index_record(index_field, record)
+
+    def remove(self, record_id: str):
+        record = self.records.pop(record_id, None)
+        if record is None:
+            return
+        for index_field in self.indexes:
+            self._unindex_record(index_field, record)
+
+    def replace_all(self, records: Iterable[dict]):
+        self.records = {r["id"]: r for r in records}
+        # Rebuilt lazily on next lookup
+        self.indexes = {}
+
+    def get(self, record_id: str) -> Optional[dict]:
+        return self.records.get(record_id)
+
+    def get_many(self, record_ids: Iterable[str]) -> list[dict]:
+        return [self.records[r_id] for r_id in dict.fromkeys(record_ids) if r_id in self.records]
+
+    def find(self, filters: dict[str, Union[str, list[str]]]) -> list[dict]:
+        """
+        Local equivalent of AND(INCLUDE(value, {field}), ...), a list of values is OR'd the way find_educators does
+
+        Values are matched against whole list items / comma separated entries rather than as substrings
+        """
+        matching_ids: Optional[set[str]] = None
+        for field, value in filters.items():
+            values = value if isinstance(value, list) else [value]
+
+            index = self.index(field)
+            field_ids = set()
+            for v in values:
+                field_ids |= index.get(str(v).strip(), set())
+
+            matching_ids = field_ids if matching_ids is None else matching_ids & field_ids
+            if len(matching_ids) == 0:
+                return []
+
+        if matching_ids is None:
+            return list(self.records.values())
+
+        # Keep Airtable's (table view) ordering
+        return [r for r_id, r in self.records.items() if r_id in matching_ids]
+
+
+class Replica:
+    """
+    Read replica of an Airtable base
+
+    Tables are pulled in full on first use (or at startup, see warm()), after that a refresh once older than
+    refresh_interval seconds only pulls records created/modified since the table's high-water mark plus an ID-only
+    sweep to drop deleted records. LAST_MODIFIED_TIME() ignores changes to computed (lookup/rollup) fields, so tables
+    are still re-pulled in full every full_sync_interval seconds.
+
+    Syncs run in the background and never hold up a request: reads pass through to Airtable until a table's first
+    sync completes, a stale table is served as is while it's refreshed.
+
+    Writes keep going to Airtable, callers put() the written record so the replica reads its own writes.
+    """
+
+    # Re-read records modified shortly before the high-water mark to absorb clock skew and in-flight writes
+    HIGH_WATER_MARK_OVERLAP = timedelta(seconds=60)
+
+    def __init__(
+        self,
+        api: Api,
+        base_id: str,
+        table_names: Iterable[str],
+        refresh_interval: float = 60,
+        full_sync_interval: float = 3600,
+    ):
+        self.api = api
+        self.base_id = base_id
+        self.refresh_interval = refresh_interval
+        self.full_sync_interval = full_sync_interval
+        self.tables: dict[str, ReplicaTable] = {table_name: ReplicaTable(table_name) for table_name in table_names}
+        # Sync in progress by table name
+        self._syncs: dict[str, asyncio.Task] = {}
+
+    def is_stale(self, table_name: str) -> bool:
+        synced_at = self.tables[table_name].synced_at
+        return synced_at is None or time.monotonic() - synced_at > self.refresh_interval
+
+    def _needs_full_sync(self, replica_table: ReplicaTable) -> bool:
+        return (
+            replica_table.full_synced_at is None
+            or replica_table.sweep_field is None
+            or time.monotonic() - replica_table.full_synced_at > self.full_sync_interval
+        )
+
+    async def full_sync(self, table_name: str):
+        replica_table = self.tables[table_name]
+        started_at = datetime.now(timezone.utc)
+
+        raw = await self.api.table(base_id=self.base_id, table_name=table_name).all()
+        replica_table.replace_all(raw)
+
+        # Airtable omits empty fields, pick one that is actually populated
+        replica_table.sweep_field = next((field for r in raw for field in r["fields"]), None)
+        replica_table.high_water_mark = started_at - self.HIGH_WATER_MARK_OVERLAP
+        replica_table.synced_at = replica_table.full_synced_at = time.monotonic()
+
+    async def delta_sync(self, table_name: str):
+        replica_table = self.tables[table_name]
+        started_at = datetime.now(timezone.utc)
+
+        since = formulas.DATETIME_PARSE(replica_table.high_water_mark.strftime("%Y-%m-%dT%H:%M:%S.000Z"))
+        formula = formulas.OR(
+            formulas.IS_AFTER(formulas.LAST_MODIFIED_TIME(), since), formulas.IS_AFTER(formulas.CREATED_TIME(), since)
+        )
+
+        table = self.api.table(base_id=self.base_id, table_name=table_name)
+        changed, sweep = await asyncio.gather(
+            table.all(formula=formula),
+            table.all(fields=[replica_table.sweep_field]),
+        )
+
+        for record in changed:
+            replica_table.put(record)
+
+        # Records changed during the sweep may be missing from it, they're kept until the next sweep
+        live_ids = {r["id"] for r in sweep} | {r["id"] for r in changed}
+        for record_id in [r_id for r_id in replica_table.records if r_id not in live_ids]:
+            replica_table.remove(record_id)
+
+        replica_table.high_water_mark = started_at - self.HIGH_WATER_MARK_OVERLAP
+        replica_table.synced_at = time.monotonic()
+
+    async def sync(self, table_name: str):
+        if self._needs_full_sync(self.tables[table_name]):
+            await self.full_sync(table_name)
+        else:
+            await self.delta_sync(table_name)
+
+    async def sync_all(self):
+        await asyncio.gather(*[self.sync(table_name) for table_name in self.tables])
+
+    async def _sync_logged(self, table_name: str):
+        try:
+            await self.sync(table_name)
+        except Exception as ex:
+            logger.exception(f"Failed syncing replica of table '{table_name}': {ex}")
+
+    def start_sync(self, table_name: str) -> asyncio.Task:
+        """Sync the table in the background unless it's already being synced, returns the sync's task"""
+        task = self._syncs.get(table_name)
+        # A task left behind by a closed event loop never completes, it's replaced rather than waited on
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return task
+
+        task = asyncio.ensure_future(self._sync_logged(table_name))
+        self._syncs[table_name] = task
+        return task
+
+    def warm(self):
+        """Start the first sync of every table in the background so early requests are less likely to pass through"""
+        for table_name in self.tables:
+            self.start_sync(table_name)
+
+    async def table(self, table_name: str) -> Optional[ReplicaTable]:
+        """
+        Return the replicated table, starting a background refresh if it's stale. None means the caller should query
+        Airtable: the table isn't replicated or its first sync hasn't completed yet.
+        """
+        if table_name not in self.tables:
+            return None
+
+        if self.is_stale(table_name):
+            self.start_sync(table_name)
+
+        replica_table = self.tables[table_name]
+        if replica_table.synced_at is None:
+            return None
+
+        return replica_table
+
+    def put(self, table_name: str, record: dict):
+        if table_name in self.tables and self.tables[table_name].synced_at is not None:
+            self.tables[table_name].put(record)
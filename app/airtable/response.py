@@ -1,6 +1,8 @@
+import functools
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
+import pydantic
 from pydantic import RootModel, field_validator
 
 from app.airtable.base_model import BaseModel
@@ -16,6 +18,19 @@ class AirtableResponse(BaseModel):
     def transform_relationships(cls, v: Any):
         return dict(v)
 
+    @classmethod
+    @functools.cache
+    def projection(cls) -> Optional[list[str]]:
+        """
+        Airtable field names the response's fields model reads, passed as `fields` so Airtable only returns those
+        columns. None when fields is an untyped dict and every column is needed.
+        """
+        fields_model = cls.model_fields["fields"].annotation
+        if not (isinstance(fields_model, type) and issubclass(fields_model, pydantic.BaseModel)):
+            return None
+
+        return [field.alias or name for name, field in fields_model.model_fields.items()]
+
 
 class ListAirtableResponse(RootModel):
     root: list[AirtableResponse]
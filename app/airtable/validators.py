@@ -5,15 +5,20 @@ def get_first_or_default_provided(v):
         return v
 
 
+# Values that are already unwrapped pass through so models can be re-validated from their own dump
 def get_first_or_default_none(v):
     if isinstance(v, list) and len(v) > 0:
         return v[0]
-    else:
+    elif isinstance(v, list) or v is None:
         return None
+    else:
+        return v
 
 
 def get_first_or_default_dict(v):
     if isinstance(v, list) and len(v) > 0:
         return v[0]
+    elif isinstance(v, dict):
+        return v
     else:
         return {}
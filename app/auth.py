@@ -1,9 +1,18 @@
+import asyncio
+import hashlib
+import threading
+import time
+from typing import Optional
+
 import jwt
+from cachetools import TLRUCache
 
 from fastapi import Request
 from fastapi.security import HTTPBearer
 
 from . import const
+from .log import logger
+from .utils.singleton import Singleton
 
 ALGORITHMS = ["RS256"]
 token_auth_scheme = HTTPBearer()
@@ -15,26 +24,87 @@ class AuthError(Exception):
         self.status_code = status_code
 
 
+class JWKSCache(metaclass=Singleton):
+    """
+    Process wide cache of the Auth0 tenant's signing keys
+
+    The key set is re-fetched once it's `lifespan` seconds old, or when a token names a key ID it doesn't hold (Auth0
+    rotated its keys). Refreshes on key ID misses are limited to one per `min_refresh_interval` seconds, so tokens
+    with made up key IDs can't turn into a request to Auth0 each. A failed refresh keeps serving the keys it had.
+    """
+
+    def __init__(self, lifespan: float = 60 * 60, min_refresh_interval: float = 30):
+        self.client = jwt.PyJWKClient(
+            "https://{}/.well-known/jwks.json".format(const.AUTH0_DOMAIN), cache_jwk_set=False, cache_keys=False
+        )
+        self.lifespan = lifespan
+        self.min_refresh_interval = min_refresh_interval
+        self.keys: dict[str, jwt.PyJWK] = {}
+        self.fetched_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _refresh(self, fetched_at: Optional[float]):
+        with self._lock:
+            # Another request refreshed the key set while this one waited on the lock
+            if self.fetched_at != fetched_at:
+                return
+
+            try:
+                jwk_set = self.client.get_jwk_set()
+            except jwt.exceptions.PyJWKClientError as ex:
+                logger.warning(f"Fetching JWKS failed: {ex}")
+                return
+            finally:
+                self.fetched_at = time.monotonic()
+
+            self.keys = {key.key_id: key for key in jwk_set.keys if key.public_key_use in ("sig", None)}
+
+    async def get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        fetched_at = self.fetched_at
+        age = time.monotonic() - fetched_at if fetched_at is not None else None
+        if age is None or age >= self.lifespan or (kid not in self.keys and age >= self.min_refresh_interval):
+            await asyncio.to_thread(self._refresh, fetched_at)
+
+        signing_key = self.keys.get(kid)
+        if signing_key is None:
+            raise jwt.exceptions.PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
+        return signing_key
+
+
+def _verified_claims_expiry(_key, claims, now):
+    # Tokens are dropped from the cache the moment they expire, tokens without an "exp" claim are re-verified every
+    # minute
+    return claims.get("exp", now + 60)
+
+
+# Claims of verified tokens keyed by the token's SHA-256, expiring with the token
+verified_claims: TLRUCache = TLRUCache(maxsize=1024, ttu=_verified_claims_expiry, timer=time.time)
+
+
 class JWTBearer(HTTPBearer):
     def __init__(self, required_scope=None, any_scope=[], auto_error: bool = True):
         super(JWTBearer, self).__init__(auto_error=auto_error)
 
-        self.token = None
         self.required_scope = required_scope
         self.any_scope = any_scope
 
     async def __call__(self, request: Request):
-        self.token = await super(JWTBearer, self).__call__(request=request)
+        # The dependency instance is shared by every request to its router, so the token is passed along rather
+        # than kept on self
+        token = await super(JWTBearer, self).__call__(request=request)
 
-        await self.check_auth()
-        await self.check_scope(required_scope=self.required_scope, any_scope=self.any_scope)
+        claims = await self.check_auth(token.credentials)
+        await self.check_scope(claims, required_scope=self.required_scope, any_scope=self.any_scope)
 
-    async def check_auth(self):
-        jwks_url = "https://{}/.well-known/jwks.json".format(const.AUTH0_DOMAIN)
-        jwks_client = jwt.PyJWKClient(jwks_url)
+    async def check_auth(self, token: str) -> dict:
+        """Verify the token, returning its claims. Tokens already verified are answered from verified_claims."""
+        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        claims = verified_claims.get(token_hash)
+        if claims is not None:
+            return claims
 
         try:
-            signing_key = jwks_client.get_signing_key_from_jwt(self.token.credentials).key
+            signing_key = (await JWKSCache().get_signing_key(jwt.get_unverified_header(token).get("kid"))).key
         except jwt.exceptions.PyJWKClientError as error:
             raise AuthError({"code": "jwk_client_error", "description": "bad jwk client"}, 401)
         except jwt.exceptions.DecodeError as error:
@@ -42,8 +112,8 @@ class JWTBearer(HTTPBearer):
 
         if signing_key:
             try:
-                jwt.decode(
-                    self.token.credentials,
+                claims = jwt.decode(
+                    token,
                     signing_key,
                     algorithms=ALGORITHMS,
                     audience=const.AUTH0_AUDIENCE,
@@ -68,11 +138,12 @@ class JWTBearer(HTTPBearer):
         else:
             raise AuthError({"code": "invalid_header", "description": "Unable to find appropriate key"}, 401)
 
-    async def check_scope(self, required_scope=None, any_scope=[]):
-        unverified_claims = jwt.decode(self.token.credentials, options={"verify_signature": False})
+        verified_claims[token_hash] = claims
+        return claims
 
-        if unverified_claims.get("scope"):
-            token_scopes = unverified_claims["scope"].split()
+    async def check_scope(self, claims: dict, required_scope=None, any_scope=[]):
+        if claims.get("scope"):
+            token_scopes = claims["scope"].split()
             for token_scope in token_scopes:
                 if required_scope is not None:
                     if token_scope == required_scope:
@@ -0,0 +1,4 @@
+from .backends import CacheBackend, RedisCacheBackend, SQLiteCacheBackend, get_shared_backend
+from .decorators import cached, shared_cache_key
+from .invalidation import invalidate, on_invalidate, record_tag, records_tags, table_tag
+from .materialized import Materialized, MaterializedView
@@ -0,0 +1,218 @@
+import asyncio
+import sqlite3
+import time
+from contextlib import closing
+from typing import Iterable, Optional
+
+from app import const
+from app.log import logger
+
+
+class CacheBackend:
+    """
+    Shared (second tier) cache store, values are opaque bytes
+
+    Backends never raise on get/set/delete, an unreachable store behaves like an empty one so requests fall back
+    to Airtable instead of failing
+    """
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    async def delete(self, *keys: str):
+        raise NotImplementedError
+
+    async def tag(self, tags: Iterable[str], key: str, ttl: Optional[float] = None):
+        """Index key under each of tags (for at least ttl seconds) so invalidate_tags() can delete it"""
+        raise NotImplementedError
+
+    async def invalidate_tags(self, *tags: str):
+        """Delete every key indexed under tags, whichever process wrote it"""
+        raise NotImplementedError
+
+    async def aclose(self):
+        pass
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache table in a local SQLite file, shared by every process on the host (uvicorn workers, a warm Lambda
+    container's successive invocations...)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_tags (tag TEXT NOT NULL, key TEXT NOT NULL, expires_at REAL, "
+                "PRIMARY KEY (tag, key))"
+            )
+            self._initialized = True
+        return connection
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with closing(self._connect()) as connection:
+            row = connection.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return value
+
+    def _set(self, key: str, value: bytes, ttl: Optional[float]):
+        expires_at = time.time() + ttl if ttl is not None else None
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)", (key, value, expires_at)
+            )
+
+    def _delete(self, keys: tuple[str, ...]):
+        with closing(self._connect()) as connection:
+            connection.executemany("DELETE FROM cache WHERE key = ?", [(k,) for k in keys])
+
+    def _tag(self, tags: list[str], key: str, ttl: Optional[float]):
+        expires_at = time.time() + ttl if ttl is not None else None
+        with closing(self._connect()) as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO cache_tags (tag, key, expires_at) VALUES (?, ?, ?)",
+                [(tag, key, expires_at) for tag in tags],
+            )
+
+    def _invalidate_tags(self, tags: tuple[str, ...]):
+        with closing(self._connect()) as connection:
+            for tag in tags:
+                connection.execute("DELETE FROM cache WHERE key IN (SELECT key FROM cache_tags WHERE tag = ?)", (tag,))
+                connection.execute("DELETE FROM cache_tags WHERE tag = ?", (tag,))
+            # Index rows of entries that expired on their own
+            connection.execute("DELETE FROM cache_tags WHERE expires_at < ?", (time.time(),))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await asyncio.to_thread(self._get, key)
+        except sqlite3.Error as ex:
+            logger.warning(f"SQLite cache get failed: {ex}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        try:
+            await asyncio.to_thread(self._set, key, value, ttl)
+        except sqlite3.Error as ex:
+            logger.warning(f"SQLite cache set failed: {ex}")
+
+    async def delete(self, *keys: str):
+        try:
+            await asyncio.to_thread(self._delete, keys)
+        except sqlite3.Error as ex:
+            logger.warning(f"SQLite cache delete failed: {ex}")
+
+    async def tag(self, tags: Iterable[str], key: str, ttl: Optional[float] = None):
+        try:
+            await asyncio.to_thread(self._tag, list(tags), key, ttl)
+        except sqlite3.Error as ex:
+            logger.warning(f"SQLite cache tag failed: {ex}")
+
+    async def invalidate_tags(self, *tags: str):
+        try:
+            await asyncio.to_thread(self._invalidate_tags, tags)
+        except sqlite3.Error as ex:
+            logger.warning(f"SQLite cache tag invalidation failed: {ex}")
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared across hosts/Lambda containers through any Redis protocol server (Redis, Valkey, KeyDB, a local
+    redis-server for development...)
+
+    Requires the optional 'redis' package
+    """
+
+    # Seconds a tag's set of keys is kept after it was last written, longer than any cache entry's ttl
+    TAG_TTL = 24 * 60 * 60
+
+    def __init__(self, url: str):
+        # Imported lazily so 'redis' is only required when this backend is configured
+        import redis.asyncio
+
+        self.url = url
+        self.client = redis.asyncio.from_url(url)
+        self._errors = (redis.RedisError, OSError)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.client.get(key)
+        except self._errors as ex:
+            logger.warning(f"Redis cache get failed: {ex}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        try:
+            await self.client.set(key, value, px=int(ttl * 1000) if ttl is not None else None)
+        except self._errors as ex:
+            logger.warning(f"Redis cache set failed: {ex}")
+
+    async def delete(self, *keys: str):
+        if len(keys) == 0:
+            return
+        try:
+            await self.client.delete(*keys)
+        except self._errors as ex:
+            logger.warning(f"Redis cache delete failed: {ex}")
+
+    async def tag(self, tags: Iterable[str], key: str, ttl: Optional[float] = None):
+        try:
+            async with self.client.pipeline(transaction=False) as pipeline:
+                for tag in tags:
+                    pipeline.sadd(tag, key)
+                    # Tag sets outlive every entry they index, a set only ever expires once it's no longer written
+                    pipeline.expire(tag, self.TAG_TTL)
+                await pipeline.execute()
+        except self._errors as ex:
+            logger.warning(f"Redis cache tag failed: {ex}")
+
+    async def invalidate_tags(self, *tags: str):
+        if len(tags) == 0:
+            return
+        try:
+            async with self.client.pipeline(transaction=False) as pipeline:
+                for tag in tags:
+                    pipeline.smembers(tag)
+                members = await pipeline.execute()
+
+            keys = {key for tag_keys in members for key in tag_keys}
+            await self.client.delete(*keys, *tags)
+        except self._errors as ex:
+            logger.warning(f"Redis cache tag invalidation failed: {ex}")
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+_shared_backend: Optional[CacheBackend] = None
+
+
+def get_shared_backend() -> Optional[CacheBackend]:
+    """The configured shared cache tier, None when CACHE_BACKEND is 'memory' (the default)"""
+    global _shared_backend
+
+    if _shared_backend is None:
+        if const.CACHE_BACKEND == "sqlite":
+            _shared_backend = SQLiteCacheBackend(const.CACHE_SQLITE_PATH)
+        elif const.CACHE_BACKEND == "redis":
+            _shared_backend = RedisCacheBackend(const.CACHE_REDIS_URL)
+        elif const.CACHE_BACKEND != "memory":
+            raise ValueError(f"Unknown CACHE_BACKEND '{const.CACHE_BACKEND}', expected memory, sqlite or redis")
+
+    return _shared_backend
@@ -0,0 +1,290 @@
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import inspect
+import threading
+import time
+from typing import Any, Callable, Hashable, Iterable, NamedTuple, Optional, Tuple
+
+from cachetools.keys import hashkey
+from pydantic import TypeAdapter
+
+from app import const
+from app.log import logger
+from .backends import get_shared_backend
+from .invalidation import Tag, registry, shared_tag_key
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    # Wall clock time (shared across processes) after which the value is served stale and revalidated
+    refresh_at: Optional[float] = None
+
+    @property
+    def is_stale(self) -> bool:
+        return self.refresh_at is not None and time.time() >= self.refresh_at
+
+
+def shared_cache_key(namespace: str, *args, **kwargs) -> str:
+    """Process independent key for the shared cache tier, args must have a stable repr()"""
+    digest = hashlib.sha256(repr((args, sorted(kwargs.items()))).encode("utf-8")).hexdigest()
+    return f"{const.CACHE_KEY_PREFIX}:{namespace}:{digest}"
+
+
+def shared_value_type(func) -> Any:
+    """Type shared entries of func are (de)serialized as, from its return annotation"""
+    annotation = inspect.signature(func).return_annotation
+    if annotation is inspect.Signature.empty:
+        return Any
+    # Methods returning a pair are annotated "-> (Model, str)"
+    if isinstance(annotation, tuple):
+        return Tuple[annotation]
+    return annotation
+
+
+def cached(
+    cache,
+    key=hashkey,
+    shared=True,
+    refresh_after: Optional[float] = None,
+    tags: Optional[Callable[..., Iterable[Tag]]] = None,
+):
+    """
+    Coroutine-aware replacement for cachetools.cached with an optional shared second tier
+
+    cachetools.cached would store the coroutine object rather than its result, so the result is awaited
+    before it's written to the cache.
+
+    On an in-process miss the shared backend (see CACHE_BACKEND) is checked before calling through, results are
+    written to both tiers. Values written to the shared tier expire with the in-process cache's ttl and are stored
+    as JSON, validated on read against func's return annotation: values that don't survive the round trip (models
+    returned without an annotation...) are only cached in-process and unreadable shared entries are misses.
+
+    With refresh_after (stale-while-revalidate) the cache's ttl becomes a hard TTL: entries older than
+    refresh_after seconds are still returned immediately while a single background call refreshes them, only
+    callers hitting an entry past the hard TTL wait on Airtable.
+
+    Concurrent misses for the same key are coalesced (single-flight): while a call is in flight later callers wait
+    for its result instead of issuing their own, including callers from other threads/event loops. Cache access
+    is guarded by a lock since cachetools caches aren't thread-safe.
+
+    With tags, every entry is registered under the invalidation tags tags(result, **call_arguments) returns so
+    writers can evict it with app.cache.invalidate(*tags) rather than waiting out the TTL.
+
+    Args:
+        cache: Any cachetools cache (TTLCache, LRUCache, ...), its ttl is the hard TTL
+        key: Callable building the cache key from the call's arguments
+        shared: Whether results are also stored in the shared cache backend
+        refresh_after: Soft TTL in seconds, None disables background revalidation
+        tags: Callable receiving the result and the call's arguments by name, returning the entry's tags
+    """
+
+    def decorator(func):
+        namespace = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+
+        lock = threading.RLock()
+        # In-flight calls by key, concurrent.futures.Future can be awaited from any thread's event loop
+        in_flight: dict[Hashable, concurrent.futures.Future] = {}
+        # Keeps a reference to running tasks so they aren't GC'd mid-flight
+        tasks: set[asyncio.Task] = set()
+        # Bumped by evict(), a call that started before an eviction doesn't write its (possibly stale) result
+        generations: dict[Hashable, int] = {}
+        # Shared entries are (type tag, refresh_at, value) triples, built on first use once forward refs resolve
+        shared_type_tag: Optional[str] = None
+        shared_adapter: Optional[TypeAdapter] = None
+        unshareable_logged = False
+
+        def build_shared_key(*args, **kwargs):
+            # Methods of singletons (AirtableClient...) are keyed without self, its repr differs per process
+            if len(args) > 0 and getattr(type(args[0]), func.__name__, None) is wrapper:
+                args = args[1:]
+            return shared_cache_key(namespace, *args, **kwargs)
+
+        def get_shared_adapter() -> tuple[str, TypeAdapter]:
+            nonlocal shared_type_tag, shared_adapter
+            if shared_adapter is None:
+                value_type = shared_value_type(func)
+                shared_adapter = TypeAdapter(Tuple[str, Optional[float], value_type])
+                shared_type_tag = (
+                    f"{value_type.__module__}.{value_type.__qualname__}"
+                    if isinstance(value_type, type)
+                    else repr(value_type)
+                )
+            return shared_type_tag, shared_adapter
+
+        def encode_shared(shared_k, entry: CacheEntry) -> Optional[bytes]:
+            nonlocal unshareable_logged
+            try:
+                type_tag, adapter = get_shared_adapter()
+                raw = adapter.dump_json((type_tag, entry.refresh_at, entry.value), by_alias=True, exclude_unset=True)
+                if adapter.validate_json(raw)[2] == entry.value:
+                    return raw
+                reason = "it doesn't round trip through JSON"
+            except Exception as ex:
+                reason = str(ex)
+
+            if not unshareable_logged:
+                unshareable_logged = True
+                logger.warning(f"Not sharing {namespace} cache entries like '{shared_k}': {reason}")
+            return None
+
+        def decode_shared(shared_k, raw: bytes) -> Optional[CacheEntry]:
+            try:
+                type_tag, adapter = get_shared_adapter()
+                entry_type_tag, refresh_at, value = adapter.validate_json(raw)
+            except Exception as ex:
+                logger.warning(f"Discarding unreadable shared cache entry '{shared_k}': {ex}")
+                return None
+
+            if entry_type_tag != type_tag:
+                # Written by a deploy where func returned another type
+                return None
+            return CacheEntry(value, refresh_at)
+
+        def get_local(k) -> Optional[CacheEntry]:
+            with lock:
+                return cache.get(k)
+
+        def store_local(k, entry: CacheEntry, generation: Optional[int] = None):
+            with lock:
+                if generation is not None and generations.get(k, 0) != generation:
+                    return
+
+                try:
+                    cache[k] = entry
+                except ValueError:
+                    pass  # value too large
+
+        def evict(k):
+            """Drop k's entry and detach calls in flight for it, later callers start a fresh call"""
+            with lock:
+                cache.pop(k, None)
+                in_flight.pop(k, None)
+                in_flight.pop(("revalidate", k), None)
+                generations[k] = generations.get(k, 0) + 1
+
+        def get_tags(value, *args, **kwargs) -> list[Tag]:
+            if tags is None:
+                return []
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return list(tags(value, **bound.arguments))
+
+        async def load(k, *args, **kwargs) -> CacheEntry:
+            with lock:
+                generation = generations.get(k, 0)
+                epoch = registry.epoch
+
+            value = await func(*args, **kwargs)
+
+            entry = CacheEntry(value, time.time() + refresh_after if refresh_after is not None else None)
+            entry_tags = get_tags(value, *args, **kwargs)
+            # Invalidated mid-call (the entry wasn't registered yet), the value may predate the write
+            if registry.invalidated_since(entry_tags, epoch):
+                return entry
+
+            store_local(k, entry, generation)
+            with lock:
+                if generations.get(k, 0) != generation:
+                    # Evicted mid-call, the caller still gets the value but it isn't cached anywhere
+                    return entry
+
+            registry.register(entry_tags, wrapper, k)
+
+            backend = get_shared_backend() if shared else None
+            shared_k = build_shared_key(*args, **kwargs) if backend is not None else None
+
+            raw = encode_shared(shared_k, entry) if backend is not None else None
+            if raw is not None:
+                ttl = getattr(cache, "ttl", None)
+                # Indexed before it's written, an invalidation can't miss an entry other processes can read
+                if len(entry_tags) > 0:
+                    await backend.tag([shared_tag_key(tag) for tag in entry_tags], shared_k, ttl=ttl)
+                await backend.set(shared_k, raw, ttl=ttl)
+
+            return entry
+
+        async def get_shared(*args, **kwargs) -> Optional[CacheEntry]:
+            backend = get_shared_backend() if shared else None
+            if backend is None:
+                return None
+
+            shared_k = build_shared_key(*args, **kwargs)
+            raw = await backend.get(shared_k)
+            if raw is None:
+                return None
+
+            return decode_shared(shared_k, raw)
+
+        async def fill(k, *args, **kwargs) -> CacheEntry:
+            entry = await get_shared(*args, **kwargs)
+            if entry is None:
+                return await load(k, *args, **kwargs)
+
+            store_local(k, entry)
+            # Already indexed in the shared backend by the process that wrote it
+            registry.register(get_tags(entry.value, *args, **kwargs), wrapper, k)
+            return entry
+
+        def flight(flight_key, coro_fn, *args, **kwargs) -> concurrent.futures.Future:
+            """Join the call in flight for flight_key or start it"""
+            with lock:
+                future = in_flight.get(flight_key)
+                if future is not None:
+                    return future
+
+                future = concurrent.futures.Future()
+                in_flight[flight_key] = future
+
+            def done(task: asyncio.Task):
+                tasks.discard(task)
+                with lock:
+                    if in_flight.get(flight_key) is future:
+                        del in_flight[flight_key]
+
+                if task.cancelled():
+                    future.cancel()
+                elif task.exception() is not None:
+                    future.set_exception(task.exception())
+                else:
+                    future.set_result(task.result())
+
+            # Run as its own task so a cancelled caller (client disconnect) doesn't cancel it for everyone waiting
+            task = asyncio.ensure_future(coro_fn(*args, **kwargs))
+            tasks.add(task)
+            task.add_done_callback(done)
+            return future
+
+        def revalidate(k, *args, **kwargs):
+            def done(future: concurrent.futures.Future):
+                if not future.cancelled() and future.exception() is not None:
+                    logger.warning(f"Background refresh of {namespace} failed: {future.exception()}")
+
+            future = flight(("revalidate", k), load, k, *args, **kwargs)
+            future.add_done_callback(done)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+
+            entry = get_local(k)
+            if entry is None:
+                # Shielded, cancelling one waiter would otherwise cancel the shared future for every waiter
+                entry = await asyncio.shield(asyncio.wrap_future(flight(k, fill, k, *args, **kwargs)))
+
+            if entry.is_stale:
+                revalidate(k, *args, **kwargs)
+
+            return entry.value
+
+        wrapper.cache = cache
+        wrapper.cache_key = key
+        wrapper.cache_lock = lock
+        wrapper.cache_evict = evict
+        wrapper.shared_cache_key = build_shared_key
+        return wrapper
+
+    return decorator
@@ -0,0 +1,124 @@
+from collections import defaultdict
+from typing import Any, Callable, Hashable, Iterable
+
+from app import const
+from .backends import get_shared_backend
+
+Tag = tuple[str, Hashable]
+
+
+def record_tag(kind: str, record_id: Hashable) -> Tag:
+    """Tag for entries that depend on one record, e.g. record_tag("educator", "rec123")"""
+    return kind, record_id
+
+
+def records_tags(kind: str, response: Any) -> list[Tag]:
+    """Tags for every record in an Airtable response (a List*Response, a single *Response or None)"""
+    if response is None:
+        return []
+
+    records = getattr(response, "root", [response])
+    return [record_tag(kind, r.id) for r in records if getattr(r, "id", None) is not None]
+
+
+def table_tag(table_name: str) -> Tag:
+    """Tag for entries that depend on a whole table, e.g. paginated lists"""
+    return "table", table_name
+
+
+def shared_tag_key(tag: Tag) -> str:
+    """Key the shared backend indexes tag's entries under"""
+    kind, value = tag
+    return f"{const.CACHE_KEY_PREFIX}:tag:{kind}:{value}"
+
+
+class TagRegistry:
+    """
+    Maps invalidation tags to the cache entries that depend on them
+
+    Cached functions register their entries' tags as they're written, writers invalidate the tags their write
+    affects and every dependent entry is evicted. Entries in the shared backend are indexed by tag in the backend
+    itself (see CacheBackend.tag), so they're evicted whichever process wrote them. The in-process tier of other
+    processes isn't reachable though: their copies are only dropped once that tier's TTL expires.
+    """
+
+    # Refs to entries the caches already expired are pruned once the registry grows past this many refs
+    PRUNE_THRESHOLD = 10000
+
+    def __init__(self):
+        # tag -> {(cache wrapper, key)}, dict used as a set
+        self._entries: dict[Tag, dict[tuple[Any, Hashable], None]] = defaultdict(dict)
+        self._size = 0
+        # Called with each invalidated tag, for caches kept outside cached() (e.g. pagination cursors)
+        self._subscribers: list[Callable[[Tag], None]] = []
+        # Counts invalidations, tag -> count at its last invalidation so calls in flight can tell they're stale.
+        # Forgotten past PRUNE_THRESHOLD tags, calls started before then are all treated as stale.
+        self._epoch = 0
+        self._invalidated_at: dict[Tag, int] = {}
+        self._forgotten_before = 0
+
+    def subscribe(self, callback: Callable[[Tag], None]):
+        self._subscribers.append(callback)
+
+    @property
+    def epoch(self) -> int:
+        """Taken before calling through, see invalidated_since"""
+        return self._epoch
+
+    def invalidated_since(self, tags: Iterable[Tag], epoch: int) -> bool:
+        """Whether any of tags was invalidated after epoch, i.e. while a call started at epoch was in flight"""
+        tags = list(tags)
+        if len(tags) > 0 and epoch < self._forgotten_before:
+            return True
+        return any(self._invalidated_at.get(tag, -1) >= epoch for tag in tags)
+
+    def register(self, tags: Iterable[Tag], wrapper, key: Hashable):
+        for tag in tags:
+            entries = self._entries[tag]
+            if (wrapper, key) not in entries:
+                self._size += 1
+            entries[(wrapper, key)] = None
+
+        if self._size > self.PRUNE_THRESHOLD:
+            self.prune()
+
+    def prune(self):
+        for tag in list(self._entries):
+            entries = self._entries[tag]
+            for wrapper, key in [ref for ref in entries if ref[1] not in ref[0].cache]:
+                del entries[(wrapper, key)]
+            if len(entries) == 0:
+                del self._entries[tag]
+
+        self._size = sum(len(entries) for entries in self._entries.values())
+
+    async def invalidate(self, *tags: Tag):
+        if len(self._invalidated_at) + len(tags) > self.PRUNE_THRESHOLD:
+            self._invalidated_at.clear()
+            self._forgotten_before = self._epoch
+
+        for tag in tags:
+            self._invalidated_at[tag] = self._epoch
+            entries = self._entries.pop(tag, {})
+            self._size -= len(entries)
+            for wrapper, key in entries:
+                wrapper.cache_evict(key)
+            for callback in self._subscribers:
+                callback(tag)
+        self._epoch += 1
+
+        backend = get_shared_backend()
+        if backend is not None and len(tags) > 0:
+            await backend.invalidate_tags(*[shared_tag_key(tag) for tag in tags])
+
+
+registry = TagRegistry()
+
+
+async def invalidate(*tags: Tag):
+    await registry.invalidate(*tags)
+
+
+def on_invalidate(callback: Callable[[Tag], None]):
+    """Have callback called with every tag invalidated in this process"""
+    registry.subscribe(callback)
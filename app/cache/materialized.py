@@ -0,0 +1,55 @@
+import json
+import weakref
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+
+class Materialized(NamedTuple):
+    # The built API document, for internal callers
+    value: Any
+    # The document serialized the way FastAPI would serialize it as a response_model
+    body: bytes
+
+    def response(self) -> Response:
+        return Response(content=self.body, media_type="application/json")
+
+
+class MaterializedView:
+    """
+    An API document materialized from cached Airtable responses
+
+    Sources are the responses the client's cache hands out, a refresh (or invalidation) replaces them with new
+    objects. The document is built and serialized once per generation of its sources, requests in between get the
+    same objects and bytes. Concurrent requests hitting a new generation may each build it, the last one is kept.
+    """
+
+    def __init__(self):
+        self._sources: tuple[weakref.ref, ...] = ()
+        self._materialized: Optional[Materialized] = None
+
+    def _is_current(self, sources: tuple) -> bool:
+        return (
+            self._materialized is not None
+            and len(sources) == len(self._sources)
+            and all(ref() is source for ref, source in zip(self._sources, sources))
+        )
+
+    async def get(self, sources: tuple, build: Callable[[], Awaitable[Any]]) -> Materialized:
+        """
+        Args:
+            sources: The cached Airtable responses the document is built from
+            build: Coroutine function building the document (a pydantic model) from the sources
+        """
+        if self._is_current(sources):
+            return self._materialized
+
+        value = await build()
+        body = json.dumps(
+            jsonable_encoder(value), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+
+        self._sources = tuple(weakref.ref(source) for source in sources)
+        self._materialized = Materialized(value=value, body=body)
+        return self._materialized
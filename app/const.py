@@ -15,3 +15,27 @@ AUTH0_DOMAIN = os.getenv("AUTH0_DOMAIN", None)
 GOOGLE_CLOUD_API_KEY = os.getenv("GOOGLE_CLOUD_API_KEY", None)
 
 STAGE = os.getenv("STAGE", "dev")
+
+# Requests per second sent to each Airtable base, Airtable allows 5 per base (per process, lower it when several
+# processes/containers share a base)
+AIRTABLE_RATE_LIMIT = float(os.getenv("AIRTABLE_RATE_LIMIT", 5))
+
+# Serve School DB reads from an in-memory replica, changed records are pulled every AIRTABLE_REPLICA_REFRESH_INTERVAL
+# seconds and tables are re-pulled in full every AIRTABLE_REPLICA_FULL_SYNC_INTERVAL seconds
+AIRTABLE_REPLICA_ENABLED = os.getenv("AIRTABLE_REPLICA_ENABLED", "false").lower() in ("1", "true", "yes")
+
+AIRTABLE_REPLICA_REFRESH_INTERVAL = int(os.getenv("AIRTABLE_REPLICA_REFRESH_INTERVAL", 60))
+
+AIRTABLE_REPLICA_FULL_SYNC_INTERVAL = int(os.getenv("AIRTABLE_REPLICA_FULL_SYNC_INTERVAL", 3600))
+
+# Second cache tier shared between processes/containers: "memory" (in-process only), "sqlite" or "redis"
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+
+CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH", "/tmp/wf-airtable-api-cache.sqlite3")
+
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", f"wf-airtable-api:{STAGE}")
+
+# Geocodes persist here unless CACHE_BACKEND is "redis", in which case they're shared through Redis
+GEOCODE_CACHE_SQLITE_PATH = os.getenv("GEOCODE_CACHE_SQLITE_PATH", "/tmp/wf-airtable-api-geocode.sqlite3")
@@ -0,0 +1,119 @@
+"""
+Micro-benchmarks of geo area matching:
+
+- city tier: one haversine per city vs CityIndex's vectorized haversine
+- polygon tier: parsing and testing every polygon vs PolygonIndex's STRtree
+
+    python -m app.geocode.benchmark
+"""
+
+import math
+import random
+import timeit
+from typing import Optional
+
+from shapely import geometry
+
+from app.geocode.geocode_models import Place
+from app.geocode.utils import CityIndex, PolygonIndex, distance_between_places, is_place_within_radius, parse_polygon
+
+
+class _Fields:
+    def __init__(self, city_radius):
+        self.city_radius = city_radius
+
+
+class _CityArea:
+    def __init__(self, id, city_radius):
+        self.id = id
+        self.fields = _Fields(city_radius)
+
+
+def _place(lat: float, lng: float) -> Place:
+    return Place.model_validate(
+        {
+            "geometry": {
+                "location": {"lat": lat, "lng": lng},
+                "viewport": {"northeast": {"lat": lat, "lng": lng}, "southwest": {"lat": lat, "lng": lng}},
+            }
+        }
+    )
+
+
+def _random_place(rng: random.Random) -> Place:
+    return _place(rng.uniform(25, 49), rng.uniform(-124, -67))
+
+
+def nearest_city_loop(place: Place, cities):
+    """The per city implementation CityIndex replaced"""
+    near = [(ga, ga_place) for ga, ga_place in cities if is_place_within_radius(place, ga_place, ga.fields.city_radius)]
+    if len(near) == 0:
+        return None
+    return min(near, key=lambda c: distance_between_places(place, c[1]))[0]
+
+
+def _random_polygon(rng: random.Random) -> str:
+    """A random convex polygon in Airtable's "POLYGON ((lng lat, ...))" format"""
+    lat, lng, radius = rng.uniform(25, 49), rng.uniform(-124, -67), rng.uniform(0.1, 2)
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(rng.randint(4, 24)))
+    points = [(lng + radius * math.cos(a), lat + radius * math.sin(a)) for a in angles]
+    points.append(points[0])
+    return "POLYGON ((" + ", ".join(f"{p_lng} {p_lat}" for p_lng, p_lat in points) + "))"
+
+
+def first_polygon_loop(point: geometry.Point, polygons: list[str]) -> Optional[int]:
+    """The per polygon implementation PolygonIndex replaced, every polygon is parsed and tested on each lookup"""
+    for position, coordinates in enumerate(polygons):
+        polygon = parse_polygon(coordinates)
+        if polygon is not None and polygon.contains(point):
+            return position
+    return None
+
+
+def first_polygon_indexed(point: geometry.Point, index: PolygonIndex) -> Optional[int]:
+    return next(iter(index.containing(point)), None)
+
+
+def bench_polygons(sizes=(100, 1000, 5000), lookups=200, seed=0):
+    rng = random.Random(seed)
+    queries = [geometry.Point(rng.uniform(25, 49), rng.uniform(-124, -67)) for _ in range(lookups)]
+
+    print(f"{'polygons':>8} {'loop ms/lookup':>16} {'STRtree ms/lookup':>22} {'speedup':>9}")
+    for size in sizes:
+        polygons = [_random_polygon(rng) for _ in range(size)]
+        index = PolygonIndex(polygons)
+
+        for point in queries:
+            assert first_polygon_indexed(point, index) == first_polygon_loop(point, polygons)
+
+        loop = timeit.timeit(lambda: [first_polygon_loop(p, polygons) for p in queries], number=1) / lookups
+        indexed = timeit.timeit(lambda: [first_polygon_indexed(p, index) for p in queries], number=1) / lookups
+        print(f"{size:>8} {loop * 1000:>16.3f} {indexed * 1000:>22.3f} {loop / indexed:>8.1f}x")
+
+
+def bench_cities(sizes=(100, 1000, 10000), lookups=200, seed=0):
+    rng = random.Random(seed)
+    queries = [_random_place(rng) for _ in range(lookups)]
+
+    print(f"{'cities':>8} {'loop ms/lookup':>16} {'vectorized ms/lookup':>22} {'speedup':>9}")
+    for size in sizes:
+        cities = [(_CityArea(f"rec{i}", rng.choice([10, 30, 100])), _random_place(rng)) for i in range(size)]
+        index = CityIndex(cities)
+
+        for place in queries:
+            expected = nearest_city_loop(place, cities)
+            assert index.nearest_within_radius(place) is expected
+
+        loop = timeit.timeit(lambda: [nearest_city_loop(p, cities) for p in queries], number=1) / lookups
+        vectorized = timeit.timeit(lambda: [index.nearest_within_radius(p) for p in queries], number=1) / lookups
+        print(f"{size:>8} {loop * 1000:>16.3f} {vectorized * 1000:>22.3f} {loop / vectorized:>8.1f}x")
+
+
+def main():
+    bench_cities()
+    print()
+    bench_polygons()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Optional
+
+from cachetools import TTLCache
+
+from app import const
+from app.log import logger
+
+from .geocode_models import Place
+
+# Spelled out forms mapped to the USPS abbreviation, applied word by word once the address is lowercased
+ADDRESS_ABBREVIATIONS = {
+    "street": "st",
+    "avenue": "ave",
+    "av": "ave",
+    "road": "rd",
+    "boulevard": "blvd",
+    "drive": "dr",
+    "lane": "ln",
+    "court": "ct",
+    "place": "pl",
+    "parkway": "pkwy",
+    "highway": "hwy",
+    "terrace": "ter",
+    "circle": "cir",
+    "square": "sq",
+    "suite": "ste",
+    "apartment": "apt",
+    "north": "n",
+    "south": "s",
+    "east": "e",
+    "west": "w",
+    "northeast": "ne",
+    "northwest": "nw",
+    "southeast": "se",
+    "southwest": "sw",
+}
+
+
+def normalize_address(address: str) -> str:
+    """
+    Cache key for an address: case, punctuation, whitespace and spelled out street types/directions are folded so
+    "123 Main Street, Springfield" and "123 main st springfield" share an entry
+    """
+    words = re.sub(r"[^\w\s]", " ", address.lower()).split()
+    return " ".join(ADDRESS_ABBREVIATIONS.get(w, w) for w in words)
+
+
+class GeocodeStore:
+    """
+    Persistent tier of the geocode cache, values are a Place's JSON or "null" for addresses Google couldn't
+    geocode. Stores never raise, an unreachable store behaves like an empty one.
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl: float):
+        raise NotImplementedError
+
+
+class SQLiteGeocodeStore(GeocodeStore):
+    """Geocodes kept in a local SQLite file, survives process restarts on the host (warm Lambda containers...)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS geocode (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._initialized = True
+        return connection
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with closing(self._connect()) as connection:
+                row = connection.execute("SELECT value, expires_at FROM geocode WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as ex:
+            logger.warning(f"SQLite geocode cache get failed: {ex}")
+            return None
+
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, value: str, ttl: float):
+        try:
+            with closing(self._connect()) as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO geocode (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, time.time() + ttl),
+                )
+        except sqlite3.Error as ex:
+            logger.warning(f"SQLite geocode cache set failed: {ex}")
+
+
+class RedisGeocodeStore(GeocodeStore):
+    """
+    Geocodes shared across hosts/Lambda containers through the Redis server configured for the shared cache
+
+    Requires the optional 'redis' package
+    """
+
+    def __init__(self, url: str):
+        # Imported lazily so 'redis' is only required when this store is configured
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self._errors = (redis.RedisError, OSError)
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            value = self.client.get(f"{const.CACHE_KEY_PREFIX}:geocode:{key}")
+        except self._errors as ex:
+            logger.warning(f"Redis geocode cache get failed: {ex}")
+            return None
+
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str, ttl: float):
+        try:
+            self.client.set(f"{const.CACHE_KEY_PREFIX}:geocode:{key}", value, px=int(ttl * 1000))
+        except self._errors as ex:
+            logger.warning(f"Redis geocode cache set failed: {ex}")
+
+
+def get_geocode_store() -> GeocodeStore:
+    """Redis when it's the configured shared cache backend, a local SQLite file otherwise"""
+    if const.CACHE_BACKEND == "redis":
+        return RedisGeocodeStore(const.CACHE_REDIS_URL)
+    return SQLiteGeocodeStore(const.GEOCODE_CACHE_SQLITE_PATH)
+
+
+class GeocodeCache:
+    """
+    Two tier geocode cache keyed by normalize_address(): an in-process LRU in front of a persistent store
+
+    Addresses Google returns no result for are cached as well (for negative_ttl seconds, shorter since a typo'd
+    address is more likely to be retried once fixed than a valid one is to move)
+    """
+
+    MISSING = object()
+
+    def __init__(
+        self, store: GeocodeStore, maxsize: int = 1024, ttl: float = 60 * 60 * 24 * 31, negative_ttl: float = 86400
+    ):
+        self.store = store
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # LRU evicted, entries are also re-read from the store after negative_ttl so cached misses expire in-process
+        self.local: TTLCache = TTLCache(maxsize=maxsize, ttl=negative_ttl)
+        self._lock = threading.Lock()
+
+    def get(self, address: str):
+        """The cached Place, None for a cached negative result or MISSING"""
+        key = normalize_address(address)
+        with self._lock:
+            place = self.local.get(key, self.MISSING)
+        if place is not self.MISSING:
+            return place
+
+        value = self.store.get(key)
+        if value is None:
+            return self.MISSING
+
+        place = Place.model_validate_json(value) if value != "null" else None
+        with self._lock:
+            self.local[key] = place
+        return place
+
+    def set(self, address: str, place: Optional[Place]):
+        key = normalize_address(address)
+        with self._lock:
+            self.local[key] = place
+
+        if place is None:
+            self.store.set(key, "null", ttl=self.negative_ttl)
+        else:
+            self.store.set(key, place.model_dump_json(), ttl=self.ttl)
@@ -36,28 +36,28 @@ class Place(BaseModel):
     types: Optional[list[str]] = None
 
     def get_locality_component(self):
-        for ac in self.address_components:
+        for ac in self.address_components or []:
             if "locality" in ac.types:
                 return ac
 
         return None
 
     def get_colloquial_area_component(self):
-        for ac in self.address_components:
+        for ac in self.address_components or []:
             if "colloquial_area" in ac.types:
                 return ac
 
         return None
 
     def get_state_component(self):
-        for ac in self.address_components:
+        for ac in self.address_components or []:
             if "administrative_area_level_1" in ac.types:
                 return ac
 
         return None
 
     def get_country_component(self):
-        for ac in self.address_components:
+        for ac in self.address_components or []:
             if "country" in ac.types:
                 return ac
 
@@ -1,10 +1,10 @@
 from typing import Optional
 
-from cachetools import cached, TTLCache
 import googlemaps
 
 from app import const
 
+from .cache import GeocodeCache, get_geocode_store
 from .geocode_models import ListPlace, Place
 from ..utils.singleton import Singleton
 
@@ -12,11 +12,17 @@ from ..utils.singleton import Singleton
 class GoogleMapsAPI(metaclass=Singleton):
     def __init__(self, api_key=const.GOOGLE_CLOUD_API_KEY):
         self.client_api = googlemaps.Client(key=api_key)
+        self.cache = GeocodeCache(get_geocode_store())  # Geocodes are cached for a month, misses for a day
 
-    @cached(cache=TTLCache(maxsize=256, ttl=60 * 60 * 24 * 31))  # Cache for a month
     def geocode_address(self, address) -> Optional[Place]:
+        place = self.cache.get(address)
+        if place is not GeocodeCache.MISSING:
+            return place
+
+        place = None
         response = self.client_api.geocode(address)
         if len(response) > 0:
-            return ListPlace.parse_obj(response).root[0]
+            place = ListPlace.parse_obj(response).root[0]
 
-        return None
+        self.cache.set(address, place)
+        return place
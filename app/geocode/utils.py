@@ -1,12 +1,17 @@
+import asyncio
 import re
-from typing import Optional, Union
+from collections import defaultdict
+from typing import Iterable, Optional, Union
 
-from haversine import haversine, Unit
-from shapely import geometry
+import numpy as np
+from haversine import haversine, haversine_vector, Unit
+from shapely import geometry, STRtree
 
 from app.airtable.base_map_by_geographic_area.const import AirtableGeographicAreaTypes
 from app.geocode.geocode_models import Place, LatLngLiteral
+from app.geocode.google_maps_client import GoogleMapsAPI
 from app.models.geo_area_contacts import APIGeoAreaContactData
+from app.models.geo_areas import APIGeoAreaData
 from app.models.geo_area_target_communities import APIGeoAreaTargetCommunityData
 
 
@@ -49,159 +54,327 @@ def is_place_within_country(a: Place, country: Place):
     return a_country.short_name == b_country.short_name
 
 
-def get_geo_area_nearest_to_place(
-    place: Optional[Place],
-    geo_areas: Union[list[APIGeoAreaContactData], list[APIGeoAreaTargetCommunityData]],
-    marketing_source: Union[str, None] = None,
-):
-    default_geo_area_marketing_source_specific = None
-    default_international_geo_area_marketing_source_specific = None
-    default_geo_area = None
-    default_international_geo_area = None
-    city_geo_areas = []
-    polygon_geo_areas = []
-    region_geo_areas = []
-    state_geo_areas = []
-    country_geo_areas = []
-
-    for ga in geo_areas:
-        if marketing_source is not None and isinstance(ga, APIGeoAreaContactData):
-            if (
-                ga.fields.marketing_source == marketing_source
-                and ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_DEFAULT_US
-            ):
-                default_geo_area_marketing_source_specific = ga
-
-            elif (
-                ga.fields.marketing_source == marketing_source
-                and ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_DEFAULT_INTERNATIONAL
-            ):
-                default_international_geo_area_marketing_source_specific = ga
-
-        if ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_DEFAULT_US:
-            default_geo_area = ga
-
-        elif ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_DEFAULT_INTERNATIONAL:
-            default_international_geo_area = ga
-
-        elif ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_POLYGON:
-            if isinstance(ga, APIGeoAreaContactData) and marketing_source is not None:
-                if ga.fields.marketing_source == marketing_source:
-                    polygon_geo_areas.append(ga)
-            else:
-                polygon_geo_areas.append(ga)
+def parse_polygon(polygon_coordinates: Optional[str]) -> Optional[geometry.Polygon]:
+    """
+    Parse a geo area's polygon, points are (lat, lng) to match the place points tested against it
 
-        elif ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_CITY:
-            if isinstance(ga, APIGeoAreaContactData) and marketing_source is not None:
-                if ga.fields.marketing_source == marketing_source:
-                    city_geo_areas.append(ga)
-            else:
-                city_geo_areas.append(ga)
+    Example polygon str format:
 
-        elif ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_REGION:
-            if isinstance(ga, APIGeoAreaContactData) and marketing_source is not None:
-                if ga.fields.marketing_source == marketing_source:
-                    region_geo_areas.append(ga)
-            else:
-                region_geo_areas.append(ga)
+    POLYGON ((-73.9010989 40.997664, -74.3370459 41.1888957, -74.551168 41.2934439,
+    -74.70173 41.3622667, -74.7850821 41.3274224, -75.1418139 40.9865643, -75.2108798 40.5854214,
+    -74.9472072 40.3178983, -74.1891479 40.4517927, -74.2639676 40.4960505, -74.247494 40.5220241,
+    -74.2502596 40.5348199, -74.2353817 40.5579361, -74.2143148 40.5591341, -74.2037494 40.5923079,
+    -74.2011374 40.6325788, -74.1849067 40.6464003, -74.1400525 40.6422367, -74.0952643 40.6488871,
+    -74.0560421 40.6522048, -74.0336221 40.6935376, -74.0136887 40.7624537, -73.9336322 40.8769537,
+    -73.9010989 40.997664))
+    """
+    if polygon_coordinates is None:
+        return None
 
-        elif ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_STATE:
-            if isinstance(ga, APIGeoAreaContactData) and marketing_source is not None:
-                if ga.fields.marketing_source == marketing_source:
-                    state_geo_areas.append(ga)
-            else:
-                state_geo_areas.append(ga)
+    match = re.match(r"(?:[POLYGON]+)?(?:[\s\(]+)?([-+\d\.\s,]+)", polygon_coordinates)
+    if match is None:
+        return None
 
-        elif ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_COUNTRY:
-            if isinstance(ga, APIGeoAreaContactData) and marketing_source is not None:
-                if ga.fields.marketing_source == marketing_source:
-                    country_geo_areas.append(ga)
-            else:
-                country_geo_areas.append(ga)
+    str_point_list = match.group(1)
+    str_point_list = str_point_list.strip().split(",")
+
+    def str_point_to_geo_point(s):
+        parts = s.strip().split(" ")
+        return geometry.Point(float(parts[1]), float(parts[0]))
+
+    geo_point_list = list(map(str_point_to_geo_point, str_point_list))
+    return geometry.Polygon(geo_point_list)
+
+
+class PolygonIndex:
+    """
+    R-tree (shapely STRtree) over parsed polygons, a point's candidates are found by bounding box before the exact
+    containment test rather than testing every polygon
+    """
+
+    def __init__(self, polygon_coordinates: Iterable[Optional[str]]):
+        # Position in polygon_coordinates of each polygon in the tree, unparsable polygons are left out
+        self.positions = []
+        polygons = []
+        for position, coordinates in enumerate(polygon_coordinates):
+            try:
+                polygon = parse_polygon(coordinates)
+            except (ValueError, IndexError):
+                polygon = None
+
+            if polygon is not None:
+                self.positions.append(position)
+                polygons.append(polygon)
 
-    if place is None:
-        if default_geo_area_marketing_source_specific is not None:
-            return default_geo_area_marketing_source_specific
+        self.tree = STRtree(polygons)
 
-        if default_international_geo_area_marketing_source_specific is not None:
-            return default_international_geo_area_marketing_source_specific
+    def containing(self, point: geometry.Point) -> list[int]:
+        """Positions of the polygons containing point, in the order the index was built with"""
+        # Predicates are evaluated against the tree's prepared geometries
+        matches = self.tree.query(point, predicate="within")
+        return sorted(self.positions[m] for m in matches)
 
-        if default_geo_area is not None:
-            return default_geo_area
 
-        return default_international_geo_area
+GeoArea = Union[APIGeoAreaData, APIGeoAreaContactData, APIGeoAreaTargetCommunityData]
 
-    geo_area = None
 
-    geo_areas_near_cities = []
-    for ga in city_geo_areas:
-        if is_place_within_radius(place, ga.geocode(), ga.fields.city_radius):
-            geo_areas_near_cities.append(ga)
+def _short_name(component) -> Optional[str]:
+    return component.short_name if component is not None else None
 
-    if len(geo_areas_near_cities) > 0:
-        geo_area = min(geo_areas_near_cities, key=lambda ga: distance_between_places(place, ga.geocode()))
 
-    if geo_area is None:
-        geo_point = geometry.Point(place.geometry.location.lat, place.geometry.location.lng)
+class CityIndex:
+    """
+    City areas' centers and radii as NumPy arrays, a place's distance to every city is computed in one vectorized
+    haversine rather than one haversine call per city
+    """
 
-        for ga in polygon_geo_areas:
-            # Example polygon str format:
-            #
-            # POLYGON ((-73.9010989 40.997664, -74.3370459 41.1888957, -74.551168 41.2934439,
-            # -74.70173 41.3622667, -74.7850821 41.3274224, -75.1418139 40.9865643, -75.2108798 40.5854214,
-            # -74.9472072 40.3178983, -74.1891479 40.4517927, -74.2639676 40.4960505, -74.247494 40.5220241,
-            # -74.2502596 40.5348199, -74.2353817 40.5579361, -74.2143148 40.5591341, -74.2037494 40.5923079,
-            # -74.2011374 40.6325788, -74.1849067 40.6464003, -74.1400525 40.6422367, -74.0952643 40.6488871,
-            # -74.0560421 40.6522048, -74.0336221 40.6935376, -74.0136887 40.7624537, -73.9336322 40.8769537,
-            # -73.9010989 40.997664))
-            match = re.match(r"(?:[POLYGON]+)?(?:[\s\(]+)?([-+\d\.\s,]+)", ga.fields.polygon_coordinates)
-            if match is None:
+    def __init__(self, cities: list[tuple[GeoArea, Place]]):
+        self.geo_areas = [ga for ga, _ in cities]
+        self.points = np.array([place.geometry.location.as_tuple() for _, place in cities], dtype=float).reshape(-1, 2)
+        # Areas without a radius never match, NaN compares false
+        self.radii = np.array(
+            [ga.fields.city_radius if ga.fields.city_radius is not None else np.nan for ga, _ in cities], dtype=float
+        )
+
+    def nearest_within_radius(self, place: Place, allowed_ids: Optional[set[str]] = None) -> Optional[GeoArea]:
+        """The nearest city area whose radius (in miles) place falls within"""
+        if len(self.geo_areas) == 0:
+            return None
+
+        distances = haversine_vector(
+            self.points, np.array([place.geometry.location.as_tuple()]), Unit.MILES, comb=True
+        )[0]
+        within = distances <= self.radii
+        if allowed_ids is not None:
+            within &= np.array([ga.id in allowed_ids for ga in self.geo_areas])
+
+        if not within.any():
+            return None
+
+        # argmin returns the first of equally near cities, as min() did
+        return self.geo_areas[int(np.argmin(np.where(within, distances, np.inf)))]
+
+
+class _GeoAreaTiers:
+    """A set of geo areas bucketed by area type, state/country areas keyed by their state/country short name"""
+
+    def __init__(self, geo_areas: list[GeoArea], places: dict[str, Optional[Place]]):
+        self.cities: list[tuple[GeoArea, Place]] = []
+        self.polygons: list[GeoArea] = []
+        self.regions: list[tuple[GeoArea, Place]] = []
+        self.states: dict[str, list[GeoArea]] = defaultdict(list)
+        self.countries: dict[str, list[GeoArea]] = defaultdict(list)
+
+        for ga in geo_areas:
+            area_type = ga.fields.area_type
+            if area_type == AirtableGeographicAreaTypes.AREA_TYPE_POLYGON:
+                self.polygons.append(ga)
+                continue
+
+            place = places.get(ga.id)
+            if place is None:
                 continue
 
-            str_point_list = match.group(1)
-            str_point_list = str_point_list.strip().split(",")
-
-            def str_point_to_geo_point(s):
-                parts = s.strip().split(" ")
-                return geometry.Point(float(parts[1]), float(parts[0]))
-
-            geo_point_list = list(map(str_point_to_geo_point, str_point_list))
-            polygon = geometry.Polygon(geo_point_list)
-            if polygon.contains(geo_point):
-                geo_area = ga
-                break
-
-    if geo_area is None:
-        for ga in region_geo_areas:
-            if is_place_contained_within(place, ga.geocode()):
-                geo_area = ga
-                break
-
-    if geo_area is None:
-        for ga in state_geo_areas:
-            if is_place_within_state(place, ga.geocode()):
-                geo_area = ga
-                break
-
-    if geo_area is None:
-        for ga in country_geo_areas:
-            if is_place_within_country(place, ga.geocode()):
-                geo_area = ga
-                break
-
-    if geo_area is None:
-        if default_geo_area_marketing_source_specific is not None and place.get_country_component().short_name == "US":
-            geo_area = default_geo_area_marketing_source_specific
-
-    if geo_area is None:
-        if default_international_geo_area_marketing_source_specific is not None:
-            geo_area = default_international_geo_area_marketing_source_specific
-
-    if geo_area is None:
-        if place.get_country_component().short_name == "US":
-            geo_area = default_geo_area
-
-    if geo_area is None:
-        geo_area = default_international_geo_area
-
-    return geo_area
+            if area_type == AirtableGeographicAreaTypes.AREA_TYPE_CITY:
+                self.cities.append((ga, place))
+            elif area_type == AirtableGeographicAreaTypes.AREA_TYPE_REGION:
+                self.regions.append((ga, place))
+            elif area_type == AirtableGeographicAreaTypes.AREA_TYPE_STATE:
+                state = _short_name(place.get_state_component())
+                if state is not None:
+                    self.states[state].append(ga)
+            elif area_type == AirtableGeographicAreaTypes.AREA_TYPE_COUNTRY:
+                country = _short_name(place.get_country_component())
+                if country is not None:
+                    self.countries[country].append(ga)
+
+        self.city_index = CityIndex(self.cities)
+        self.polygon_index = PolygonIndex(ga.fields.polygon_coordinates for ga in self.polygons)
+
+
+class GeoAreaIndex:
+    """
+    Geo areas pre-bucketed for GeoAreaIndex.nearest, built once per geo area data refresh
+
+    Areas are bucketed per marketing source (contact areas of another marketing source are left out of a marketing
+    source's buckets, built the first time it's looked up), state and country areas are hash maps keyed by the
+    state/country short name and polygons are held in a PolygonIndex.
+
+    Lookups can be restricted to a subset of the areas (allowed_ids) without rebuilding the index.
+    """
+
+    GEOCODED_AREA_TYPES = (
+        AirtableGeographicAreaTypes.AREA_TYPE_CITY,
+        AirtableGeographicAreaTypes.AREA_TYPE_REGION,
+        AirtableGeographicAreaTypes.AREA_TYPE_STATE,
+        AirtableGeographicAreaTypes.AREA_TYPE_COUNTRY,
+    )
+
+    def __init__(self, geo_areas: list[GeoArea], places: Optional[dict[str, Optional[Place]]] = None):
+        """
+        Args:
+            geo_areas: Areas to index
+            places: Each geocoded area's Place by area ID (see resolve_places), resolved one area at a time if None
+        """
+        self.geo_areas = list(geo_areas)
+
+        # Area geocodes are resolved once rather than on every lookup
+        if places is None:
+            places = {ga.id: ga.geocode() for ga in self.geo_areas if ga.fields.area_type in self.GEOCODED_AREA_TYPES}
+        self.places = places
+
+        self.default_us = [
+            ga for ga in self.geo_areas if ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_DEFAULT_US
+        ]
+        self.default_international = [
+            ga
+            for ga in self.geo_areas
+            if ga.fields.area_type == AirtableGeographicAreaTypes.AREA_TYPE_DEFAULT_INTERNATIONAL
+        ]
+
+        self._tiers: dict[Optional[str], _GeoAreaTiers] = {None: _GeoAreaTiers(self.geo_areas, self.places)}
+        for marketing_source in {ga.fields.marketing_source for ga in self.geo_areas if self._has_marketing_source(ga)}:
+            self.tiers(marketing_source)
+
+    @classmethod
+    async def resolve_places(cls, geo_areas: list[GeoArea]) -> dict[str, Optional[Place]]:
+        """
+        Parse each geocoded area's stored geocode, areas without one are geocoded by name concurrently (each distinct
+        name once, off the event loop). Fetched geocodes land in GoogleMapsAPI's persistent cache, so areas missing
+        a geocode in Airtable only cost a Google call the first time.
+        """
+        places: dict[str, Optional[Place]] = {}
+        missing: dict[str, list[str]] = defaultdict(list)
+        for ga in geo_areas:
+            if ga.fields.area_type not in cls.GEOCODED_AREA_TYPES:
+                continue
+
+            if ga.fields.geocode is not None:
+                places[ga.id] = Place.model_validate(ga.fields.geocode)
+            elif ga.fields.area_name:
+                missing[ga.fields.area_name].append(ga.id)
+            else:
+                places[ga.id] = None
+
+        gmaps_client = GoogleMapsAPI()
+        area_names = list(missing)
+        geocoded = await asyncio.gather(
+            *[asyncio.to_thread(gmaps_client.geocode_address, area_name) for area_name in area_names]
+        )
+        for area_name, place in zip(area_names, geocoded):
+            for geo_area_id in missing[area_name]:
+                places[geo_area_id] = place
+
+        return places
+
+    @classmethod
+    async def build(cls, geo_areas: list[GeoArea]) -> "GeoAreaIndex":
+        return cls(geo_areas, places=await cls.resolve_places(geo_areas))
+
+    @staticmethod
+    def _has_marketing_source(ga: GeoArea) -> bool:
+        return isinstance(ga, APIGeoAreaContactData)
+
+    def tiers(self, marketing_source: Optional[str]) -> _GeoAreaTiers:
+        if marketing_source not in self._tiers:
+            self._tiers[marketing_source] = _GeoAreaTiers(
+                [
+                    ga
+                    for ga in self.geo_areas
+                    if not self._has_marketing_source(ga) or ga.fields.marketing_source == marketing_source
+                ],
+                self.places,
+            )
+        return self._tiers[marketing_source]
+
+    def nearest(
+        self, place: Optional[Place], marketing_source: Optional[str] = None, allowed_ids: Optional[set[str]] = None
+    ) -> Optional[GeoArea]:
+        """
+        The geo area place falls in, tried from most to least specific: nearest city within its radius, polygon,
+        region, state, country and finally the default US/international areas
+
+        Args:
+            place: Geocoded address, None falls back to the default areas
+            marketing_source: Only consider contact areas of this marketing source
+            allowed_ids: Only consider these areas
+        """
+
+        def allowed(ga: GeoArea) -> bool:
+            return allowed_ids is None or ga.id in allowed_ids
+
+        def first(geo_areas: Iterable[GeoArea]) -> Optional[GeoArea]:
+            return next((ga for ga in geo_areas if allowed(ga)), None)
+
+        def last(geo_areas: list[GeoArea]) -> Optional[GeoArea]:
+            return first(reversed(geo_areas))
+
+        default_geo_area_marketing_source_specific = None
+        default_international_geo_area_marketing_source_specific = None
+        if marketing_source is not None:
+            default_geo_area_marketing_source_specific = last(
+                [
+                    ga
+                    for ga in self.default_us
+                    if self._has_marketing_source(ga) and ga.fields.marketing_source == marketing_source
+                ]
+            )
+            default_international_geo_area_marketing_source_specific = last(
+                [
+                    ga
+                    for ga in self.default_international
+                    if self._has_marketing_source(ga) and ga.fields.marketing_source == marketing_source
+                ]
+            )
+        default_geo_area = last(self.default_us)
+        default_international_geo_area = last(self.default_international)
+
+        if place is None:
+            if default_geo_area_marketing_source_specific is not None:
+                return default_geo_area_marketing_source_specific
+
+            if default_international_geo_area_marketing_source_specific is not None:
+                return default_international_geo_area_marketing_source_specific
+
+            if default_geo_area is not None:
+                return default_geo_area
+
+            return default_international_geo_area
+
+        tiers = self.tiers(marketing_source)
+        geo_area = None
+
+        geo_area = tiers.city_index.nearest_within_radius(place, allowed_ids=allowed_ids)
+
+        if geo_area is None:
+            geo_point = geometry.Point(place.geometry.location.lat, place.geometry.location.lng)
+            geo_area = first(tiers.polygons[position] for position in tiers.polygon_index.containing(geo_point))
+
+        if geo_area is None:
+            geo_area = first(ga for ga, ga_place in tiers.regions if is_place_contained_within(place, ga_place))
+
+        if geo_area is None:
+            state = _short_name(place.get_state_component())
+            if state is not None:
+                geo_area = first(tiers.states.get(state, []))
+
+        country = _short_name(place.get_country_component())
+        if geo_area is None and country is not None:
+            geo_area = first(tiers.countries.get(country, []))
+
+        if geo_area is None:
+            if default_geo_area_marketing_source_specific is not None and country == "US":
+                geo_area = default_geo_area_marketing_source_specific
+
+        if geo_area is None:
+            if default_international_geo_area_marketing_source_specific is not None:
+                geo_area = default_international_geo_area_marketing_source_specific
+
+        if geo_area is None:
+            if country == "US":
+                geo_area = default_geo_area
+
+        if geo_area is None:
+            geo_area = default_international_geo_area
+
+        return geo_area
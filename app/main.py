@@ -1,6 +1,7 @@
 import time
 import random
 import string
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Depends, status
 import fastapi.exceptions as fastapiExceptions
@@ -9,7 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer
 from mangum import Mangum
-import requests
+import httpx
 
 from . import (
     auth,
@@ -27,14 +28,31 @@ from . import (
     router_auto_response_email_templates,
 )
 from .airtable.client import AirtableClient
+from .cache import get_shared_backend
 
 logger = log.logger
 
 stage = const.STAGE
 root_path = f"/{stage}" if stage else ""
+
+airtable_client = AirtableClient()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    airtable_client.warm_replica()
+    yield
+    await airtable_client.aclose()
+
+    shared_cache_backend = get_shared_backend()
+    if shared_cache_backend is not None:
+        await shared_cache_backend.aclose()
+
+
 app = FastAPI(
     title="WF Airtable API",
     root_path=root_path,
+    lifespan=lifespan,
     openapi_tags=[
         router_hubs.OPENAPI_TAG_METADATA,
         # router_pods.OPENAPI_TAG_METADATA,
@@ -60,9 +78,6 @@ app.add_middleware(
 )
 
 
-airtable_client = AirtableClient()
-
-
 @app.middleware("http")
 async def airtable_client_session_middleware(request: Request, call_next):
     request.state.airtable_client = airtable_client
@@ -150,7 +165,7 @@ async def resource_not_found(request, ex):
     )
 
 
-@app.exception_handler(requests.exceptions.HTTPError)
+@app.exception_handler(httpx.HTTPStatusError)
 async def airtable_resource_not_found(request, ex):
     log_exception(request, ex)
     if ex.response.status_code == status.HTTP_404_NOT_FOUND:
@@ -186,4 +201,5 @@ async def handle_general_exception(request, ex):
     )
 
 
-handler = Mangum(app)
+# Lambda containers are reused between invocations, skip the lifespan so the pooled Airtable session stays warm
+handler = Mangum(app, lifespan="off")
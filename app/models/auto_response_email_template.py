@@ -1,4 +1,7 @@
-from typing import Callable
+import itertools
+import re
+from collections import defaultdict
+from typing import Callable, Iterable, Optional
 
 from wf_airtable_api_client.models.auto_response_email_template import *
 from wf_airtable_api_client.models import auto_response_email_template
@@ -58,3 +61,100 @@ class ListAPIAutoResponseEmailTemplateData(auto_response_email_template.ListAPIA
             )
 
         return cls(root=responses)
+
+
+def normalize_template_value(value: Optional[str]) -> Optional[str]:
+    """Templates are matched ignoring case, whitespace and punctuation"""
+    if value is None:
+        return None
+    return re.sub(r"[\W_]", "", value).lower()
+
+
+class AutoResponseEmailTemplateIndex:
+    """
+    Decision table for picking the auto-response email template for a contact
+
+    Templates are keyed by their normalized (contact type, language, marketing source), each key mapping the geo areas
+    its templates cover to the first such template. Matching a contact probes the few keys it can match for each
+    fallback tier, then runs a single geo lookup restricted to the areas those keys cover.
+    """
+
+    # Template languages matching a contact in any language
+    ANY_LANGUAGES = ("any", "english")
+    ANY_CONTACT_TYPE = "any"
+
+    # Fallback tiers in the order they're tried, whether (marketing source, language, contact type) must match
+    TIERS = (
+        (True, True, True),
+        (False, True, True),
+        (False, False, True),
+        (False, False, False),
+    )
+
+    def __init__(self, templates: Iterable[APIAutoResponseEmailTemplateData]):
+        self.templates = list(templates)
+
+        # (contact type, language, marketing source) -> geo area ID -> position of the first template covering it
+        self.geo_areas_by_key: dict[tuple, dict[str, int]] = defaultdict(dict)
+        for position, template in enumerate(self.templates):
+            key = (
+                normalize_template_value(template.fields.contact_type),
+                normalize_template_value(template.fields.language),
+                normalize_template_value(template.fields.marketing_source),
+            )
+            geo_areas = self.geo_areas_by_key[key]
+            for geo_area_id in template.fields.geographic_areas or []:
+                geo_areas.setdefault(geo_area_id, position)
+
+    def candidates(
+        self, contact_type: Optional[str], language: Optional[str], marketing_source: Optional[str]
+    ) -> dict[str, int]:
+        """
+        Geo area ID -> position of the first template matching the contact that covers the area. None contact type
+        and language only match "any" templates, a None marketing source only matches templates without one.
+        """
+        contact_types = [self.ANY_CONTACT_TYPE]
+        if contact_type is not None:
+            contact_types.append(normalize_template_value(contact_type))
+
+        languages = list(self.ANY_LANGUAGES)
+        if language is not None:
+            languages.append(normalize_template_value(language))
+
+        candidates: dict[str, int] = {}
+        for key in set(itertools.product(contact_types, languages, [normalize_template_value(marketing_source)])):
+            for geo_area_id, position in self.geo_areas_by_key.get(key, {}).items():
+                if geo_area_id not in candidates or position < candidates[geo_area_id]:
+                    candidates[geo_area_id] = position
+        return candidates
+
+    def match(
+        self,
+        place,
+        geo_area_index,
+        contact_type: Optional[str] = None,
+        language: Optional[str] = None,
+        marketing_source: Optional[str] = None,
+    ) -> Optional[APIAutoResponseEmailTemplateData]:
+        """
+        The template for a contact at place, relaxing marketing source, then language, then contact type until a
+        template covers the nearest geo area
+
+        Args:
+            place: The contact's geocoded address
+            geo_area_index: app.geocode.utils.GeoAreaIndex over the geo areas templates refer to
+        """
+        for match_marketing_source, match_language, match_contact_type in self.TIERS:
+            candidates = self.candidates(
+                contact_type=contact_type if match_contact_type else None,
+                language=language if match_language else None,
+                marketing_source=marketing_source if match_marketing_source else None,
+            )
+            if len(candidates) == 0:
+                continue
+
+            geo_area = geo_area_index.nearest(place, allowed_ids=candidates.keys())
+            if geo_area is not None:
+                return self.templates[candidates[geo_area.id]]
+
+        return None
@@ -20,7 +20,7 @@ from ..airtable.base_school_db.languages import CertificationStatus
 
 
 class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
-    def to_airtable_educator(self, exclude_unset=False) -> airtable_educator_models.CreateAirtableEducatorFields:
+    async def to_airtable_educator(self, exclude_unset=False) -> airtable_educator_models.CreateAirtableEducatorFields:
         from ..airtable.client import AirtableClient
         from ..airtable.base_school_db.field_categories import FieldCategoryType
 
@@ -64,7 +64,7 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
         if self.etl_newsletter:
             newsletter_slugs.append(airtable_newsletters_models.NewsletterSlugs.EMERGING_TEACHER_LEADER_GROUP)
         if len(newsletter_slugs) > 0:
-            newsletters = airtable_client.get_newsletters_by_slug(newsletter_slugs)
+            newsletters = await airtable_client.get_newsletters_by_slug(newsletter_slugs)
             newsletter_ids = list(map(lambda n: n.id, newsletters.root))
 
         if exclude_unset is False or (exclude_unset and len(newsletter_ids) > 0):
@@ -97,7 +97,7 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
         age_classrooms_set = set()
         age_classrooms = None
         if self.initial_interest_in_age_classrooms:
-            age_classrooms_mapping = airtable_client.map_response_to_field_category_values(
+            age_classrooms_mapping = await airtable_client.map_response_to_field_category_values(
                 FieldCategoryType.classroom_levels, self.initial_interest_in_age_classrooms
             )
 
@@ -120,7 +120,7 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
     #         educator=educator, type="Personal email", email=self.email, is_primary=True
     #     )
 
-    def to_airtable_socio_economic(
+    async def to_airtable_socio_economic(
         self, educator_id
     ) -> airtable_socio_economic_backgrounds_models.CreateAirtableSocioEconomicBackgroundFields:
         from ..airtable.client import AirtableClient
@@ -128,14 +128,30 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
 
         airtable_client = AirtableClient()
 
+        def str_or_none(v):
+            return str(v) if v is not None else None
+
+        # Every response is mapped in one pass over the field mapping index
+        mappings = await airtable_client.map_responses_to_field_category_values(
+            {
+                "race_and_ethnicity": (FieldCategoryType.race_ethnicity, self.race_and_ethnicity),
+                "educational_attainment": (
+                    FieldCategoryType.educational_attainment,
+                    str_or_none(self.educational_attainment),
+                ),
+                "household_income": (FieldCategoryType.household_income, str_or_none(self.household_income)),
+                "gender": (FieldCategoryType.gender, self.gender),
+                "lgbtqia": (FieldCategoryType.lgbtqia, str_or_none(self.lgbtqia_identifying)),
+                "pronouns": (FieldCategoryType.pronouns, self.pronouns),
+            }
+        )
+
         set_race_and_ethnicity = set()
         set_race_and_ethnicity_other = set()
         race_and_ethnicity = None
         race_and_ethnicity_other = None
         if self.race_and_ethnicity is not None:
-            race_and_ethnicity_mapping = airtable_client.map_response_to_field_category_values(
-                FieldCategoryType.race_ethnicity, self.race_and_ethnicity
-            )
+            race_and_ethnicity_mapping = mappings["race_and_ethnicity"]
 
             for m in race_and_ethnicity_mapping:
                 if m["is_custom_value"] is True:
@@ -150,18 +166,14 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
 
         educational_attainment = None
         if self.educational_attainment is not None:
-            education_mapping = airtable_client.map_response_to_field_category_values(
-                FieldCategoryType.educational_attainment, str(self.educational_attainment)
-            )
+            education_mapping = mappings["educational_attainment"]
             if len(education_mapping) > 0:
                 if not education_mapping[0]["is_custom_value"] is True:
                     educational_attainment = education_mapping[0]["mapped_value"]
 
         household_income = None
         if self.household_income is not None:
-            household_income_mapping = airtable_client.map_response_to_field_category_values(
-                FieldCategoryType.household_income, str(self.household_income)
-            )
+            household_income_mapping = mappings["household_income"]
             if len(household_income_mapping) > 0:
                 if not household_income_mapping[0]["is_custom_value"] is True:
                     household_income = household_income_mapping[0]["mapped_value"]
@@ -171,9 +183,7 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
         gender = None
         gender_other = None
         if self.gender is not None:
-            gender_mapping = airtable_client.map_response_to_field_category_values(
-                FieldCategoryType.gender, self.gender
-            )
+            gender_mapping = mappings["gender"]
             for m in gender_mapping:
                 if m["is_custom_value"] is True:
                     set_gender_other.add(m["mapped_value"])
@@ -188,9 +198,7 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
         # TODO: Use Enums
         lgbtqia = None
         if self.lgbtqia_identifying is not None:
-            lgbtqia_mapping = airtable_client.map_response_to_field_category_values(
-                FieldCategoryType.lgbtqia, str(self.lgbtqia_identifying)
-            )
+            lgbtqia_mapping = mappings["lgbtqia"]
             if len(lgbtqia_mapping) > 0:
                 if not lgbtqia_mapping[0]["is_custom_value"] is True:
                     lgbtqia = lgbtqia_mapping[0]["mapped_value"]
@@ -201,9 +209,7 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
         pronouns = None
         pronouns_other = None
         if self.pronouns is not None:
-            pronoun_mapping = airtable_client.map_response_to_field_category_values(
-                FieldCategoryType.pronouns, self.pronouns
-            )
+            pronoun_mapping = mappings["pronouns"]
             for m in pronoun_mapping:
                 if m["is_custom_value"] is True:
                     set_pronouns_other.add(m["mapped_value"])
@@ -228,20 +234,24 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
             pronouns_other=pronouns_other,
         )
 
-    def to_airtable_languages(self, socio_economic_id) -> list[airtable_languages_models.CreateAirtableLanguageFields]:
+    async def to_airtable_languages(
+        self, socio_economic_id
+    ) -> list[airtable_languages_models.CreateAirtableLanguageFields]:
         from ..airtable.client import AirtableClient
         from ..airtable.base_school_db.field_categories import FieldCategoryType
 
         airtable_client = AirtableClient()
         airtable_languages = []
 
-        for language in self.languages:
+        languages_mappings = await airtable_client.map_responses_to_field_category_values(
+            {i: (FieldCategoryType.languages, language.language) for i, language in enumerate(self.languages)}
+        )
+
+        for i, language in enumerate(self.languages):
             set_languages = set()
             set_languages_other = set()
 
-            languages_mapping = airtable_client.map_response_to_field_category_values(
-                FieldCategoryType.languages, language.language
-            )
+            languages_mapping = languages_mappings[i]
             for m in languages_mapping:
                 if m["is_custom_value"] is True:
                     set_languages_other.add(m["mapped_value"])
@@ -271,7 +281,7 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
 
         return airtable_languages
 
-    def to_airtable_montessori_certifications(
+    async def to_airtable_montessori_certifications(
         self, educator_id
     ) -> list[airtable_montessori_certifications_models.CreateAirtableMontessoriCertificationFields]:
         from ..airtable.client import AirtableClient
@@ -279,12 +289,23 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
 
         airtable_client = AirtableClient()
 
+        certification_mappings = await airtable_client.map_responses_to_field_category_values(
+            {
+                **{
+                    ("levels", i): (FieldCategoryType.montessori_certification_levels, c.certification_levels)
+                    for i, c in enumerate(self.montessori_certifications)
+                },
+                **{
+                    ("certifier", i): (FieldCategoryType.montessori_certifiers, c.certifier)
+                    for i, c in enumerate(self.montessori_certifications)
+                },
+            }
+        )
+
         airtable_montessori_certifications = []
-        for certification in self.montessori_certifications:
+        for i, certification in enumerate(self.montessori_certifications):
             set_certification_levels = set()
-            mapped_certification_levels = airtable_client.map_response_to_field_category_values(
-                FieldCategoryType.montessori_certification_levels, certification.certification_levels
-            )
+            mapped_certification_levels = certification_mappings[("levels", i)]
             for m in mapped_certification_levels:
                 if m["is_custom_value"] is True:
                     set_certification_levels.add("Unknown")
@@ -292,9 +313,7 @@ class CreateUpdateAPIEducatorFields(educators.CreateUpdateAPIEducatorFields):
                     set_certification_levels.add(m["mapped_value"])
             certification_levels = list(set_certification_levels)
 
-            mapped_certifiers = airtable_client.map_response_to_field_category_values(
-                FieldCategoryType.montessori_certifiers, certification.certifier
-            )
+            mapped_certifiers = certification_mappings[("certifier", i)]
             # set_certifier = set()
             # set_certifier_other = set()
             # certifier = None
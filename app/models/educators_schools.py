@@ -53,7 +53,9 @@ class APIEducatorSchoolData(educators_schools.APIEducatorSchoolData):
             educator_data = response_models.APIDataWithFields(
                 id=educator_record.id,
                 type=educators_models.MODEL_TYPE,
-                fields=educators_models.APIEducatorMetaFields.parse_obj(educator_record.fields),
+                fields=educators_models.APIEducatorMetaFields.model_validate(
+                    educator_record.fields, from_attributes=True
+                ),
             )
 
         school_record = airtable_educator_school.fields.school
@@ -64,7 +66,7 @@ class APIEducatorSchoolData(educators_schools.APIEducatorSchoolData):
             school_data = response_models.APIDataWithFields(
                 id=school_record.id,
                 type=schools_models.MODEL_TYPE,
-                fields=schools_models.APISchoolMetaFields.parse_obj(school_record.fields),
+                fields=schools_models.APISchoolMetaFields.model_validate(school_record.fields, from_attributes=True),
             )
 
         relationships = APIEducatorSchoolRelationships(
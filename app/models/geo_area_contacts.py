@@ -1,5 +1,6 @@
+import asyncio
 import json
-from typing import Callable
+from typing import Callable, Optional
 
 from wf_airtable_api_client.models.geo_area_contacts import *
 from wf_airtable_api_client.models import geo_area_contacts
@@ -11,20 +12,25 @@ from . import auto_response_email_template as auto_response_email_template_model
 
 # from . import hubs as hub_models
 from . import partners as partner_models
+from .geo_areas import GeoAreaReferences
 from ..geocode.geocode_models import Place
 from ..geocode.google_maps_client import GoogleMapsAPI
 
 
 class APIGeoAreaContactData(geo_area_contacts.APIGeoAreaContactData):
     @classmethod
-    def from_airtable_geo_area_contact(
+    async def from_airtable_geo_area_contact(
         cls,
         airtable_geo_area_contact: airtable_geo_area_contacts_models.AirtableGeoAreaContactResponse,
         url_path_for: Callable,
+        references: Optional[GeoAreaReferences] = None,
     ):
-        from ..airtable.client import AirtableClient
-
-        airtable_client = AirtableClient()
+        """
+        Args:
+            references: Cross-base partners prefetched for a list of areas, fetched for this area if None
+        """
+        if references is None:
+            references = await GeoAreaReferences.prefetch([airtable_geo_area_contact])
 
         geocode_dict = None
         if airtable_geo_area_contact.fields.geocode:
@@ -55,11 +61,9 @@ class APIGeoAreaContactData(geo_area_contacts.APIGeoAreaContactData):
             # The Partner table is in its own base and it's referenced by multiple other bases
             # However, the Record IDs are unique to each base. So lookup needs to be performed to
             # translate Record IDs between bases
-            partner_record = airtable_client.get_partner_by_synced_record_id(
-                airtable_geo_area_contact.fields.assigned_rse_synced_record_id
-            )
-
-            rse_data = APIDataBase(id=partner_record.id, type=partner_models.MODEL_TYPE)
+            partner_id = references.partner_ids.get(airtable_geo_area_contact.fields.assigned_rse_synced_record_id)
+            if partner_id is not None:
+                rse_data = APIDataBase(id=partner_id, type=partner_models.MODEL_TYPE)
 
         # hub_link = None
         # if hub_data and hasattr(hub_data, "id"):
@@ -105,17 +109,19 @@ class APIGeoAreaContactData(geo_area_contacts.APIGeoAreaContactData):
 
 class ListAPIGeoAreaContactData(geo_area_contacts.ListAPIGeoAreaContactData):
     @classmethod
-    def from_airtable_geo_area_contacts(
+    async def from_airtable_geo_area_contacts(
         cls,
         airtable_geo_area_contacts: airtable_geo_area_contacts_models.ListAirtableGeoAreaContactResponse,
         url_path_for: Callable,
     ):
-        responses = []
-        for lc in airtable_geo_area_contacts.root:
-            responses.append(
+        references = await GeoAreaReferences.prefetch(airtable_geo_area_contacts.root)
+        responses = await asyncio.gather(
+            *[
                 APIGeoAreaContactData.from_airtable_geo_area_contact(
-                    airtable_geo_area_contact=lc, url_path_for=url_path_for
+                    airtable_geo_area_contact=lc, url_path_for=url_path_for, references=references
                 )
-            )
+                for lc in airtable_geo_area_contacts.root
+            ]
+        )
 
-        return cls(root=responses)
+        return cls(root=list(responses))
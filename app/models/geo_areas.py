@@ -1,5 +1,6 @@
+import asyncio
 import json
-from typing import Callable
+from typing import Callable, Optional
 
 from wf_airtable_api_client.models.geo_areas import *
 from wf_airtable_api_client.models import geo_areas
@@ -7,6 +8,9 @@ from wf_airtable_api_client.models import geo_areas
 from . import response as response_models
 from .response import APIDataBase, APIDataWithFields
 from ..airtable.base_map_by_geographic_area import geo_areas as airtable_geo_areas_models
+from ..airtable.base_map_by_geographic_area import (
+    auto_response_email_template as airtable_auto_response_email_template_models,
+)
 from . import auto_response_email_template as auto_response_email_template_models
 from . import hubs as hub_models
 from . import partners as partner_models
@@ -14,16 +18,58 @@ from ..geocode.geocode_models import Place
 from ..geocode.google_maps_client import GoogleMapsAPI
 
 
+class GeoAreaReferences:
+    """
+    Records geo areas link to in other bases, resolved in bulk for every area in a list before their API models are
+    built rather than one request per area
+    """
+
+    def __init__(
+        self,
+        partner_ids: dict[str, str],
+        auto_response_email_templates: dict[
+            str, airtable_auto_response_email_template_models.AirtableAutoResponseEmailTemplateResponse
+        ],
+    ):
+        # Partner synced record ID -> partner record ID
+        self.partner_ids = partner_ids
+        # Template record ID -> template
+        self.auto_response_email_templates = auto_response_email_templates
+
+    @classmethod
+    async def prefetch(cls, airtable_geo_areas) -> "GeoAreaReferences":
+        from ..airtable.client import AirtableClient
+
+        airtable_client = AirtableClient()
+
+        synced_partner_ids = set()
+        auto_response_email_template_ids = set()
+        for ga in airtable_geo_areas:
+            if ga.fields.assigned_rse_synced_record_id:
+                synced_partner_ids.add(ga.fields.assigned_rse_synced_record_id)
+            auto_response_email_template_ids.update(getattr(ga.fields, "auto_response_email_templates", None) or [])
+
+        partner_ids, auto_response_email_templates = await asyncio.gather(
+            airtable_client.get_partner_ids_by_synced_record_ids(synced_partner_ids),
+            airtable_client.get_auto_response_email_templates_by_ids(auto_response_email_template_ids),
+        )
+        return cls(partner_ids=partner_ids, auto_response_email_templates=auto_response_email_templates)
+
+
 class APIGeoAreaData(geo_areas.APIGeoAreaData):
     @classmethod
-    def from_airtable_geo_area(
+    async def from_airtable_geo_area(
         cls,
         airtable_geo_area: airtable_geo_areas_models.AirtableGeoAreaResponse,
         url_path_for: Callable,
+        references: Optional["GeoAreaReferences"] = None,
     ):
-        from ..airtable.client import AirtableClient
-
-        airtable_client = AirtableClient()
+        """
+        Args:
+            references: Cross-base partners/templates prefetched for a list of areas, fetched for this area if None
+        """
+        if references is None:
+            references = await GeoAreaReferences.prefetch([airtable_geo_area])
 
         geocode_dict = None
         if airtable_geo_area.fields.geocode:
@@ -51,14 +97,12 @@ class APIGeoAreaData(geo_areas.APIGeoAreaData):
             # The Partner table is in its own base and it's referenced by multiple other bases
             # However, the Record IDs are unique to each base. So lookup needs to be performed to
             # translate Record IDs between bases
-            partner_record = airtable_client.get_partner_by_synced_record_id(
-                airtable_geo_area.fields.assigned_rse_synced_record_id
-            )
-
-            rse_data = APIDataBase(id=partner_record.id, type=partner_models.MODEL_TYPE)
-            rse_link = response_models.APILinksAndData(
-                links={"self": url_path_for("get_partner", partner_id=rse_data.id)}, data=rse_data
-            )
+            partner_id = references.partner_ids.get(airtable_geo_area.fields.assigned_rse_synced_record_id)
+            if partner_id is not None:
+                rse_data = APIDataBase(id=partner_id, type=partner_models.MODEL_TYPE)
+                rse_link = response_models.APILinksAndData(
+                    links={"self": url_path_for("get_partner", partner_id=rse_data.id)}, data=rse_data
+                )
 
         hub_link = None
         if hub_data and hasattr(hub_data, "id"):
@@ -69,9 +113,10 @@ class APIGeoAreaData(geo_areas.APIGeoAreaData):
         auto_response_template_links = []
         if airtable_geo_area.fields.auto_response_email_templates:
             for auto_response_template_id in airtable_geo_area.fields.auto_response_email_templates:
-                auto_response_template_record = airtable_client.get_auto_response_email_template_by_id(
-                    auto_response_template_id
-                )
+                auto_response_template_record = references.auto_response_email_templates.get(auto_response_template_id)
+                if auto_response_template_record is None:
+                    continue
+
                 auto_response_template_data = APIDataWithFields(
                     id=auto_response_template_record.id,
                     type=auto_response_email_template_models.MODEL_TYPE,
@@ -110,13 +155,19 @@ class APIGeoAreaData(geo_areas.APIGeoAreaData):
 
 class ListAPIGeoAreaData(geo_areas.ListAPIGeoAreaData):
     @classmethod
-    def from_airtable_geo_areas(
+    async def from_airtable_geo_areas(
         cls,
         airtable_geo_areas: airtable_geo_areas_models.ListAirtableGeoAreaResponse,
         url_path_for: Callable,
     ):
-        responses = []
-        for gac in airtable_geo_areas.root:
-            responses.append(APIGeoAreaData.from_airtable_geo_area(airtable_geo_area=gac, url_path_for=url_path_for))
+        references = await GeoAreaReferences.prefetch(airtable_geo_areas.root)
+        responses = await asyncio.gather(
+            *[
+                APIGeoAreaData.from_airtable_geo_area(
+                    airtable_geo_area=gac, url_path_for=url_path_for, references=references
+                )
+                for gac in airtable_geo_areas.root
+            ]
+        )
 
-        return cls(root=responses)
+        return cls(root=list(responses))
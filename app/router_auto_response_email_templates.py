@@ -1,7 +1,8 @@
-import requests
+import httpx
 from fastapi import APIRouter, Depends, Request, HTTPException
 
 from .airtable.client import AirtableClient
+from .cache import Materialized, MaterializedView
 from .models import auto_response_email_template as auto_response_email_template_models
 from .models import hubs as hub_models
 from .models import partners as partner_models
@@ -21,12 +22,12 @@ router = APIRouter(
 )
 
 
-def fetch_auto_response_email_template_wrapper(auto_response_email_template_id, airtable_client: AirtableClient):
+async def fetch_auto_response_email_template_wrapper(auto_response_email_template_id, airtable_client: AirtableClient):
     try:
-        airtable_auto_response_email_template = airtable_client.get_auto_response_email_template_by_id(
+        airtable_auto_response_email_template = await airtable_client.get_auto_response_email_template_by_id(
             auto_response_email_template_id
         )
-    except requests.exceptions.HTTPError as ex:
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="Auto-Response Email Template not found")
         else:
@@ -35,6 +36,27 @@ def fetch_auto_response_email_template_wrapper(auto_response_email_template_id,
     return airtable_auto_response_email_template
 
 
+_auto_response_email_templates_view = MaterializedView()
+
+
+async def materialized_auto_response_email_templates(request: Request) -> Materialized:
+    """ListAPIAutoResponseEmailTemplateResponse of every template, rebuilt once the templates table is refreshed"""
+    airtable_client = get_airtable_client(request)
+    airtable_auto_response_templates = await airtable_client.list_auto_response_email_templates()
+
+    async def build():
+        data = auto_response_email_template_models.ListAPIAutoResponseEmailTemplateData.from_airtable_auto_response_email_templates(
+            airtable_auto_response_email_templates=airtable_auto_response_templates,
+            url_path_for=request.app.url_path_for,
+        ).root
+
+        return auto_response_email_template_models.ListAPIAutoResponseEmailTemplateResponse(
+            data=data, links={"self": request.app.url_path_for("list_auto_response_email_templates")}
+        )
+
+    return await _auto_response_email_templates_view.get((airtable_auto_response_templates,), build)
+
+
 # Dupe the root route: https://github.com/tiangolo/fastapi/issues/2060
 @router.get(
     "/",
@@ -43,18 +65,7 @@ def fetch_auto_response_email_template_wrapper(auto_response_email_template_id,
 )
 @router.get("", response_model=auto_response_email_template_models.ListAPIAutoResponseEmailTemplateResponse)
 async def list_auto_response_email_templates(request: Request):
-    airtable_client = get_airtable_client(request)
-    airtable_auto_response_templates = airtable_client.list_auto_response_email_templates()
-
-    data = auto_response_email_template_models.ListAPIAutoResponseEmailTemplateData.from_airtable_auto_response_email_templates(
-        airtable_auto_response_email_templates=airtable_auto_response_templates, url_path_for=request.app.url_path_for
-    ).root
-
-    # auto_response_email_template_models.ListAPIAutoResponseEmailTemplateData(data)
-
-    return auto_response_email_template_models.ListAPIAutoResponseEmailTemplateResponse(
-        data=data, links={"self": request.app.url_path_for("list_auto_response_email_templates")}
-    )
+    return (await materialized_auto_response_email_templates(request)).response()
 
 
 @router.get(
@@ -63,7 +74,7 @@ async def list_auto_response_email_templates(request: Request):
 )
 async def get_auto_response_email_template(auto_response_email_template_id, request: Request):
     airtable_client = get_airtable_client(request)
-    airtable_auto_response_email_template = fetch_auto_response_email_template_wrapper(
+    airtable_auto_response_email_template = await fetch_auto_response_email_template_wrapper(
         auto_response_email_template_id, airtable_client
     )
 
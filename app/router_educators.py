@@ -1,9 +1,11 @@
+import asyncio
 from typing import Optional
 
-import requests
+import httpx
 from urllib.parse import unquote, urlencode
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 from .airtable.client import AirtableClient
 from .airtable.base_school_db import (
@@ -15,7 +17,7 @@ from .models import educators as educator_models
 from .models import partners as partner_models
 from .models import schools as school_models
 from . import auth
-from .utils.utils import get_airtable_client
+from .utils.utils import get_airtable_client, ndjson_response
 
 OPENAPI_TAG_METADATA = {"name": educator_models.MODEL_TYPE, "description": "Educators data, including E/TLs and staff"}
 
@@ -27,10 +29,10 @@ router = APIRouter(
 )
 
 
-def fetch_educator_wrapper(educator_id, airtable_client: AirtableClient) -> AirtableEducatorResponse:
+async def fetch_educator_wrapper(educator_id, airtable_client: AirtableClient) -> AirtableEducatorResponse:
     try:
-        airtable_educator = airtable_client.get_educator_by_id(educator_id)
-    except requests.exceptions.HTTPError as ex:
+        airtable_educator = await airtable_client.get_educator_by_id(educator_id)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="Educator not found")
         else:
@@ -39,15 +41,15 @@ def fetch_educator_wrapper(educator_id, airtable_client: AirtableClient) -> Airt
     return airtable_educator
 
 
-def find_educators_wrapper(
+async def find_educators_wrapper(
     email: Optional[str], airtable_client: AirtableClient, load_relationships: bool = True
 ) -> ListAirtableEducatorResponse:
     try:
         filters = {}
         if email:
             filters[airtable_educator_models.AirtableEducatorFields.__fields__["all_emails"].alias] = email
-        airtable_educators = airtable_client.find_educators(filters, load_relationships=load_relationships)
-    except requests.exceptions.HTTPError as ex:
+        airtable_educators = await airtable_client.find_educators(filters, load_relationships=load_relationships)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             return ListAirtableEducatorResponse(root=[])
         else:
@@ -56,14 +58,14 @@ def find_educators_wrapper(
     return airtable_educators
 
 
-def fetch_educator_by_email_wrapper(email, airtable_client: AirtableClient) -> Optional[AirtableEducatorResponse]:
+async def fetch_educator_by_email_wrapper(email, airtable_client: AirtableClient) -> Optional[AirtableEducatorResponse]:
     try:
-        airtable_educators = find_educators_wrapper(email=email, airtable_client=airtable_client)
+        airtable_educators = await find_educators_wrapper(email=email, airtable_client=airtable_client)
         if airtable_educators is None or len(airtable_educators.root) == 0:
             return None
 
         return airtable_educators.root[0]
-    except requests.exceptions.HTTPError as ex:
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             return None
         else:
@@ -75,7 +77,7 @@ def fetch_educator_by_email_wrapper(email, airtable_client: AirtableClient) -> O
 @router.get("", response_model=educator_models.ListAPIEducatorResponse)
 async def list_educators(request: Request, page_size: str = 100, offset: str = ""):
     airtable_client = get_airtable_client(request)
-    airtable_educators, next_offset = airtable_client.list_educators(page_size=page_size, offset=offset)
+    airtable_educators, next_offset = await airtable_client.list_educators(page_size=page_size, offset=offset)
 
     data = educator_models.ListAPIEducatorData.from_airtable_educators(
         airtable_educators=airtable_educators, url_path_for=request.app.url_path_for
@@ -101,14 +103,14 @@ async def create_educator(payload: educator_models.CreateUpdateAPIEducatorFields
         raise HTTPException(status_code=400, detail="Educator email required")
 
     # Is educator pre-existing? Return 409, but add the typeform response to the educator record first
-    existing_educator = fetch_educator_by_email_wrapper(email=payload.email, airtable_client=airtable_client)
+    existing_educator = await fetch_educator_by_email_wrapper(email=payload.email, airtable_client=airtable_client)
     if existing_educator is not None:
         if payload.start_a_school_response_id:
-            airtable_client.add_typeform_start_a_school_response_to_educator(
+            await airtable_client.add_typeform_start_a_school_response_to_educator(
                 educator_id=existing_educator.id, typeform_start_a_school_response_id=payload.start_a_school_response_id
             )
         else:
-            airtable_client.add_fillout_get_involved_response_to_educator(
+            await airtable_client.add_fillout_get_involved_response_to_educator(
                 educator_id=existing_educator.id, fillout_get_involved_response_id=payload.get_involved_response_id
             )
         raise HTTPException(status_code=409, detail="Educator already exists")
@@ -120,36 +122,60 @@ async def create_educator(payload: educator_models.CreateUpdateAPIEducatorFields
 
     # 2. Create the Educator (linked to Contact Info)
     airtable_educator_payload = (
-        payload.to_airtable_educator()
+        await payload.to_airtable_educator()
     )  # deprecated -> contact_info_id=airtable_contact_info_response.id)
-    airtable_educator_response = airtable_client.create_educator(
+    airtable_educator_response = await airtable_client.create_educator(
         payload=airtable_educator_payload, load_relationships=False
     )
 
     # 3. Create the Socio-economic record (linked to educator)
-    airtable_socio_economic_payload = payload.to_airtable_socio_economic(airtable_educator_response.id)
-    airtable_socio_economic_response = airtable_client.create_socio_economic(airtable_socio_economic_payload)
-
     # 4. Create the Language records (linked to socio-economic record)
-    airtable_language_payloads = payload.to_airtable_languages(airtable_socio_economic_response.id)
-    for l in airtable_language_payloads:
-        airtable_client.create_language(l)
+    async def create_socio_economic_and_languages():
+        airtable_socio_economic_payload = await payload.to_airtable_socio_economic(airtable_educator_response.id)
+        airtable_socio_economic_response = await airtable_client.create_socio_economic(airtable_socio_economic_payload)
+
+        airtable_language_payloads = await payload.to_airtable_languages(airtable_socio_economic_response.id)
+        await airtable_client.create_languages(airtable_language_payloads)
 
     # 5. Create the Montessori Certification records (linked to educator)
-    airtable_montessori_certifications_payload = payload.to_airtable_montessori_certifications(
-        airtable_educator_response.id
-    )
-    for m in airtable_montessori_certifications_payload:
-        airtable_client.create_montessori_certification(m)
+    async def create_montessori_certifications():
+        airtable_montessori_certifications_payload = await payload.to_airtable_montessori_certifications(
+            airtable_educator_response.id
+        )
+        await airtable_client.create_montessori_certifications(airtable_montessori_certifications_payload)
+
+    # Both only depend on the educator record, they're written concurrently
+    await asyncio.gather(create_socio_economic_and_languages(), create_montessori_certifications())
 
     return await get_educator(educator_id=airtable_educator_response.id, request=request)
 
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_educators(
+    request: Request, page_size: int = Query(100, ge=1, le=100), load_relationships: bool = False
+):
+    """
+    Every educator as newline delimited JSON (one educator's data per line), all Airtable pages are walked server
+    side and streamed as they arrive. With load_relationships, each page's related records are loaded in batch.
+    """
+    airtable_client = get_airtable_client(request)
+
+    async def pages():
+        async for airtable_educators in airtable_client.iterate_educators(
+            page_size=page_size, load_relationships=load_relationships
+        ):
+            yield educator_models.ListAPIEducatorData.from_airtable_educators(
+                airtable_educators=airtable_educators, url_path_for=request.app.url_path_for
+            ).root
+
+    return await ndjson_response(pages())
+
+
 @router.get("/find", response_model=educator_models.ListAPIEducatorResponse)
 async def find_educators(request: Request, email: Optional[list[str]] = Query(None)):
     airtable_client = get_airtable_client(request)
 
-    airtable_educators = find_educators_wrapper(email=email, airtable_client=airtable_client)
+    airtable_educators = await find_educators_wrapper(email=email, airtable_client=airtable_client)
 
     data = educator_models.ListAPIEducatorData.from_airtable_educators(
         airtable_educators=airtable_educators, url_path_for=request.app.url_path_for
@@ -163,7 +189,7 @@ async def find_educators(request: Request, email: Optional[list[str]] = Query(No
 @router.get("/{educator_id}", response_model=educator_models.APIEducatorResponse)
 async def get_educator(educator_id, request: Request):
     airtable_client = get_airtable_client(request)
-    airtable_educator = fetch_educator_wrapper(educator_id, airtable_client)
+    airtable_educator = await fetch_educator_wrapper(educator_id, airtable_client)
 
     data = educator_models.APIEducatorData.from_airtable_educator(
         airtable_educator=airtable_educator, url_path_for=request.app.url_path_for
@@ -177,14 +203,14 @@ async def get_educator(educator_id, request: Request):
 @router.patch("/{educator_id}", response_model=educator_models.APIEducatorResponse)
 async def update_educator(educator_id, request: Request, payload: educator_models.CreateUpdateAPIEducatorFields):
     airtable_client = get_airtable_client(request)
-    airtable_educator = fetch_educator_wrapper(educator_id, airtable_client)
+    airtable_educator = await fetch_educator_wrapper(educator_id, airtable_client)
 
     if airtable_educator is None:
         raise HTTPException(status_code=400, detail=f"Educator '{educator_id}' doesn't exists")
 
-    airtable_educator_payload = payload.to_airtable_educator(exclude_unset=True)
+    airtable_educator_payload = await payload.to_airtable_educator(exclude_unset=True)
 
-    airtable_educator_response = airtable_client.update_educator(
+    airtable_educator_response = await airtable_client.update_educator(
         record_id=educator_id, payload=airtable_educator_payload
     )
 
@@ -200,8 +226,8 @@ async def update_educator(educator_id, request: Request, payload: educator_model
 @router.get("/{educator_id}/schools", response_model=school_models.ListAPISchoolResponse)
 async def get_educator_schools(educator_id, request: Request):
     airtable_client = get_airtable_client(request)
-    fetch_educator_wrapper(educator_id, airtable_client)
-    airtable_schools = airtable_client.get_schools_by_educator_id(educator_id)
+    await fetch_educator_wrapper(educator_id, airtable_client)
+    airtable_schools = await airtable_client.get_schools_by_educator_id(educator_id)
 
     data = school_models.ListAPISchoolData.from_airtable_schools(
         airtable_schools=airtable_schools, url_path_for=request.app.url_path_for
@@ -215,8 +241,8 @@ async def get_educator_schools(educator_id, request: Request):
 @router.get("/{educator_id}/guides", response_model=partner_models.ListAPIPartnerResponse)
 async def get_educator_guides(educator_id, request: Request):
     airtable_client = get_airtable_client(request)
-    fetch_educator_wrapper(educator_id, airtable_client)
-    airtable_partners = airtable_client.get_partners_by_educator_id(educator_id)
+    await fetch_educator_wrapper(educator_id, airtable_client)
+    airtable_partners = await airtable_client.get_partners_by_educator_id(educator_id)
 
     data = partner_models.ListAPIPartnerData.from_airtable_partners(
         airtable_partners=airtable_partners, url_path_for=request.app.url_path_for
@@ -1,6 +1,6 @@
 from urllib.parse import unquote
 
-import requests
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
 
 from .airtable.client import AirtableClient
@@ -24,12 +24,12 @@ router = APIRouter(
 )
 
 
-def fetch_educator_school_wrapper(
+async def fetch_educator_school_wrapper(
     educator_school_id, airtable_client: AirtableClient
 ) -> AirtableEducatorsSchoolsResponse:
     try:
-        airtable_educator_school = airtable_client.get_educator_school_by_id(educator_school_id)
-    except requests.exceptions.HTTPError as ex:
+        airtable_educator_school = await airtable_client.get_educator_school_by_id(educator_school_id)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="EducatorSchool not found")
         else:
@@ -38,7 +38,7 @@ def fetch_educator_school_wrapper(
     return airtable_educator_school
 
 
-def find_educator_schools_wrapper(
+async def find_educator_schools_wrapper(
     educator_id: Optional[str], school_id: Optional[str], airtable_client: AirtableClient
 ) -> ListAirtableEducatorsSchoolsResponse:
     try:
@@ -47,8 +47,8 @@ def find_educator_schools_wrapper(
             filters[AirtableFindEducatorsSchoolsFields.__fields__["educator_id"].alias] = educator_id
         if school_id:
             filters[AirtableFindEducatorsSchoolsFields.__fields__["school_id"].alias] = school_id
-        educator_schools = airtable_client.find_educator_schools(filters=filters)
-    except requests.exceptions.HTTPError as ex:
+        educator_schools = await airtable_client.find_educator_schools(filters=filters)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             return ListAirtableEducatorsSchoolsResponse(root=[])
         else:
@@ -63,7 +63,7 @@ async def find_educator_schools(
 ):
     airtable_client = get_airtable_client(request)
 
-    matches = find_educator_schools_wrapper(
+    matches = await find_educator_schools_wrapper(
         educator_id=educator_id, school_id=school_id, airtable_client=airtable_client
     )
 
@@ -79,7 +79,7 @@ async def find_educator_schools(
 @router.get("/{educator_school_id}", response_model=educator_school_models.APIEducatorSchoolResponse)
 async def get_educator_school(educator_school_id, request: Request):
     airtable_client = get_airtable_client(request)
-    airtable_educator_school = fetch_educator_school_wrapper(educator_school_id, airtable_client)
+    airtable_educator_school = await fetch_educator_school_wrapper(educator_school_id, airtable_client)
 
     data = educator_school_models.APIEducatorSchoolData.from_airtable_educator_school(
         airtable_educator_school=airtable_educator_school, url_path_for=request.app.url_path_for
@@ -94,24 +94,38 @@ async def get_educator_school(educator_school_id, request: Request):
 @router.post("/", response_model=educator_school_models.APIEducatorSchoolResponse, include_in_schema=False)
 @router.post("", response_model=educator_school_models.APIEducatorSchoolResponse)
 async def create_educator_school(request: Request, payload: educator_school_models.CreateUpdateAPIEducatorSchoolFields):
+    """
+    Link an educator to a school, 409 if they're already linked
+
+    The duplicate check is best-effort: it's a read followed by a create, so concurrent requests for the same
+    educator and school can still both create a link. Airtable can only upsert (merge) on text fields and the
+    Educators x Schools table has no field holding the educator + school pair to merge on.
+    """
     airtable_client = get_airtable_client(request)
 
     if payload.educator_id is None or payload.school_id is None:
         raise HTTPException(status_code=400, detail="Educator id and School id are both required")
 
     # Is educator_id + school_id pre-existing?
-    matches = find_educator_schools_wrapper(
+    matches = await find_educator_schools_wrapper(
         educator_id=payload.educator_id, school_id=payload.school_id, airtable_client=airtable_client
     )
     if matches is not None and len(matches.root) > 0:
         raise HTTPException(status_code=409, detail="Educator and school are already linked")
 
     airtable_educator_schools_payload = payload.to_airtable_educator_schools()
-    airtable_educator_schools_response = airtable_client.create_educator_schools(
-        payload=airtable_educator_schools_payload
+    airtable_educator_school = await airtable_client.create_educator_schools(payload=airtable_educator_schools_payload)
+    # The created record is returned as is rather than read back
+    await airtable_educator_school.load_relationships()
+
+    data = educator_school_models.APIEducatorSchoolData.from_airtable_educator_school(
+        airtable_educator_school=airtable_educator_school, url_path_for=request.app.url_path_for
     )
 
-    return await get_educator_school(educator_school_id=airtable_educator_schools_response.id, request=request)
+    return educator_school_models.APIEducatorSchoolResponse(
+        data=data,
+        links={"self": request.app.url_path_for("get_educator_school", educator_school_id=airtable_educator_school.id)},
+    )
 
 
 @router.put("/{educator_school_id}", response_model=educator_school_models.APIEducatorSchoolResponse)
@@ -121,7 +135,7 @@ async def update_educator_school(
     airtable_client = get_airtable_client(request)
 
     airtable_educator_schools_payload = payload.to_airtable_educator_schools()
-    airtable_educator_schools_response = airtable_client.update_educator_schools(
+    airtable_educator_schools_response = await airtable_client.update_educator_schools(
         record_id=educator_school_id, payload=airtable_educator_schools_payload
     )
     return await get_educator_school(educator_school_id=airtable_educator_schools_response.id, request=request)
@@ -1,12 +1,13 @@
-import copy
-import re
+import asyncio
+import weakref
 from typing import Union, Optional
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-import requests
+import httpx
 
 from .airtable.client import AirtableClient
+from .cache import Materialized, MaterializedView
 from .geocode.google_maps_client import GoogleMapsAPI
 from .geocode import utils as geocode_utils
 from .log import logger
@@ -70,10 +71,133 @@ geo_area_auto_response_email_template_router = APIRouter(
 )
 
 
-def fetch_geo_area_wrapper(geo_area_id, airtable_client: AirtableClient):
+_geo_areas_view = MaterializedView()
+_geo_area_contacts_view = MaterializedView()
+_geo_area_target_communities_view = MaterializedView()
+
+
+async def materialized_geo_areas(request: Request) -> Materialized:
+    """
+    ListAPIGeoAreaResponse of every geo area, rebuilt once the geo areas or the auto-response templates they embed
+    are refreshed
+    """
+    airtable_client = get_airtable_client(request)
+    airtable_geo_areas, airtable_auto_response_email_templates = await asyncio.gather(
+        airtable_client.list_geo_areas(), airtable_client.list_auto_response_email_templates()
+    )
+
+    async def build():
+        data = (
+            await geo_area_models.ListAPIGeoAreaData.from_airtable_geo_areas(
+                airtable_geo_areas=airtable_geo_areas, url_path_for=request.app.url_path_for
+            )
+        ).root
+
+        return geo_area_models.ListAPIGeoAreaResponse(
+            data=data, links={"self": request.app.url_path_for("list_geo_areas")}
+        )
+
+    return await _geo_areas_view.get((airtable_geo_areas, airtable_auto_response_email_templates), build)
+
+
+async def materialized_geo_area_contacts(request: Request) -> Materialized:
+    """ListAPIGeoAreaContactResponse of every geo area contact, rebuilt once the contacts are refreshed"""
+    airtable_client = get_airtable_client(request)
+    airtable_geo_area_contacts = await airtable_client.list_geo_area_contacts()
+
+    async def build():
+        data = (
+            await geo_area_contact_models.ListAPIGeoAreaContactData.from_airtable_geo_area_contacts(
+                airtable_geo_area_contacts=airtable_geo_area_contacts, url_path_for=request.app.url_path_for
+            )
+        ).root
+
+        return geo_area_contact_models.ListAPIGeoAreaContactResponse(
+            data=data, links={"self": request.app.url_path_for("list_geo_area_contacts")}
+        )
+
+    return await _geo_area_contacts_view.get((airtable_geo_area_contacts,), build)
+
+
+async def materialized_geo_area_target_communities(request: Request) -> Materialized:
+    """
+    ListAPIGeoAreaTargetCommunityResponse of every geo area target community, rebuilt once the target communities
+    are refreshed
+    """
+    airtable_client = get_airtable_client(request)
+    airtable_geo_area_target_communities = await airtable_client.list_geo_area_target_communities()
+
+    async def build():
+        data = geo_area_target_community_models.ListAPIGeoAreaTargetCommunityData.from_airtable_geo_area_target_communities(
+            airtable_geo_area_target_communities=airtable_geo_area_target_communities,
+            url_path_for=request.app.url_path_for,
+        ).root
+
+        return geo_area_target_community_models.ListAPIGeoAreaTargetCommunityResponse(
+            data=data, links={"self": request.app.url_path_for("list_geo_area_target_communities")}
+        )
+
+    return await _geo_area_target_communities_view.get((airtable_geo_area_target_communities,), build)
+
+
+# Index name -> (materialized geo area list the index was built from, index)
+_geo_area_indexes: dict[str, tuple[weakref.ref, geocode_utils.GeoAreaIndex]] = {}
+
+
+async def cached_geo_area_index(name: str, materialized: Materialized) -> geocode_utils.GeoAreaIndex:
+    """GeoAreaIndex over a materialized geo area list, only rebuilt along with the list"""
+    cached = _geo_area_indexes.get(name)
+    if cached is not None and cached[0]() is materialized.value:
+        return cached[1]
+
+    index = await geocode_utils.GeoAreaIndex.build(materialized.value.data)
+    _geo_area_indexes[name] = (weakref.ref(materialized.value), index)
+    return index
+
+
+async def get_geo_area_index(request: Request) -> geocode_utils.GeoAreaIndex:
+    return await cached_geo_area_index("geo_areas", await materialized_geo_areas(request))
+
+
+async def get_geo_area_contact_index(request: Request) -> geocode_utils.GeoAreaIndex:
+    return await cached_geo_area_index("geo_area_contacts", await materialized_geo_area_contacts(request))
+
+
+async def get_geo_area_target_community_index(request: Request) -> geocode_utils.GeoAreaIndex:
+    return await cached_geo_area_index(
+        "geo_area_target_communities", await materialized_geo_area_target_communities(request)
+    )
+
+
+# (materialized template list the index was built from, index)
+_auto_response_email_template_index: Optional[
+    tuple[weakref.ref, auto_response_email_template.AutoResponseEmailTemplateIndex]
+] = None
+
+
+async def get_auto_response_email_template_index(
+    request: Request,
+) -> auto_response_email_template.AutoResponseEmailTemplateIndex:
+    """Template decision table, only rebuilt along with the materialized template list"""
+    global _auto_response_email_template_index
+
+    auto_response_email_templates = (
+        await router_auto_response_email_templates.materialized_auto_response_email_templates(request)
+    ).value
+
+    cached = _auto_response_email_template_index
+    if cached is not None and cached[0]() is auto_response_email_templates:
+        return cached[1]
+
+    index = auto_response_email_template.AutoResponseEmailTemplateIndex(auto_response_email_templates.data)
+    _auto_response_email_template_index = (weakref.ref(auto_response_email_templates), index)
+    return index
+
+
+async def fetch_geo_area_wrapper(geo_area_id, airtable_client: AirtableClient):
     try:
-        airtable_geo_area = airtable_client.get_geo_area_by_id(geo_area_id)
-    except requests.exceptions.HTTPError as ex:
+        airtable_geo_area = await airtable_client.get_geo_area_by_id(geo_area_id)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="Geographic Area not found")
         else:
@@ -82,10 +206,10 @@ def fetch_geo_area_wrapper(geo_area_id, airtable_client: AirtableClient):
     return airtable_geo_area
 
 
-def fetch_geo_area_contact_wrapper(geo_area_contact_id, airtable_client: AirtableClient):
+async def fetch_geo_area_contact_wrapper(geo_area_contact_id, airtable_client: AirtableClient):
     try:
-        airtable_geo_area_contact = airtable_client.get_geo_area_contact_by_id(geo_area_contact_id)
-    except requests.exceptions.HTTPError as ex:
+        airtable_geo_area_contact = await airtable_client.get_geo_area_contact_by_id(geo_area_contact_id)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="Geographic Area Contact not found")
         else:
@@ -94,12 +218,12 @@ def fetch_geo_area_contact_wrapper(geo_area_contact_id, airtable_client: Airtabl
     return airtable_geo_area_contact
 
 
-def fetch_geo_area_target_community_wrapper(geo_area_target_community_id, airtable_client: AirtableClient):
+async def fetch_geo_area_target_community_wrapper(geo_area_target_community_id, airtable_client: AirtableClient):
     try:
-        airtable_geo_area_target_community = airtable_client.get_geo_area_target_community_by_id(
+        airtable_geo_area_target_community = await airtable_client.get_geo_area_target_community_by_id(
             geo_area_target_community_id
         )
-    except requests.exceptions.HTTPError as ex:
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="Geographic Area Target Community not found")
         else:
@@ -110,29 +234,21 @@ def fetch_geo_area_target_community_wrapper(geo_area_target_community_id, airtab
 
 @geo_area_router.get("/", response_model=geo_area_models.ListAPIGeoAreaResponse, include_in_schema=False)
 @geo_area_router.get("", response_model=geo_area_models.ListAPIGeoAreaResponse)
-async def list_geo_areas(
-    request: Request,
-) -> geo_area_models.ListAPIGeoAreaResponse:
-    airtable_client = get_airtable_client(request)
-    airtable_geo_areas = airtable_client.list_geo_areas()
-
-    data = geo_area_models.ListAPIGeoAreaData.from_airtable_geo_areas(
-        airtable_geo_areas=airtable_geo_areas, url_path_for=request.app.url_path_for
-    ).root
-
-    return geo_area_models.ListAPIGeoAreaResponse(data=data, links={"self": request.app.url_path_for("list_geo_areas")})
+async def list_geo_areas(request: Request):
+    return (await materialized_geo_areas(request)).response()
 
 
 @geo_area_router.get("/for_address", response_model=geo_area_models.APIGeoAreaResponse)
 async def get_geo_area_given_address(request: Request, address: str):
     gmaps_client = GoogleMapsAPI()
-    place = gmaps_client.geocode_address(address)
+    # The geocode cache and Google client both block, keep them off the event loop
+    place = await asyncio.to_thread(gmaps_client.geocode_address, address)
 
     if place is None:
         logger.warning(f"Unable to geocode address: {address}")
 
-    geo_areas = await list_geo_areas(request)
-    geo_area = geocode_utils.get_geo_area_nearest_to_place(place, geo_areas.data)
+    geo_area_index = await get_geo_area_index(request)
+    geo_area = geo_area_index.nearest(place)
 
     return geo_area_models.APIGeoAreaResponse(
         data=geo_area,
@@ -143,9 +259,9 @@ async def get_geo_area_given_address(request: Request, address: str):
 @geo_area_router.get("/{geo_area_id}", response_model=geo_area_models.APIGeoAreaResponse)
 async def get_geo_area(geo_area_id, request: Request):
     airtable_client = get_airtable_client(request)
-    airtable_geo_area = fetch_geo_area_wrapper(geo_area_id, airtable_client)
+    airtable_geo_area = await fetch_geo_area_wrapper(geo_area_id, airtable_client)
 
-    data = geo_area_models.APIGeoAreaData.from_airtable_geo_area(
+    data = await geo_area_models.APIGeoAreaData.from_airtable_geo_area(
         airtable_geo_area=airtable_geo_area, url_path_for=request.app.url_path_for
     )
 
@@ -159,31 +275,20 @@ async def get_geo_area(geo_area_id, request: Request):
     "/", response_model=geo_area_contact_models.ListAPIGeoAreaContactResponse, include_in_schema=False
 )
 @geo_area_contacts_router.get("", response_model=geo_area_contact_models.ListAPIGeoAreaContactResponse)
-async def list_geo_area_contacts(request: Request) -> geo_area_contact_models.ListAPIGeoAreaContactResponse:
-    airtable_client = get_airtable_client(request)
-    airtable_geo_area_contacts = airtable_client.list_geo_area_contacts()
-
-    data = geo_area_contact_models.ListAPIGeoAreaContactData.from_airtable_geo_area_contacts(
-        airtable_geo_area_contacts=airtable_geo_area_contacts, url_path_for=request.app.url_path_for
-    ).root
-
-    return geo_area_contact_models.ListAPIGeoAreaContactResponse(
-        data=data, links={"self": request.app.url_path_for("list_geo_area_contacts")}
-    )
+async def list_geo_area_contacts(request: Request):
+    return (await materialized_geo_area_contacts(request)).response()
 
 
 @geo_area_contacts_router.get("/for_address", response_model=geo_area_contact_models.APIGeoAreaContactResponse)
 async def get_geo_area_contact_given_address(request: Request, address: str, marketing_source: Union[str, None] = None):
     gmaps_client = GoogleMapsAPI()
-    place = gmaps_client.geocode_address(address)
+    place = await asyncio.to_thread(gmaps_client.geocode_address, address)
 
     if place is None:
         logger.warning(f"Unable to geocode address: {address}")
 
-    geo_area_contacts = await list_geo_area_contacts(request)
-    geo_area_contact = geocode_utils.get_geo_area_nearest_to_place(
-        place=place, geo_areas=geo_area_contacts.data, marketing_source=marketing_source
-    )
+    geo_area_contact_index = await get_geo_area_contact_index(request)
+    geo_area_contact = geo_area_contact_index.nearest(place, marketing_source=marketing_source)
 
     return geo_area_contact_models.APIGeoAreaContactResponse(
         data=geo_area_contact,
@@ -198,9 +303,9 @@ async def get_geo_area_contact_given_address(request: Request, address: str, mar
 )
 async def get_geo_area_contact(geo_area_contact_id, request: Request):
     airtable_client = get_airtable_client(request)
-    airtable_geo_area_contact = fetch_geo_area_contact_wrapper(geo_area_contact_id, airtable_client)
+    airtable_geo_area_contact = await fetch_geo_area_contact_wrapper(geo_area_contact_id, airtable_client)
 
-    data = geo_area_contact_models.APIGeoAreaContactData.from_airtable_geo_area_contact(
+    data = await geo_area_contact_models.APIGeoAreaContactData.from_airtable_geo_area_contact(
         airtable_geo_area_contact=airtable_geo_area_contact, url_path_for=request.app.url_path_for
     )
 
@@ -216,19 +321,8 @@ async def get_geo_area_contact(geo_area_contact_id, request: Request):
 @geo_area_target_community_router.get(
     "", response_model=geo_area_target_community_models.ListAPIGeoAreaTargetCommunityResponse
 )
-async def list_geo_area_target_communities(
-    request: Request,
-) -> geo_area_target_community_models.ListAPIGeoAreaTargetCommunityResponse:
-    airtable_client = get_airtable_client(request)
-    airtable_geo_area_target_communities = airtable_client.list_geo_area_target_communities()
-
-    data = geo_area_target_community_models.ListAPIGeoAreaTargetCommunityData.from_airtable_geo_area_target_communities(
-        airtable_geo_area_target_communities=airtable_geo_area_target_communities, url_path_for=request.app.url_path_for
-    ).root
-
-    return geo_area_target_community_models.ListAPIGeoAreaTargetCommunityResponse(
-        data=data, links={"self": request.app.url_path_for("list_geo_area_target_communities")}
-    )
+async def list_geo_area_target_communities(request: Request):
+    return (await materialized_geo_area_target_communities(request)).response()
 
 
 @geo_area_target_community_router.get(
@@ -236,13 +330,13 @@ async def list_geo_area_target_communities(
 )
 async def get_geo_area_target_community_given_address(request: Request, address: str):
     gmaps_client = GoogleMapsAPI()
-    place = gmaps_client.geocode_address(address)
+    place = await asyncio.to_thread(gmaps_client.geocode_address, address)
 
     if place is None:
         logger.warning(f"Unable to geocode address: {address}")
 
-    geo_area_target_communities = await list_geo_area_target_communities(request)
-    geo_area_target_community = geocode_utils.get_geo_area_nearest_to_place(place, geo_area_target_communities.data)
+    geo_area_target_community_index = await get_geo_area_target_community_index(request)
+    geo_area_target_community = geo_area_target_community_index.nearest(place)
 
     return geo_area_target_community_models.APIGeoAreaTargetCommunityResponse(
         data=geo_area_target_community,
@@ -257,7 +351,7 @@ async def get_geo_area_target_community_given_address(request: Request, address:
 )
 async def get_geo_area_target_community(geo_area_target_community_id, request: Request):
     airtable_client = get_airtable_client(request)
-    airtable_geo_area_target_community = fetch_geo_area_target_community_wrapper(
+    airtable_geo_area_target_community = await fetch_geo_area_target_community_wrapper(
         geo_area_target_community_id, airtable_client
     )
 
@@ -286,115 +380,21 @@ async def get_auto_response_email_templates_given_address(
     marketing_source: Union[str, None] = None,
 ):
     gmaps_client = GoogleMapsAPI()
-    place = gmaps_client.geocode_address(address)
-
-    def lower_and_remove_special_characters(string: Optional[str]) -> Optional[str]:
-        if string is None:
-            return None
-        return re.sub(r"[\W_]", "", string).lower()
+    place = await asyncio.to_thread(gmaps_client.geocode_address, address)
 
     if place is None:
         logger.warning(f"Unable to geocode address: {address}")
 
-    auto_response_email_templates = await router_auto_response_email_templates.list_auto_response_email_templates(
-        request
-    )
-    all_geo_areas = await list_geo_areas(request)
-
-    def match_auto_response_email_templates(
-        auto_responses: list[auto_response_email_template.APIAutoResponseEmailTemplateData],
-        match_marketing_source: bool = True,
-        match_language: bool = True,
-        match_contact_type: bool = True,
-    ):
-
-        _contact_type = copy.copy(contact_type)
-        _language = copy.copy(language)
-        _marketing_source = copy.copy(marketing_source)
-
-        if match_contact_type is False:
-            _contact_type = None
-
-        if match_language is False:
-            _language = None
-
-        if match_marketing_source is False:
-            _marketing_source = None
-
-        filtered_auto_response_email_templates = []
-        for auto_response in auto_responses:
-            if (
-                (
-                    (
-                        _contact_type is not None
-                        and lower_and_remove_special_characters(_contact_type)
-                        == lower_and_remove_special_characters(auto_response.fields.contact_type)
-                    )
-                    or lower_and_remove_special_characters(auto_response.fields.contact_type) == "any"
-                )
-                and (
-                    (
-                        _language is not None
-                        and lower_and_remove_special_characters(_language)
-                        == lower_and_remove_special_characters(auto_response.fields.language)
-                    )
-                    or lower_and_remove_special_characters(auto_response.fields.language) in ["any", "english"]
-                )
-                and (
-                    lower_and_remove_special_characters(_marketing_source)
-                    == lower_and_remove_special_characters(auto_response.fields.marketing_source)
-                )
-            ):
-                filtered_auto_response_email_templates.append(auto_response)
-
-        filtered_geo_areas = []
-        for geo_area in all_geo_areas.data:
-            for auto_response in filtered_auto_response_email_templates:
-                if geo_area.id in auto_response.fields.geographic_areas:
-                    filtered_geo_areas.append(geo_area)
-
-        auto_response_template = None
-        if len(filtered_geo_areas) > 0:
-            geo_area = geocode_utils.get_geo_area_nearest_to_place(place, filtered_geo_areas)
-
-            if geo_area is not None:
-                auto_response_template = list(
-                    filter(lambda r: geo_area.id in r.fields.geographic_areas, filtered_auto_response_email_templates)
-                )
-                if len(auto_response_template) > 0:
-                    auto_response_template = auto_response_template[0]
-        return auto_response_template
-
-    matched_template = match_auto_response_email_templates(
-        auto_responses=auto_response_email_templates.data,
-        match_marketing_source=True,
-        match_language=True,
-        match_contact_type=True,
-    )
-
-    if matched_template is None:
-        matched_template = match_auto_response_email_templates(
-            auto_responses=auto_response_email_templates.data,
-            match_marketing_source=False,
-            match_language=True,
-            match_contact_type=True,
-        )
+    auto_response_email_template_index = await get_auto_response_email_template_index(request)
+    geo_area_index = await get_geo_area_index(request)
 
-    if matched_template is None:
-        matched_template = match_auto_response_email_templates(
-            auto_responses=auto_response_email_templates.data,
-            match_marketing_source=False,
-            match_language=False,
-            match_contact_type=True,
-        )
-
-    if matched_template is None:
-        matched_template = match_auto_response_email_templates(
-            auto_responses=auto_response_email_templates.data,
-            match_marketing_source=False,
-            match_language=False,
-            match_contact_type=False,
-        )
+    matched_template = auto_response_email_template_index.match(
+        place,
+        geo_area_index,
+        contact_type=contact_type,
+        language=language,
+        marketing_source=marketing_source,
+    )
 
     if matched_template is None:
         raise HTTPException(status_code=404, detail="No valid auto-response email template found for given address")
@@ -1,4 +1,4 @@
-import requests
+import httpx
 from fastapi import APIRouter, Depends, Request, HTTPException
 
 from .airtable.client import AirtableClient
@@ -20,10 +20,10 @@ router = APIRouter(
 )
 
 
-def fetch_hub_wrapper(hub_id, airtable_client: AirtableClient):
+async def fetch_hub_wrapper(hub_id, airtable_client: AirtableClient):
     try:
-        airtable_hub = airtable_client.get_hub_by_id(hub_id)
-    except requests.exceptions.HTTPError as ex:
+        airtable_hub = await airtable_client.get_hub_by_id(hub_id)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="Hub not found")
         else:
@@ -37,7 +37,7 @@ def fetch_hub_wrapper(hub_id, airtable_client: AirtableClient):
 @router.get("", response_model=hub_models.ListAPIHubResponse)
 async def list_hubs(request: Request):
     airtable_client = get_airtable_client(request)
-    airtable_hubs = airtable_client.list_hubs()
+    airtable_hubs = await airtable_client.list_hubs()
 
     data = hub_models.ListAPIHubData.from_airtable_hubs(
         airtable_hubs=airtable_hubs, url_path_for=request.app.url_path_for
@@ -49,7 +49,7 @@ async def list_hubs(request: Request):
 @router.get("/{hub_id}", response_model=hub_models.APIHubResponse)
 async def get_hub(hub_id, request: Request):
     airtable_client = get_airtable_client(request)
-    airtable_hub = fetch_hub_wrapper(hub_id, airtable_client)
+    airtable_hub = await fetch_hub_wrapper(hub_id, airtable_client)
 
     data = hub_models.APIHubData.from_airtable_hub(airtable_hub=airtable_hub, url_path_for=request.app.url_path_for)
 
@@ -59,8 +59,8 @@ async def get_hub(hub_id, request: Request):
 @router.get("/{hub_id}/regional_site_entrepreneurs", response_model=partner_models.ListAPIPartnerResponse)
 async def get_hub_site_entrepreneurs(hub_id, request: Request):
     airtable_client = get_airtable_client(request)
-    fetch_hub_wrapper(hub_id, airtable_client)
-    airtable_partners = airtable_client.get_partners_by_hub_id(hub_id)
+    await fetch_hub_wrapper(hub_id, airtable_client)
+    airtable_partners = await airtable_client.get_partners_by_hub_id(hub_id)
 
     data = partner_models.ListAPIPartnerData.from_airtable_partners(
         airtable_partners=airtable_partners, url_path_for=request.app.url_path_for
@@ -89,8 +89,8 @@ async def get_hub_site_entrepreneurs(hub_id, request: Request):
 @router.get("/{hub_id}/schools", response_model=school_models.ListAPISchoolResponse)
 async def get_hub_schools(hub_id, request: Request):
     airtable_client = get_airtable_client(request)
-    fetch_hub_wrapper(hub_id, airtable_client)
-    airtable_schools = airtable_client.get_schools_by_hub_id(hub_id)
+    await fetch_hub_wrapper(hub_id, airtable_client)
+    airtable_schools = await airtable_client.get_schools_by_hub_id(hub_id)
 
     data = school_models.ListAPISchoolData.from_airtable_schools(
         airtable_schools=airtable_schools, url_path_for=request.app.url_path_for
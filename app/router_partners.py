@@ -1,4 +1,4 @@
-import requests
+import httpx
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -26,10 +26,10 @@ router = APIRouter(
 )
 
 
-def fetch_partner_wrapper(partner_id, airtable_client: AirtableClient):
+async def fetch_partner_wrapper(partner_id, airtable_client: AirtableClient):
     try:
-        airtable_partner = airtable_client.get_partner_by_id(partner_id)
-    except requests.exceptions.HTTPError as ex:
+        airtable_partner = await airtable_client.get_partner_by_id(partner_id)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="Partner not found")
         else:
@@ -43,7 +43,7 @@ def fetch_partner_wrapper(partner_id, airtable_client: AirtableClient):
 @router.get("", response_model=partner_models.ListAPIPartnerResponse)
 async def list_partners(request: Request, page_size: str = 100, offset: str = ""):
     airtable_client = request.state.airtable_client
-    airtable_partners, next_offset = airtable_client.list_partners(page_size=page_size, offset=offset)
+    airtable_partners, next_offset = await airtable_client.list_partners(page_size=page_size, offset=offset)
 
     data = partner_models.ListAPIPartnerData.from_airtable_partners(
         airtable_partners=airtable_partners, url_path_for=request.app.url_path_for
@@ -63,7 +63,7 @@ async def list_partners(request: Request, page_size: str = 100, offset: str = ""
 @router.get("/{partner_id}", response_model=partner_models.APIPartnerResponse)
 async def get_partner(partner_id, request: Request):
     airtable_client = request.state.airtable_client
-    airtable_partner = fetch_partner_wrapper(partner_id, airtable_client)
+    airtable_partner = await fetch_partner_wrapper(partner_id, airtable_client)
 
     data = partner_models.APIPartnerData.from_airtable_partner(
         airtable_partner=airtable_partner, url_path_for=request.app.url_path_for
@@ -77,8 +77,8 @@ async def get_partner(partner_id, request: Request):
 @router.get("/{partner_id}/hubs_as_entrepreneur", response_model=hub_models.ListAPIHubResponse)
 async def get_partner_hubs_as_entrepreneur(partner_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_partner_wrapper(partner_id, airtable_client)
-    airtable_hubs = airtable_client.get_hubs_by_entrepreneur_id(partner_id)
+    await fetch_partner_wrapper(partner_id, airtable_client)
+    airtable_hubs = await airtable_client.get_hubs_by_entrepreneur_id(partner_id)
 
     data = hub_models.ListAPIHubData.from_airtable_hubs(
         airtable_hubs=airtable_hubs, url_path_for=request.app.url_path_for
@@ -107,8 +107,8 @@ async def get_partner_hubs_as_entrepreneur(partner_id, request: Request):
 @router.get("/{partner_id}/schools_guiding", response_model=school_models.ListAPISchoolResponse)
 async def get_guides_schools(partner_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_partner_wrapper(partner_id, airtable_client)
-    airtable_schools = airtable_client.get_schools_by_guide_id(partner_id)
+    await fetch_partner_wrapper(partner_id, airtable_client)
+    airtable_schools = await airtable_client.get_schools_by_guide_id(partner_id)
 
     data = school_models.ListAPISchoolData.from_airtable_schools(
         airtable_schools=airtable_schools, url_path_for=request.app.url_path_for
@@ -122,8 +122,8 @@ async def get_guides_schools(partner_id, request: Request):
 @router.get("/{partner_id}/educators_guiding", response_model=educator_models.ListAPIEducatorResponse)
 async def get_guides_educators(partner_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_partner_wrapper(partner_id, airtable_client)
-    airtable_educators = airtable_client.get_educators_by_guide_id(partner_id)
+    await fetch_partner_wrapper(partner_id, airtable_client)
+    airtable_educators = await airtable_client.get_educators_by_guide_id(partner_id)
 
     data = educator_models.ListAPIEducatorData.from_airtable_educators(
         airtable_educators=airtable_educators, url_path_for=request.app.url_path_for
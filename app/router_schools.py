@@ -1,9 +1,10 @@
 from typing import Optional
 
-import requests
+import httpx
 from urllib.parse import urlencode, unquote
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 from .airtable.client import AirtableClient
 from .airtable.base_school_db import schools as airtable_school_models
@@ -14,7 +15,7 @@ from .models import partners as partner_models
 # from .models import pods as pod_models
 from .models import schools as school_models
 from . import auth
-from .utils.utils import get_airtable_client
+from .utils.utils import get_airtable_client, ndjson_response
 
 OPENAPI_TAG_METADATA = {"name": school_models.MODEL_TYPE, "description": "Schools data"}
 
@@ -26,10 +27,10 @@ router = APIRouter(
 )
 
 
-def fetch_school_wrapper(school_id, airtable_client: AirtableClient):
+async def fetch_school_wrapper(school_id, airtable_client: AirtableClient):
     try:
-        airtable_school = airtable_client.get_school_by_id(school_id)
-    except requests.exceptions.HTTPError as ex:
+        airtable_school = await airtable_client.get_school_by_id(school_id)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="School not found")
         else:
@@ -38,10 +39,10 @@ def fetch_school_wrapper(school_id, airtable_client: AirtableClient):
     return airtable_school
 
 
-def find_schools_wrapper(filters, airtable_client: AirtableClient):
+async def find_schools_wrapper(filters, airtable_client: AirtableClient):
     try:
-        airtable_schools = airtable_client.find_schools(filters)
-    except requests.exceptions.HTTPError as ex:
+        airtable_schools = await airtable_client.find_schools(filters)
+    except httpx.HTTPStatusError as ex:
         if ex.response.status_code == 404:
             raise HTTPException(status_code=404, detail="Educator records not found")
         else:
@@ -55,7 +56,7 @@ def find_schools_wrapper(filters, airtable_client: AirtableClient):
 @router.get("", response_model=school_models.ListAPISchoolResponse)
 async def list_schools(request: Request, page_size: str = 100, offset: str = ""):
     airtable_client = request.state.airtable_client
-    airtable_schools, next_offset = airtable_client.list_schools(page_size=page_size, offset=offset)
+    airtable_schools, next_offset = await airtable_client.list_schools(page_size=page_size, offset=offset)
 
     data = school_models.ListAPISchoolData.from_airtable_schools(
         airtable_schools=airtable_schools, url_path_for=request.app.url_path_for
@@ -72,6 +73,23 @@ async def list_schools(request: Request, page_size: str = 100, offset: str = "")
     return school_models.ListAPISchoolResponse(data=data, links=links, meta={"offset": next_offset})
 
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_schools(request: Request, page_size: int = Query(100, ge=1, le=100)):
+    """
+    Every school as newline delimited JSON (one school's data per line), all Airtable pages are walked server side
+    and streamed as they arrive
+    """
+    airtable_client = get_airtable_client(request)
+
+    async def pages():
+        async for airtable_schools in airtable_client.iterate_schools(page_size=page_size):
+            yield school_models.ListAPISchoolData.from_airtable_schools(
+                airtable_schools=airtable_schools, url_path_for=request.app.url_path_for
+            ).root
+
+    return await ndjson_response(pages())
+
+
 @router.get("/find", response_model=school_models.ListAPISchoolResponse)
 async def find_schools(request: Request, organizational_unit: Optional[str] = None):
     airtable_client = get_airtable_client(request)
@@ -82,7 +100,7 @@ async def find_schools(request: Request, organizational_unit: Optional[str] = No
             organizational_unit
         )
 
-    airtable_schools = find_schools_wrapper(filters, airtable_client)
+    airtable_schools = await find_schools_wrapper(filters, airtable_client)
 
     data = school_models.ListAPISchoolData.from_airtable_schools(
         airtable_schools=airtable_schools, url_path_for=request.app.url_path_for
@@ -96,7 +114,7 @@ async def find_schools(request: Request, organizational_unit: Optional[str] = No
 @router.get("/{school_id}", response_model=school_models.APISchoolResponse)
 async def get_school(school_id, request: Request):
     airtable_client = request.state.airtable_client
-    airtable_school = fetch_school_wrapper(school_id, airtable_client)
+    airtable_school = await fetch_school_wrapper(school_id, airtable_client)
 
     if airtable_school is None:
         raise HTTPException(status_code=404, detail="School not found")
@@ -113,8 +131,8 @@ async def get_school(school_id, request: Request):
 @router.get("/{school_id}/hub", response_model=hub_models.APIHubResponse)
 async def get_school_hub(school_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_school_wrapper(school_id, airtable_client)
-    airtable_hub = airtable_client.get_hub_by_school_id(school_id)
+    await fetch_school_wrapper(school_id, airtable_client)
+    airtable_hub = await airtable_client.get_hub_by_school_id(school_id)
 
     if airtable_hub is None:
         raise HTTPException(status_code=404, detail="School Hub not found")
@@ -145,8 +163,8 @@ async def get_school_hub(school_id, request: Request):
 @router.get("/{school_id}/guides_and_entrepreneurs", response_model=partner_models.ListAPIPartnerResponse)
 async def get_school_guides_and_entrepreneurs(school_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_school_wrapper(school_id, airtable_client)
-    airtable_partners = airtable_client.get_guides_by_school_id(school_id)
+    await fetch_school_wrapper(school_id, airtable_client)
+    airtable_partners = await airtable_client.get_guides_by_school_id(school_id)
 
     data = partner_models.ListAPIPartnerData.from_airtable_partners(
         airtable_partners=airtable_partners, url_path_for=request.app.url_path_for
@@ -160,8 +178,8 @@ async def get_school_guides_and_entrepreneurs(school_id, request: Request):
 @router.get("/{school_id}/primary_contacts", response_model=educator_models.ListAPIEducatorResponse)
 async def get_school_primary_contacts(school_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_school_wrapper(school_id, airtable_client)
-    airtable_educators = airtable_client.get_primary_contacts_by_school_id(school_id)
+    await fetch_school_wrapper(school_id, airtable_client)
+    airtable_educators = await airtable_client.get_primary_contacts_by_school_id(school_id)
 
     data = educator_models.ListAPIEducatorData.from_airtable_educators(
         airtable_educators=airtable_educators, url_path_for=request.app.url_path_for
@@ -175,8 +193,8 @@ async def get_school_primary_contacts(school_id, request: Request):
 @router.get("/{school_id}/educators", response_model=educator_models.ListAPIEducatorResponse)
 async def get_school_educators(school_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_school_wrapper(school_id, airtable_client)
-    airtable_educators = airtable_client.get_all_educators_by_school_id(school_id)
+    await fetch_school_wrapper(school_id, airtable_client)
+    airtable_educators = await airtable_client.get_all_educators_by_school_id(school_id)
 
     data = educator_models.ListAPIEducatorData.from_airtable_educators(
         airtable_educators=airtable_educators, url_path_for=request.app.url_path_for
@@ -190,8 +208,8 @@ async def get_school_educators(school_id, request: Request):
 @router.get("/{school_id}/current_educators", response_model=educator_models.ListAPIEducatorResponse)
 async def get_school_current_educators(school_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_school_wrapper(school_id, airtable_client)
-    airtable_educators = airtable_client.get_current_educators_by_school_id(school_id)
+    await fetch_school_wrapper(school_id, airtable_client)
+    airtable_educators = await airtable_client.get_current_educators_by_school_id(school_id)
 
     data = educator_models.ListAPIEducatorData.from_airtable_educators(
         airtable_educators=airtable_educators, url_path_for=request.app.url_path_for
@@ -205,8 +223,8 @@ async def get_school_current_educators(school_id, request: Request):
 @router.get("/{school_id}/current_tls", response_model=educator_models.ListAPIEducatorResponse)
 async def get_school_current_tls(school_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_school_wrapper(school_id, airtable_client)
-    airtable_educators = airtable_client.get_current_tls_by_school_id(school_id)
+    await fetch_school_wrapper(school_id, airtable_client)
+    airtable_educators = await airtable_client.get_current_tls_by_school_id(school_id)
 
     data = educator_models.ListAPIEducatorData.from_airtable_educators(
         airtable_educators=airtable_educators, url_path_for=request.app.url_path_for
@@ -220,8 +238,8 @@ async def get_school_current_tls(school_id, request: Request):
 @router.get("/{school_id}/founders", response_model=educator_models.ListAPIEducatorResponse)
 async def get_school_founders(school_id, request: Request):
     airtable_client = request.state.airtable_client
-    fetch_school_wrapper(school_id, airtable_client)
-    airtable_educators = airtable_client.get_founders_by_school_id(school_id)
+    await fetch_school_wrapper(school_id, airtable_client)
+    airtable_educators = await airtable_client.get_founders_by_school_id(school_id)
 
     data = educator_models.ListAPIEducatorData.from_airtable_educators(
         airtable_educators=airtable_educators, url_path_for=request.app.url_path_for
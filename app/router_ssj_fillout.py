@@ -24,7 +24,7 @@ async def create_get_involved_response(
     airtable_client = get_airtable_client(request)
 
     airtable_payload = payload.to_airtable()
-    airtable_response = airtable_client.create_fillout_get_involved_response(payload=airtable_payload)
+    airtable_response = await airtable_client.create_fillout_get_involved_response(payload=airtable_payload)
 
     data = ssj_fillout_get_involved_models.ApiSSJFilloutGetInvolvedData.from_airtable(
         airtable_get_involved=airtable_response, url_path_for=request.app.url_path_for
@@ -1,7 +1,35 @@
+from typing import AsyncIterator, Iterable
+
 from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
 from ..airtable.client import AirtableClient
 
 
 def get_airtable_client(request: Request) -> AirtableClient:
     return request.state.airtable_client
+
+
+async def ndjson_response(pages: AsyncIterator[Iterable[BaseModel]]) -> StreamingResponse:
+    """
+    Stream models as newline delimited JSON, one line per model, written as each page arrives
+
+    The first page is awaited before the response is built, a failure fetching it (an Airtable 422, a 429 still
+    failing after retries...) is raised to the exception handlers and answered with a proper status rather than an
+    empty 200. Later pages can only cut the stream short.
+    """
+    try:
+        first_page = await pages.__anext__()
+    except StopAsyncIteration:
+        first_page = []
+
+    def dump(page: Iterable[BaseModel]) -> str:
+        return "".join(f"{item.model_dump_json(by_alias=True)}\n" for item in page)
+
+    async def lines():
+        yield dump(first_page)
+        async for page in pages:
+            yield dump(page)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -0,0 +1,188 @@
+import json
+import os
+import re
+import tempfile
+from collections import defaultdict
+from typing import NamedTuple, Optional
+from urllib.parse import unquote
+
+# Settings are read when app.const is imported, tests never touch Airtable, Auth0 or a shared cache
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["AIRTABLE_RATE_LIMIT"] = "1000"
+os.environ["AIRTABLE_REPLICA_ENABLED"] = "false"
+os.environ["GEOCODE_CACHE_SQLITE_PATH"] = os.path.join(tempfile.mkdtemp(), "geocode.sqlite3")
+
+import httpx
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+
+from app import auth
+from app.airtable.api import Api
+from app.airtable.client import AirtableClient
+
+RECORD_ID_MATCH = re.compile(r"'([^']*)'=RECORD_ID\(\)")
+FIND_MATCH = re.compile(r"FIND\('([^']*)', ARRAYJOIN\(\{([^}]*)\}\)\)")
+
+
+def record(record_id: str, fields: dict) -> dict:
+    return {"id": record_id, "createdTime": "2022-04-16T06:43:56.000Z", "fields": fields}
+
+
+class FakeRequest(NamedTuple):
+    method: str
+    table: str
+    record_id: Optional[str]
+    params: dict
+    json: Optional[dict]
+
+
+class FakeAirtable:
+    """
+    Stands in for Airtable's REST API, serving (and recording) requests against in-memory tables
+
+    Only the formulas the client builds are understood: RECORD_ID() matches and FIND()s, where a record must
+    match one of the FIND()s on each field they test.
+    """
+
+    def __init__(self):
+        self.tables: dict[str, list[dict]] = defaultdict(list)
+        self.requests: list[FakeRequest] = []
+        # Table -> (status, body) every request to the table is answered with
+        self.failures: dict[str, tuple[int, dict]] = {}
+        self._created = 0
+
+    def add(self, table: str, record_id: str, fields: dict) -> dict:
+        r = record(record_id, fields)
+        self.tables[table].append(r)
+        return r
+
+    def requests_to(self, table: str, method: Optional[str] = None) -> list[FakeRequest]:
+        return [r for r in self.requests if r.table == table and (method is None or r.method == method)]
+
+    def _new_record(self, table: str, fields: dict) -> dict:
+        self._created += 1
+        return self.add(table, f"recNEW{self._created:05d}", dict(fields))
+
+    def _get_record(self, table: str, record_id: str) -> Optional[dict]:
+        return next((r for r in self.tables[table] if r["id"] == record_id), None)
+
+    @staticmethod
+    def _matches(r: dict, formula: Optional[str]) -> bool:
+        if not formula:
+            return True
+
+        record_ids = RECORD_ID_MATCH.findall(formula)
+        if len(record_ids) > 0 and r["id"] not in record_ids:
+            return False
+
+        finds = defaultdict(list)
+        for value, field in FIND_MATCH.findall(formula):
+            finds[field].append(value)
+        for field, values in finds.items():
+            field_value = r["fields"].get(field)
+            joined = ",".join(field_value) if isinstance(field_value, list) else str(field_value or "")
+            if not any(v in joined for v in values):
+                return False
+
+        return True
+
+    def _list(self, table: str, options: dict) -> httpx.Response:
+        records = [r for r in self.tables[table] if self._matches(r, options.get("filterByFormula"))]
+        if options.get("maxRecords"):
+            records = records[: int(options["maxRecords"])]
+
+        offset = int(options.get("offset") or 0)
+        page_size = int(options.get("pageSize") or 100)
+        body = {"records": records[offset : offset + page_size]}
+        if offset + page_size < len(records):
+            body["offset"] = str(offset + page_size)
+        return httpx.Response(200, json=body)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        # /v0/<base>/<table>[/<record id> | /listRecords]
+        path = [unquote(p) for p in request.url.path.split("/")[3:]]
+        table, rest = path[0], path[1:]
+        body = json.loads(request.content) if request.content else None
+        params = dict(request.url.params)
+
+        record_id = rest[0] if len(rest) > 0 and rest[0] != "listRecords" else None
+        self.requests.append(FakeRequest(request.method, table, record_id, params, body))
+
+        if table in self.failures:
+            status, error = self.failures[table]
+            return httpx.Response(status, json=error)
+
+        if record_id is not None:
+            r = self._get_record(table, record_id)
+            if r is None:
+                return httpx.Response(404, json={"error": "NOT_FOUND"})
+            if request.method in ("PATCH", "PUT"):
+                r["fields"] = body["fields"] if request.method == "PUT" else {**r["fields"], **body["fields"]}
+            return httpx.Response(200, json=r)
+
+        if request.method == "GET":
+            return self._list(table, params)
+        if request.method == "POST" and rest == ["listRecords"]:
+            return self._list(table, {**params, **body})
+
+        if request.method == "POST":
+            if "records" not in body:
+                return httpx.Response(200, json=self._new_record(table, body["fields"]))
+            return httpx.Response(
+                200, json={"records": [self._new_record(table, r["fields"]) for r in body["records"]]}
+            )
+
+        updated = []
+        for r in body["records"]:
+            existing = self._get_record(table, r["id"])
+            existing["fields"] = r["fields"] if request.method == "PUT" else {**existing["fields"], **r["fields"]}
+            updated.append(existing)
+        return httpx.Response(200, json={"records": updated})
+
+
+def fake_session(fake: FakeAirtable) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(fake.handle))
+
+
+def reset_airtable_client(client: AirtableClient):
+    """Drop everything the singleton client remembers between tests"""
+    for attr in vars(AirtableClient).values():
+        if hasattr(attr, "cache_lock"):
+            with attr.cache_lock:
+                attr.cache.clear()
+
+    client.client_api.cursors.pages.clear()
+    client.client_api.unprojected_urls.clear()
+    client._partner_ids_by_synced_record_id.clear()
+    client._field_mapping_index = None
+
+
+@pytest.fixture
+def airtable() -> FakeAirtable:
+    return FakeAirtable()
+
+
+@pytest.fixture
+def api(airtable) -> Api:
+    api = Api("key", rate_limit=1000)
+    api._session = fake_session(airtable)
+    return api
+
+
+@pytest.fixture
+def client(airtable, monkeypatch) -> TestClient:
+    """Test client for the app, authorized for every route and backed by the airtable fixture"""
+
+    async def authorized(self, request: Request):
+        return None
+
+    monkeypatch.setattr(auth.JWTBearer, "__call__", authorized)
+
+    airtable_client = AirtableClient()
+    reset_airtable_client(airtable_client)
+    monkeypatch.setattr(airtable_client.client_api, "_session", fake_session(airtable))
+
+    from app.main import app
+
+    return TestClient(app)
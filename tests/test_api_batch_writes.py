@@ -0,0 +1,40 @@
+import asyncio
+
+TABLE = "Things"
+
+
+def test_batch_create_writes_ten_records_per_request(api, airtable):
+    records = asyncio.run(api.table("appTEST", TABLE).batch_create([{"Name": f"Thing {i}"} for i in range(25)]))
+
+    assert [r["fields"]["Name"] for r in records] == [f"Thing {i}" for i in range(25)]
+
+    requests = airtable.requests_to(TABLE, "POST")
+    assert [len(r.json["records"]) for r in requests] == [10, 10, 5]
+    assert requests[0].json["records"][0] == {"fields": {"Name": "Thing 0"}}
+
+
+def test_batch_create_makes_no_request_for_no_records(api, airtable):
+    assert asyncio.run(api.table("appTEST", TABLE).batch_create([])) == []
+    assert airtable.requests == []
+
+
+def test_batch_update_patches_ten_records_per_request(api, airtable):
+    for i in range(12):
+        airtable.add(TABLE, f"rec{i}", {"Name": f"Thing {i}", "Count": i})
+
+    updates = [{"id": f"rec{i}", "fields": {"Name": f"Renamed {i}"}} for i in range(12)]
+    records = asyncio.run(api.table("appTEST", TABLE).batch_update(updates))
+
+    assert [r["fields"] for r in records] == [{"Name": f"Renamed {i}", "Count": i} for i in range(12)]
+    assert [len(r.json["records"]) for r in airtable.requests_to(TABLE, "PATCH")] == [10, 2]
+
+
+def test_batch_update_replace_puts_records(api, airtable):
+    airtable.add(TABLE, "rec1", {"Name": "Thing", "Count": 1})
+
+    records = asyncio.run(
+        api.table("appTEST", TABLE).batch_update([{"id": "rec1", "fields": {"Name": "Renamed"}}], replace=True)
+    )
+
+    assert records[0]["fields"] == {"Name": "Renamed"}
+    assert len(airtable.requests_to(TABLE, "PUT")) == 1
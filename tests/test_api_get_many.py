@@ -0,0 +1,29 @@
+import asyncio
+
+from app.airtable.api import Api
+
+TABLE = "Things"
+
+
+def test_get_many_makes_no_request_for_no_ids(api, airtable):
+    records = asyncio.run(api.table("appTEST", TABLE).get_many([]))
+
+    assert records == []
+    assert airtable.requests == []
+
+
+def test_get_many_chunks_formulas_and_keeps_id_order(api, airtable):
+    record_ids = [f"rec{i:014d}" for i in range(600)]
+    for r_id in record_ids:
+        airtable.add(TABLE, r_id, {"Name": r_id})
+
+    requested = list(reversed(record_ids)) + [record_ids[0], "recMISSING", None]
+    records = asyncio.run(api.table("appTEST", TABLE).get_many(requested))
+
+    assert [r["id"] for r in records] == list(reversed(record_ids))
+
+    requests = airtable.requests_to(TABLE)
+    assert len(requests) > 1
+    for request in requests:
+        assert request.method == "GET"
+        assert len(request.params["filterByFormula"]) <= Api.MAX_FORMULA_LENGTH
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app import auth, const
+from app.auth import AuthError, JWKSCache, JWTBearer, verified_claims
+from app.utils.singleton import Singleton
+
+AUDIENCE = "https://api.example.org"
+DOMAIN = "tenant.example.org"
+
+
+class FakeJWKClient:
+    """Stands in for jwt.PyJWKClient, serving (and counting fetches of) whichever keys the test sets"""
+
+    def __init__(self, *keys: dict):
+        self.keys = list(keys)
+        self.fetches = 0
+        self.fail = False
+
+    def get_jwk_set(self) -> jwt.PyJWKSet:
+        self.fetches += 1
+        if self.fail:
+            raise jwt.exceptions.PyJWKClientError("Auth0 is down")
+        return jwt.PyJWKSet.from_dict({"keys": self.keys})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def signing_key(kid: str) -> tuple[rsa.RSAPrivateKey, dict]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    return private_key, {**public_jwk, "kid": kid, "use": "sig", "alg": "RS256"}
+
+
+@pytest.fixture(scope="module")
+def keys() -> dict[str, tuple[rsa.RSAPrivateKey, dict]]:
+    return {kid: signing_key(kid) for kid in ("key1", "key2")}
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(auth.time, "monotonic", clock.monotonic)
+    return clock
+
+
+@pytest.fixture
+def jwks(keys, monkeypatch) -> JWKSCache:
+    monkeypatch.setattr(const, "AUTH0_DOMAIN", DOMAIN)
+    monkeypatch.setattr(const, "AUTH0_AUDIENCE", AUDIENCE)
+
+    cache = JWKSCache.__new__(JWKSCache)
+    cache.__init__(lifespan=3600, min_refresh_interval=30)
+    cache.client = FakeJWKClient(keys["key1"][1])
+    monkeypatch.setitem(Singleton._instances, JWKSCache, cache)
+
+    verified_claims.clear()
+    yield cache
+    verified_claims.clear()
+
+
+def token(keys, kid: str = "key1", **claims) -> str:
+    payload = {"iss": f"https://{DOMAIN}/", "aud": AUDIENCE, "exp": int(time.time()) + 3600, **claims}
+    return jwt.encode(payload, keys[kid][0], algorithm="RS256", headers={"kid": kid})
+
+
+def test_key_set_is_fetched_once_per_lifespan(jwks, clock):
+    assert asyncio.run(jwks.get_signing_key("key1")).key_id == "key1"
+    assert asyncio.run(jwks.get_signing_key("key1")).key_id == "key1"
+    assert jwks.client.fetches == 1
+
+    clock.now += 3600
+    asyncio.run(jwks.get_signing_key("key1"))
+    assert jwks.client.fetches == 2
+
+
+def test_unknown_key_ids_refresh_at_most_once_per_interval(jwks, clock, keys):
+    asyncio.run(jwks.get_signing_key("key1"))
+
+    for _ in range(3):
+        with pytest.raises(jwt.exceptions.PyJWKClientError):
+            asyncio.run(jwks.get_signing_key("made-up"))
+    assert jwks.client.fetches == 1
+
+    # Auth0 rotated its keys
+    jwks.client.keys.append(keys["key2"][1])
+    clock.now += 30
+    assert asyncio.run(jwks.get_signing_key("key2")).key_id == "key2"
+    assert jwks.client.fetches == 2
+
+
+def test_failed_refresh_keeps_the_keys_it_had(jwks, clock):
+    asyncio.run(jwks.get_signing_key("key1"))
+
+    jwks.client.fail = True
+    clock.now += 3600
+    assert asyncio.run(jwks.get_signing_key("key1")).key_id == "key1"
+    assert jwks.client.fetches == 2
+
+
+def test_verified_tokens_are_not_verified_again(jwks, keys, monkeypatch):
+    decoded = []
+    decode = jwt.decode
+
+    def counted_decode(*args, **kwargs):
+        decoded.append(1)
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counted_decode)
+    bearer = JWTBearer(any_scope=["read:all"])
+    valid = token(keys, scope="read:all")
+
+    first = asyncio.run(bearer.check_auth(valid))
+    again = asyncio.run(bearer.check_auth(valid))
+
+    assert first == again
+    assert first["scope"] == "read:all"
+    assert len(decoded) == 1
+
+
+def test_verified_claims_expire_with_the_token(jwks, keys):
+    exp = int(time.time()) + 60
+    claims = asyncio.run(JWTBearer().check_auth(token(keys, exp=exp)))
+
+    assert claims in verified_claims.values()
+    verified_claims.expire(time=exp)
+    assert len(verified_claims) == 0
+
+
+def test_rejected_tokens_are_not_cached(jwks, keys):
+    forged = token(keys, kid="key1")[:-4] + "AAAA"
+
+    for _ in range(2):
+        with pytest.raises(AuthError):
+            asyncio.run(JWTBearer().check_auth(forged))
+    assert len(verified_claims) == 0
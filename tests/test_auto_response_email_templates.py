@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+
+from app.airtable.base_map_by_geographic_area.auto_response_email_template import (
+    AirtableAutoResponseEmailTemplateResponse,
+)
+from app.models.auto_response_email_template import (
+    APIAutoResponseEmailTemplateData,
+    AutoResponseEmailTemplateIndex,
+    normalize_template_value,
+)
+
+
+class FakeGeoAreaIndex:
+    """GeoAreaIndex stand-in, the place is nearest to the areas in `nearest_first` order"""
+
+    def __init__(self, nearest_first: list[str]):
+        self.nearest_first = nearest_first
+
+    def nearest(self, place, marketing_source: Optional[str] = None, allowed_ids=None):
+        return next((SimpleNamespace(id=ga_id) for ga_id in self.nearest_first if ga_id in allowed_ids), None)
+
+
+def template(template_id: str, geo_areas: list[str], **fields) -> APIAutoResponseEmailTemplateData:
+    airtable_template = AirtableAutoResponseEmailTemplateResponse.model_validate(
+        {
+            "id": template_id,
+            "createdTime": "2022-04-16T06:43:56.000Z",
+            "fields": {
+                "Geographic Areas": geo_areas,
+                "Contact Type": fields.get("contact_type", "Any"),
+                "Language": fields.get("language", "Any"),
+                "Marketing Source": fields.get("marketing_source"),
+            },
+        }
+    )
+    return APIAutoResponseEmailTemplateData.from_airtable_auto_response_email_template(
+        airtable_template, url_path_for=lambda *args, **kwargs: f"/{template_id}"
+    )
+
+
+@pytest.fixture
+def index() -> AutoResponseEmailTemplateIndex:
+    return AutoResponseEmailTemplateIndex(
+        [
+            template("recPARTNER", ["recCITY"], contact_type="Educator", marketing_source="Partner Org"),
+            template("recSPANISH", ["recCITY"], contact_type="Educator", language="Spanish"),
+            template("recEDUCATOR", ["recCITY"], contact_type="Educator"),
+            template("recSTATE", ["recSTATE"], contact_type="Educator"),
+            template("recDEFAULT", ["recUS", "recCITY"]),
+        ]
+    )
+
+
+def match(index, nearest_first=("recCITY", "recSTATE", "recUS"), **contact) -> Optional[str]:
+    matched = index.match(place=None, geo_area_index=FakeGeoAreaIndex(list(nearest_first)), **contact)
+    return matched.id if matched is not None else None
+
+
+def test_template_values_are_normalized():
+    assert normalize_template_value(" Partner-Org ") == normalize_template_value("partner org") == "partnerorg"
+    assert normalize_template_value(None) is None
+
+
+@pytest.mark.parametrize(
+    "contact, expected",
+    [
+        # Every field matches
+        ({"contact_type": "educator", "language": "Spanish", "marketing_source": None}, "recSPANISH"),
+        ({"contact_type": "Educator", "language": "English", "marketing_source": "partner-org"}, "recPARTNER"),
+        # Unknown marketing sources are dropped first, then unknown languages, then the contact type
+        ({"contact_type": "Educator", "language": "Spanish", "marketing_source": "Unknown"}, "recSPANISH"),
+        ({"contact_type": "Educator", "language": "French"}, "recEDUCATOR"),
+        ({"contact_type": "Parent", "language": "French"}, "recDEFAULT"),
+        ({}, "recDEFAULT"),
+    ],
+)
+def test_fallback_tiers(index, contact, expected):
+    assert match(index, **contact) == expected
+
+
+def test_nearest_area_covered_by_a_tier_wins(index):
+    # A Parent in the state falls through to the US-wide template rather than the Educator's state template
+    assert match(index, nearest_first=["recSTATE", "recUS"], contact_type="Parent") == "recDEFAULT"
+    assert match(index, nearest_first=["recSTATE", "recUS"], contact_type="Educator") == "recSTATE"
+
+
+def test_first_template_covering_an_area_wins():
+    index = AutoResponseEmailTemplateIndex(
+        [template("recANY", ["recCITY"]), template("recEDUCATOR", ["recCITY"], contact_type="Educator")]
+    )
+
+    # Within a tier the templates table's order decides, not how specific the template is
+    assert match(index, contact_type="Educator") == "recANY"
+
+
+def test_no_covering_template(index):
+    assert match(index, nearest_first=["recELSEWHERE"]) is None
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from cachetools import TTLCache
+
+from app.cache import cached
+
+
+def counted(func):
+    """Wrap a coroutine function, counting its calls on .calls"""
+
+    async def wrapper(*args, **kwargs):
+        wrapper.calls += 1
+        return await func(*args, **kwargs)
+
+    wrapper.calls = 0
+    return wrapper
+
+
+def test_cached_serves_hits_from_cache():
+    @counted
+    async def double(x):
+        return x * 2
+
+    cached_double = cached(cache=TTLCache(maxsize=8, ttl=60), shared=False)(double)
+
+    async def run():
+        return [await cached_double(2), await cached_double(2), await cached_double(3)]
+
+    assert asyncio.run(run()) == [4, 4, 6]
+    assert double.calls == 2
+
+
+def test_cached_does_not_cache_errors():
+    attempts = []
+
+    @cached(cache=TTLCache(maxsize=8, ttl=60), shared=False)
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ValueError("first call fails")
+        return "ok"
+
+    async def run():
+        with pytest.raises(ValueError):
+            await flaky()
+        return await flaky()
+
+    assert asyncio.run(run()) == "ok"
+    assert len(attempts) == 2
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import pickle
+import sqlite3
+
+import pytest
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+from app.airtable.base_school_db import EDUCATORS_TABLE_NAME
+from app.airtable.client import AirtableClient
+from app.cache import SQLiteCacheBackend, cached, record_tag
+from app.cache import decorators, invalidation
+from app.cache.invalidation import TagRegistry
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch) -> SQLiteCacheBackend:
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(decorators, "get_shared_backend", lambda: backend)
+    monkeypatch.setattr(invalidation, "get_shared_backend", lambda: backend)
+    return backend
+
+
+def test_sqlite_backend_closes_its_connections(backend, monkeypatch):
+    connections = []
+    connect = backend._connect
+
+    def tracked_connect():
+        connection = connect()
+        connections.append(connection)
+        return connection
+
+    monkeypatch.setattr(backend, "_connect", tracked_connect)
+
+    async def run():
+        await backend.set("key", b"value", ttl=60)
+        await backend.tag(["tag"], "key", ttl=60)
+        value = await backend.get("key")
+        await backend.invalidate_tags("tag")
+        return value, await backend.get("key")
+
+    assert asyncio.run(run()) == (b"value", None)
+    assert len(connections) == 5
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+
+def test_invalidation_evicts_shared_entries_written_by_other_processes(backend, monkeypatch):
+    @cached(cache=TTLCache(maxsize=8, ttl=60), tags=lambda result, thing_id: [record_tag("thing", thing_id)])
+    async def load(thing_id):
+        return {"id": thing_id}
+
+    async def run():
+        await load("rec1")
+        await load("rec2")
+        shared_keys = [load.shared_cache_key("rec1"), load.shared_cache_key("rec2")]
+
+        # A process that never read either entry invalidates one of them
+        monkeypatch.setattr(invalidation, "registry", TagRegistry())
+        await invalidation.invalidate(record_tag("thing", "rec1"))
+
+        return [await backend.get(k) for k in shared_keys]
+
+    evicted, kept = asyncio.run(run())
+    assert evicted is None
+    assert kept is not None
+
+
+class Thing(BaseModel):
+    id: str
+    tags: list[str] = []
+
+
+def test_shared_entries_are_json_validated_against_the_return_type(backend):
+    calls = []
+
+    @cached(cache=TTLCache(maxsize=8, ttl=60))
+    async def load(thing_id) -> Thing:
+        calls.append(thing_id)
+        return Thing(id=thing_id, tags=["a"])
+
+    async def run():
+        first = await load("rec1")
+        raw = await backend.get(load.shared_cache_key("rec1"))
+
+        # Another process, with nothing cached in-process
+        load.cache.clear()
+        return first, raw, await load("rec1")
+
+    first, raw, shared = asyncio.run(run())
+    assert json.loads(raw) == [f"{__name__}.Thing", None, {"id": "rec1", "tags": ["a"]}]
+    assert shared == first
+    assert isinstance(shared, Thing)
+    assert calls == ["rec1"]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        pickle.dumps({"id": "rec1"}),
+        b"not json",
+        json.dumps(["other.module.Type", None, {"id": "rec1"}]).encode(),
+        json.dumps(["tests.test_cache_backends.Thing", None, {"tags": "a"}]).encode(),
+    ],
+)
+def test_unreadable_shared_entries_are_misses(backend, raw):
+    calls = []
+
+    @cached(cache=TTLCache(maxsize=8, ttl=60))
+    async def load(thing_id) -> Thing:
+        calls.append(thing_id)
+        return Thing(id=thing_id)
+
+    async def run():
+        await backend.set(load.shared_cache_key("rec1"), raw, ttl=60)
+        return await load("rec1")
+
+    assert asyncio.run(run()) == Thing(id="rec1")
+    assert calls == ["rec1"]
+
+
+def test_values_that_dont_round_trip_are_only_cached_in_process(backend):
+    # Without a return annotation a model would be read back as a dict
+    @cached(cache=TTLCache(maxsize=8, ttl=60))
+    async def load(thing_id):
+        return Thing(id=thing_id)
+
+    async def run():
+        value = await load("rec1")
+        return value, await load("rec1"), await backend.get(load.shared_cache_key("rec1"))
+
+    value, again, raw = asyncio.run(run())
+    assert again is value
+    assert raw is None
+
+
+def test_airtable_responses_are_shared(client, airtable, backend):
+    attachment = {"id": "att1", "url": "https://example.org/a.png", "filename": "a.png", "size": 1, "type": "image/png"}
+    airtable.add(
+        EDUCATORS_TABLE_NAME,
+        "recE1",
+        {"Full Name": "Educator 1", "All Emails": "a@example.org,b@example.org", "Visioning album": [attachment]},
+    )
+    airtable_client = AirtableClient()
+
+    educator = asyncio.run(airtable_client.get_educator_by_id("recE1", load_relationships=False))
+    AirtableClient.get_educator_by_id.cache.clear()
+    airtable.requests.clear()
+
+    shared = asyncio.run(airtable_client.get_educator_by_id("recE1", load_relationships=False))
+    assert shared == educator
+    assert shared.fields.all_emails == ["a@example.org", "b@example.org"]
+    assert airtable.requests == []
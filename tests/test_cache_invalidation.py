@@ -0,0 +1,78 @@
+import asyncio
+
+from cachetools import TTLCache
+
+from app.cache import cached, invalidate, record_tag, table_tag
+from app.cache.invalidation import TagRegistry
+
+
+def test_cached_entries_are_evicted_by_tag():
+    versions = []
+
+    @cached(
+        cache=TTLCache(maxsize=8, ttl=60),
+        shared=False,
+        tags=lambda result, thing_id: [record_tag("thing", thing_id)],
+    )
+    async def cached_load(thing_id):
+        versions.append(thing_id)
+        return {"id": thing_id, "version": len(versions)}
+
+    async def run():
+        first = await cached_load("rec1")
+        other = await cached_load("rec2")
+        await invalidate(record_tag("thing", "rec1"))
+        return first, await cached_load("rec1"), other, await cached_load("rec2")
+
+    first, reloaded, other, other_again = asyncio.run(run())
+    assert first["version"] == 1
+    assert reloaded["version"] == 3
+    assert other_again is other
+
+
+def test_calls_in_flight_during_an_invalidation_are_not_cached():
+    versions = []
+    started, release = None, None
+
+    @cached(cache=TTLCache(maxsize=8, ttl=60), shared=False, tags=lambda result: [table_tag("Things")])
+    async def cached_list():
+        versions.append(1)
+        if len(versions) == 1:
+            started.set()
+            await release.wait()
+        return len(versions)
+
+    async def run():
+        nonlocal started, release
+        started, release = asyncio.Event(), asyncio.Event()
+
+        in_flight = asyncio.ensure_future(cached_list())
+        await started.wait()
+        # A write lands while the first read is still waiting on Airtable
+        await invalidate(table_tag("Things"))
+        release.set()
+
+        # The caller still gets its (possibly stale) result, but later callers don't
+        return await in_flight, await cached_list()
+
+    assert asyncio.run(run()) == (1, 2)
+
+
+def test_registry_treats_calls_older_than_its_forgotten_invalidations_as_stale(monkeypatch):
+    registry = TagRegistry()
+    monkeypatch.setattr(TagRegistry, "PRUNE_THRESHOLD", 2)
+
+    async def run():
+        before = registry.epoch
+        await registry.invalidate(record_tag("thing", "rec1"))
+        after = registry.epoch
+        await registry.invalidate(record_tag("thing", "rec2"), record_tag("thing", "rec3"))
+        return before, after
+
+    before, after = asyncio.run(run())
+    assert registry.invalidated_since([record_tag("thing", "rec1")], before)
+    assert registry.invalidated_since([record_tag("thing", "rec2")], after)
+    # rec1's invalidation was forgotten, a call started before it can't be told apart from one it affected
+    assert registry.invalidated_since([record_tag("thing", "other")], before)
+    assert not registry.invalidated_since([record_tag("thing", "other")], registry.epoch)
+    assert not registry.invalidated_since([], before)
@@ -0,0 +1,46 @@
+import asyncio
+
+from cachetools import TTLCache
+
+from app.cache import cached
+
+
+def test_cached_serves_stale_entries_while_revalidating():
+    calls = []
+
+    @cached(cache=TTLCache(maxsize=8, ttl=60), shared=False, refresh_after=0)
+    async def load():
+        calls.append(1)
+        return len(calls)
+
+    async def run():
+        first = await load()
+        stale = await load()
+        # Let the background refresh finish
+        await asyncio.sleep(0.01)
+        return first, stale, await load()
+
+    assert asyncio.run(run()) == (1, 1, 2)
+
+
+def test_failed_revalidation_keeps_serving_the_stale_entry():
+    calls = []
+
+    @cached(cache=TTLCache(maxsize=8, ttl=60), shared=False, refresh_after=0)
+    async def load():
+        calls.append(1)
+        if len(calls) > 1:
+            raise RuntimeError("Airtable is down")
+        return "first"
+
+    async def run():
+        first = await load()
+        stale = await load()
+        await asyncio.sleep(0.01)
+        # Still stale, so it's refreshed again
+        still_stale = await load()
+        await asyncio.sleep(0.01)
+        return first, stale, still_stale
+
+    assert asyncio.run(run()) == ("first", "first", "first")
+    assert len(calls) == 3
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+
+from cachetools import TTLCache
+
+from app.cache import cached
+
+
+def test_cached_coalesces_concurrent_misses():
+    calls = []
+
+    @cached(cache=TTLCache(maxsize=8, ttl=60), shared=False)
+    async def slow(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x
+
+    async def run():
+        return await asyncio.gather(*[slow(1) for _ in range(5)])
+
+    assert asyncio.run(run()) == [1] * 5
+    assert calls == [1]
+
+
+def test_cancelled_waiter_does_not_cancel_the_call_for_others():
+    calls = []
+
+    @cached(cache=TTLCache(maxsize=8, ttl=60), shared=False)
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def run():
+        # A client disconnecting mid-request cancels its handler
+        cancelled = asyncio.ensure_future(slow())
+        waiting = asyncio.ensure_future(slow())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await waiting
+
+    assert asyncio.run(run()) == "done"
+    assert len(calls) == 1
+
+
+def test_cached_coalesces_misses_across_event_loops():
+    calls = []
+    started = threading.Event()
+
+    @cached(cache=TTLCache(maxsize=8, ttl=60), shared=False)
+    async def slow():
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    results = []
+    first = threading.Thread(target=lambda: results.append(asyncio.run(slow())))
+    first.start()
+    started.wait()
+    # Each thread runs its own event loop, like sync routes called through anyio's threadpool
+    results.append(asyncio.run(slow()))
+    first.join()
+
+    assert results == ["done", "done"]
+    assert len(calls) == 1
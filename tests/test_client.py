@@ -0,0 +1,61 @@
+import asyncio
+from typing import Optional
+
+import pytest
+
+from app.airtable import client as client_module
+from app.airtable.base_school_db import PARTNERS_TABLE_NAME
+from app.airtable.client import AirtableClient
+from app.cache import CacheBackend
+
+
+class DictCacheBackend(CacheBackend):
+    """Shared backend kept in a dict, recording the ttl of every write"""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, Optional[float]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, *keys: str):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+@pytest.fixture
+def partners(client, airtable):
+    airtable.add(PARTNERS_TABLE_NAME, "recP1", {"Name": "Partner 1", "Synced Record ID": "recSYN1"})
+    airtable.add(PARTNERS_TABLE_NAME, "recP2", {"Name": "Partner 2", "Synced Record ID": "recSYN2"})
+    return AirtableClient()
+
+
+def test_partner_id_translations_are_kept_in_process_without_shared_backend(partners, airtable):
+    translated = asyncio.run(partners.get_partner_ids_by_synced_record_ids(["recSYN1", "recSYN2", "recUNKNOWN"]))
+    again = asyncio.run(partners.get_partner_ids_by_synced_record_ids(["recSYN1"]))
+
+    assert translated == {"recSYN1": "recP1", "recSYN2": "recP2"}
+    assert again == {"recSYN1": "recP1"}
+    assert len(airtable.requests_to(PARTNERS_TABLE_NAME)) == 1
+
+
+def test_partner_id_translations_are_shared_through_the_backend(partners, airtable, monkeypatch):
+    backend = DictCacheBackend()
+    monkeypatch.setattr(client_module, "get_shared_backend", lambda: backend)
+
+    translated = asyncio.run(partners.get_partner_ids_by_synced_record_ids(["recSYN1", "recSYN2"]))
+
+    assert translated == {"recSYN1": "recP1", "recSYN2": "recP2"}
+    assert partners._partner_ids_by_synced_record_id == {}
+    assert sorted(backend.values.values()) == [b"recP1", b"recP2"]
+    assert set(backend.ttls.values()) == {AirtableClient.PARTNER_ID_TRANSLATION_TTL}
+
+    # Another process sharing the backend translates without asking Airtable
+    airtable.requests.clear()
+    assert asyncio.run(partners.get_partner_ids_by_synced_record_ids(["recSYN2"])) == {"recSYN2": "recP2"}
+    assert airtable.requests == []
@@ -0,0 +1,123 @@
+import asyncio
+
+from app.airtable.base_school_db import EDUCATORS_TABLE_NAME
+from app.airtable.cursors import PageCursors
+
+
+def paged_fetch(page_count: int, fetched: list):
+    """fetch for PageCursors.page over page_count pages, whose Airtable offsets are "page2", "page3"..."""
+
+    async def fetch(offset):
+        fetched.append(offset)
+        number = 1 if offset is None else int(offset[len("page") :])
+        next_offset = f"page{number + 1}" if number < page_count else None
+        return [{"id": f"page{number}"}], next_offset
+
+    return fetch
+
+
+def test_first_page_is_neither_cached_nor_prefetched_from():
+    cursors = PageCursors()
+    fetched = []
+    fetch = paged_fetch(3, fetched)
+
+    async def run():
+        first = await cursors.page("things", "options", None, fetch)
+        again = await cursors.page("things", "options", None, fetch)
+        await asyncio.sleep(0)
+        return first, again
+
+    first, again = asyncio.run(run())
+    assert first == again == ([{"id": "page1"}], PageCursors.encode("page2"))
+    assert fetched == [None, None]
+    assert len(cursors.pages) == 0
+
+
+def test_following_a_cursor_prefetches_the_next_page():
+    cursors = PageCursors()
+    fetched = []
+    fetch = paged_fetch(3, fetched)
+
+    async def run():
+        _, cursor = await cursors.page("things", "options", None, fetch)
+        second, cursor = await cursors.page("things", "options", cursor, fetch)
+        await asyncio.gather(*cursors._tasks)
+        fetched_before_third = list(fetched)
+        third, cursor = await cursors.page("things", "options", cursor, fetch)
+        return second, third, cursor, fetched_before_third
+
+    second, third, cursor, fetched_before_third = asyncio.run(run())
+    assert second == [{"id": "page2"}]
+    assert third == [{"id": "page3"}]
+    assert cursor == ""
+    # Page 3 was already loaded when it was requested
+    assert fetched_before_third == fetched == [None, "page2", "page3"]
+
+
+def test_evict_drops_a_tables_pages():
+    cursors = PageCursors()
+    fetched = []
+    fetch = paged_fetch(3, fetched)
+
+    async def run():
+        _, cursor = await cursors.page("things", "options", None, fetch)
+        _, cursor = await cursors.page("things", "options", cursor, fetch)
+        await cursors.page("others", "options", cursor, fetch)
+        await asyncio.gather(*cursors._tasks)
+
+        cursors.evict("things")
+        assert {k[0] for k in cursors.pages} == {"others"}
+
+        fetched.clear()
+        return await cursors.page("things", "options", cursor, fetch)
+
+    records, _ = asyncio.run(run())
+    assert records == [{"id": "page3"}]
+    assert fetched == ["page3"]
+
+
+def test_cancelled_prefetch_is_fetched_again():
+    cursors = PageCursors()
+    fetched = []
+    fetch_page = paged_fetch(3, fetched)
+
+    async def fetch(offset):
+        if offset == "page3" and fetched.count("page3") == 0:
+            fetched.append(offset)
+            # The first prefetch of page 3 never completes, it's cancelled below
+            await asyncio.sleep(60)
+        return await fetch_page(offset)
+
+    async def run():
+        _, cursor = await cursors.page("things", "options", None, fetch)
+        _, cursor = await cursors.page("things", "options", cursor, fetch)
+        await asyncio.sleep(0)
+        prefetches = list(cursors._tasks)
+        for task in prefetches:
+            task.cancel()
+        await asyncio.gather(*prefetches, return_exceptions=True)
+
+        assert ("things", "options", cursor) not in cursors.pages
+        return await cursors.page("things", "options", cursor, fetch)
+
+    records, cursor = asyncio.run(run())
+    assert records == [{"id": "page3"}]
+    assert cursor == ""
+    assert fetched == [None, "page2", "page3", "page3"]
+
+
+def test_educator_writes_evict_educator_pages(client, airtable):
+    for i in range(3):
+        airtable.add(EDUCATORS_TABLE_NAME, f"recE{i}", {"Full Name": f"Educator {i}"})
+
+    first = client.get("/educators?page_size=1").json()
+    second = client.get("/educators", params={"page_size": 1, "offset": first["meta"]["offset"]}).json()
+    assert second["data"][0]["fields"]["full_name"] == "Educator 1"
+
+    # The third page was prefetched, an educator update must not leave it behind
+    airtable.tables[EDUCATORS_TABLE_NAME][2]["fields"]["Full Name"] = "Renamed"
+    response = client.patch("/educators/recE2", json={"first_name": "Renamed"})
+    assert response.status_code == 200
+
+    third = client.get("/educators", params={"page_size": 1, "offset": second["meta"]["offset"]}).json()
+    assert third["data"][0]["fields"]["full_name"] == "Renamed"
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from app.airtable.base_school_db import (
+    FIELD_CATEGORIES_TABLE_NAME,
+    FIELD_MAPPING_TABLE_NAME,
+    FieldCategoryType,
+    FieldMappingIndex,
+    ListAirtableFieldCategoriesResponse,
+    ListAirtableFieldMappingResponse,
+)
+from app.airtable.client import AirtableClient
+
+CATEGORIES = {
+    "recC1": {"Value": "Female", "Type": "Gender"},
+    "recC2": {"Value": "Male", "Type": "Gender"},
+    "recC3": {"Value": "Gender Non-Conforming", "Type": "Gender", "Non-Specific Category": True},
+    "recC4": {"Value": "Other", "Type": "Gender"},
+}
+MAPPINGS = {
+    "recM1": {"Response": "Woman", "Field Category Type": ["Gender"], "Field Categories": ["recC1"]},
+    "recM2": {"Response": " woman ", "Field Category Type": ["Gender"], "Field Categories": ["recC2"]},
+    "recM3": {"Response": "Genderqueer", "Field Category Type": ["Gender"], "Field Categories": ["recC4", "recC3"]},
+    "recM4": {"Response": "Other", "Field Category Type": ["Gender"], "Field Categories": ["recC4"]},
+    "recM5": {"Response": "Woman", "Field Category Type": ["Pronouns"], "Field Categories": ["recC1"]},
+}
+
+
+def airtable_list(records: dict[str, dict]) -> list[dict]:
+    return [{"id": r_id, "createdTime": "2022-04-16T06:43:56.000Z", "fields": f} for r_id, f in records.items()]
+
+
+@pytest.fixture
+def index() -> FieldMappingIndex:
+    return FieldMappingIndex(
+        ListAirtableFieldMappingResponse.model_validate(airtable_list(MAPPINGS)),
+        ListAirtableFieldCategoriesResponse.model_validate(airtable_list(CATEGORIES)),
+    )
+
+
+def mapped(matches: list[dict]) -> list[tuple]:
+    return [(m["mapped_value"], m["is_custom_value"], m["is_non_specific_category"]) for m in matches]
+
+
+def test_responses_match_ignoring_case_and_whitespace(index):
+    matches = index.map_response_to_field_category_values(FieldCategoryType.gender, "  WOMAN")
+
+    # The first mapping for a response wins
+    assert mapped(matches) == [("Female", False, False)]
+    assert matches[0]["lookup_value"] == "  WOMAN"
+
+
+def test_categories_keep_the_categories_table_order(index):
+    matches = index.map_response_to_field_category_values(FieldCategoryType.gender, "genderqueer")
+
+    assert mapped(matches) == [("Gender Non-Conforming", False, True), ("Other", False, False)]
+
+
+def test_unmapped_responses_are_custom_values_in_the_other_category(index):
+    matches = index.map_response_to_field_category_values(FieldCategoryType.gender, "Two-Spirit")
+
+    assert mapped(matches) == [("Two-Spirit", True, False), ("Other", False, False)]
+
+
+def test_unmapped_responses_without_an_other_category_are_only_custom_values(index):
+    matches = index.map_response_to_field_category_values(FieldCategoryType.pronouns, "they/them")
+
+    assert mapped(matches) == [("they/them", True, False)]
+
+
+def test_list_responses_are_mapped_value_by_value(index):
+    responses = {
+        "gender": (FieldCategoryType.gender, ["Woman", "Genderqueer"]),
+        "pronouns": (FieldCategoryType.pronouns, None),
+    }
+
+    matches = index.map_responses_to_field_category_values(responses)
+
+    assert [m["mapped_value"] for m in matches["gender"]] == ["Female", "Gender Non-Conforming", "Other"]
+    assert matches["pronouns"] == []
+
+
+def test_index_matches_the_linear_scan(index):
+    for response in ["Woman", "genderqueer", "other", "Unknown"]:
+        assert index.map_response_value(FieldCategoryType.gender, response) == (
+            index.field_mappings.map_response_value(FieldCategoryType.gender, response)
+        )
+
+
+def test_client_only_rebuilds_the_index_when_the_mappings_are_refreshed(client, airtable):
+    for r in airtable_list(CATEGORIES):
+        airtable.add(FIELD_CATEGORIES_TABLE_NAME, r["id"], r["fields"])
+    for r in airtable_list(MAPPINGS):
+        airtable.add(FIELD_MAPPING_TABLE_NAME, r["id"], r["fields"])
+    airtable_client = AirtableClient()
+
+    first = asyncio.run(airtable_client.field_mapping_index())
+    assert asyncio.run(airtable_client.field_mapping_index()) is first
+
+    with AirtableClient.list_field_mappings.cache_lock:
+        AirtableClient.list_field_mappings.cache.clear()
+    rebuilt = asyncio.run(airtable_client.field_mapping_index())
+    assert rebuilt is not first
+    assert rebuilt.map_response_value(FieldCategoryType.gender, "woman").id == "recM1"
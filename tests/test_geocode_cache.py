@@ -0,0 +1,80 @@
+import pytest
+
+from app.geocode import cache as cache_module
+from app.geocode.cache import GeocodeCache, SQLiteGeocodeStore, normalize_address
+from app.geocode.geocode_models import Place
+from app.geocode.google_maps_client import GoogleMapsAPI
+
+PLACE = Place(formatted_address="123 Main St, Springfield, IL 62701, USA", place_id="place1")
+
+
+@pytest.fixture
+def store(tmp_path) -> SQLiteGeocodeStore:
+    return SQLiteGeocodeStore(str(tmp_path / "geocode.sqlite3"))
+
+
+class FakeGoogleMaps:
+    def __init__(self, results: list[dict]):
+        self.results = results
+        self.geocoded: list[str] = []
+
+    def geocode(self, address):
+        self.geocoded.append(address)
+        return self.results
+
+
+def google_maps(geocode_cache: GeocodeCache, results: list[dict]) -> GoogleMapsAPI:
+    # Built without the Singleton metaclass so each test gets its own
+    api = GoogleMapsAPI.__new__(GoogleMapsAPI)
+    api.client_api = FakeGoogleMaps(results)
+    api.cache = geocode_cache
+    return api
+
+
+@pytest.mark.parametrize(
+    "address",
+    ["123 Main Street, Springfield", "123  main st springfield", "123 MAIN ST. Springfield"],
+)
+def test_address_spellings_share_a_key(address):
+    assert normalize_address(address) == "123 main st springfield"
+
+
+def test_normalization_only_abbreviates_whole_words():
+    assert normalize_address("1 Westminster Court") == "1 westminster ct"
+
+
+def test_geocodes_persist_across_processes(store):
+    GeocodeCache(store).set("123 Main Street, Springfield", PLACE)
+
+    # A fresh in-process tier, as in another process (or after a restart) on the same host
+    assert GeocodeCache(store).get("123 main st springfield") == PLACE
+
+
+def test_addresses_google_cant_geocode_are_cached(store):
+    api = google_maps(GeocodeCache(store), results=[])
+
+    assert api.geocode_address("Nowhere at all") is None
+    assert api.geocode_address("nowhere at all") is None
+    assert api.client_api.geocoded == ["Nowhere at all"]
+    assert GeocodeCache(store).get("Nowhere at all") is None
+
+
+def test_cached_misses_expire_before_geocodes(store, monkeypatch):
+    geocode_cache = GeocodeCache(store, ttl=3600, negative_ttl=60)
+    geocode_cache.set("Nowhere at all", None)
+    geocode_cache.set("123 Main Street", PLACE)
+
+    now = cache_module.time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 120)
+
+    fresh = GeocodeCache(store, ttl=3600, negative_ttl=60)
+    assert fresh.get("Nowhere at all") is GeocodeCache.MISSING
+    assert fresh.get("123 Main Street") == PLACE
+
+
+def test_geocode_results_are_cached(store):
+    api = google_maps(GeocodeCache(store), results=[PLACE.model_dump()])
+
+    assert api.geocode_address("123 Main Street") == PLACE
+    assert api.geocode_address("123 main st") == PLACE
+    assert api.client_api.geocoded == ["123 Main Street"]
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+from pydantic import BaseModel
+
+from app import router_geo_area_mapping
+from app.airtable.base_map_by_geographic_area.const import AREA_TARGET_COMMUNITY_TABLE_NAME
+from app.airtable.client import AirtableClient
+from app.cache import MaterializedView
+
+
+class Source:
+    """Stands in for a cached Airtable response, views only compare their sources' identity"""
+
+
+class Document(BaseModel):
+    names: list[str]
+    note: str = "naïve"
+
+
+def test_view_is_built_once_per_generation_of_its_sources():
+    view = MaterializedView()
+    builds = []
+
+    async def build():
+        builds.append(1)
+        return Document(names=[f"build {len(builds)}"])
+
+    async def run(*sources):
+        return await view.get(sources, build)
+
+    first_source, second_source = Source(), Source()
+    first = asyncio.run(run(first_source, second_source))
+    again = asyncio.run(run(first_source, second_source))
+    assert again is first
+    assert len(builds) == 1
+
+    # One source refreshed
+    rebuilt = asyncio.run(run(first_source, Source()))
+    assert rebuilt is not first
+    assert rebuilt.value.names == ["build 2"]
+
+
+def test_view_body_is_the_documents_json():
+    view = MaterializedView()
+
+    async def build():
+        return Document(names=["a", "b"])
+
+    materialized = asyncio.run(view.get((Source(),), build))
+
+    assert json.loads(materialized.body) == {"names": ["a", "b"], "note": "naïve"}
+    assert materialized.response().body == materialized.body
+    assert materialized.response().media_type == "application/json"
+
+
+def test_list_routes_serve_the_materialized_document_until_a_refresh(client, airtable):
+    airtable.add(AREA_TARGET_COMMUNITY_TABLE_NAME, "recA1", {"Area Name": ["Area 1"], "Area Type": ["City"]})
+
+    view = router_geo_area_mapping._geo_area_target_communities_view
+
+    first = client.get("/geo_mapping/target_communities")
+    materialized = view._materialized
+    again = client.get("/geo_mapping/target_communities")
+    assert first.status_code == 200
+    assert again.content == first.content
+    assert view._materialized is materialized
+    assert [d["fields"]["area_name"] for d in first.json()["data"]] == ["Area 1"]
+
+    airtable.add(AREA_TARGET_COMMUNITY_TABLE_NAME, "recA2", {"Area Name": ["Area 2"], "Area Type": ["City"]})
+    with AirtableClient.list_geo_area_target_communities.cache_lock:
+        AirtableClient.list_geo_area_target_communities.cache.clear()
+
+    refreshed = client.get("/geo_mapping/target_communities").json()
+    assert view._materialized is not materialized
+    assert [d["fields"]["area_name"] for d in refreshed["data"]] == ["Area 1", "Area 2"]
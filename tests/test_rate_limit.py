@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.airtable import rate_limit
+from app.airtable.rate_limit import RateLimiter, TokenBucket
+
+TABLE = "Things"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def test_bucket_spaces_requests_past_the_burst(clock):
+    bucket = TokenBucket(rate=5, burst=2)
+
+    delays = [bucket.reserve() for _ in range(5)]
+
+    assert delays == pytest.approx([0, 0, 0.2, 0.4, 0.6])
+
+
+def test_bucket_refills_at_its_rate_up_to_the_burst(clock):
+    bucket = TokenBucket(rate=5, burst=2)
+    for _ in range(3):
+        bucket.reserve()
+
+    clock.now += 10
+    delays = [bucket.reserve() for _ in range(3)]
+
+    assert delays == pytest.approx([0, 0, 0.2])
+
+
+def test_paused_bucket_holds_back_requests(clock):
+    bucket = TokenBucket(rate=5, burst=2)
+
+    bucket.pause(1)
+
+    assert bucket.reserve() == pytest.approx(1.2)
+    assert bucket.metrics()["throttled_responses"] == 1
+
+
+def test_limiter_keeps_a_bucket_per_base(clock):
+    limiter = RateLimiter(rate=1, burst=1)
+
+    async def run():
+        await limiter.acquire("appONE")
+        await limiter.acquire("appTWO")
+
+    asyncio.run(run())
+    assert limiter.buckets["appONE"].reserve() == pytest.approx(1)
+    assert limiter.buckets["appTWO"].reserve() == pytest.approx(1)
+    assert limiter.buckets["appTHREE"].reserve() == 0
+
+
+def test_rate_limited_requests_pause_the_base_and_retry(api, airtable, monkeypatch):
+    airtable.add(TABLE, "rec1", {"Name": "Thing 1"})
+    monkeypatch.setattr(api, "RETRY_BACKOFF_FACTOR", 0.01)
+
+    responses = iter([httpx.Response(429, headers={"Retry-After": "0.02"}, json={"errors": "RATE_LIMIT_REACHED"})])
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        return next(responses, None) or airtable.handle(request)
+
+    api._session = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+
+    record = asyncio.run(api.table("appTEST", TABLE).get("rec1"))
+
+    assert record["fields"] == {"Name": "Thing 1"}
+    bucket = api.rate_limiter.buckets["appTEST"]
+    assert bucket.metrics()["throttled_responses"] == 1
+    assert bucket.metrics()["queued_requests"] == 1
@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from app.airtable.replica import Replica
+
+TABLE = "Things"
+
+
+def test_first_sync_runs_in_the_background(api, airtable):
+    airtable.add(TABLE, "rec1", {"Name": "Thing 1"})
+    replica = Replica(api, base_id="appTEST", table_names=[TABLE])
+
+    async def run():
+        # Passed through to Airtable while the first sync is running
+        assert await replica.table(TABLE) is None
+        assert await replica.table(TABLE) is None
+
+        await asyncio.gather(*replica._syncs.values())
+        return await replica.table(TABLE)
+
+    replica_table = asyncio.run(run())
+    assert replica_table.get("rec1")["fields"] == {"Name": "Thing 1"}
+    # Requests made while the sync was running didn't start another one
+    assert len(airtable.requests_to(TABLE)) == 1
+
+
+def test_stale_table_is_served_while_refreshing(api, airtable):
+    airtable.add(TABLE, "rec1", {"Name": "Thing 1"})
+    replica = Replica(api, base_id="appTEST", table_names=[TABLE], refresh_interval=60)
+
+    async def run():
+        replica.warm()
+        await asyncio.gather(*replica._syncs.values())
+
+        airtable.add(TABLE, "rec2", {"Name": "Thing 2"})
+        replica.tables[TABLE].synced_at = time.monotonic() - 120
+
+        stale = await replica.table(TABLE)
+        assert sorted(stale.records) == ["rec1"]
+
+        await asyncio.gather(*replica._syncs.values())
+        return await replica.table(TABLE)
+
+    assert sorted(asyncio.run(run()).records) == ["rec1", "rec2"]
+
+
+def test_failed_first_sync_keeps_passing_through(api, airtable, monkeypatch):
+    replica = Replica(api, base_id="appTEST", table_names=[TABLE])
+
+    async def fail(table_name):
+        raise RuntimeError("Airtable is down")
+
+    monkeypatch.setattr(replica, "sync", fail)
+
+    async def run():
+        assert await replica.table(TABLE) is None
+        await asyncio.gather(*replica._syncs.values())
+        return await replica.table(TABLE)
+
+    assert asyncio.run(run()) is None
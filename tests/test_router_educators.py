@@ -0,0 +1,65 @@
+import json
+
+from app.airtable.base_school_db import EDUCATORS_TABLE_NAME, LANGUAGES_TABLE_NAME, NEWSLETTERS_TABLE_NAME
+
+
+def add_educators(airtable, count):
+    airtable.add(NEWSLETTERS_TABLE_NAME, "recN1", {"Name": "Discovery", "Slug": "discovery_group"})
+    airtable.add(NEWSLETTERS_TABLE_NAME, "recN2", {"Name": "ETL", "Slug": "etl_group"})
+    airtable.add(LANGUAGES_TABLE_NAME, "recL1", {"Language": "English"})
+    for i in range(count):
+        airtable.add(
+            EDUCATORS_TABLE_NAME,
+            f"recE{i}",
+            {
+                "Full Name": f"Educator {i}",
+                "Newsletter and Group Subscriptions": ["recN1"] if i % 2 == 0 else ["recN2"],
+                "Language Record IDs": ["recL1"],
+            },
+        )
+
+
+def test_export_educators_resolves_newsletters_without_relationships(client, airtable):
+    add_educators(airtable, 5)
+
+    response = client.get("/educators/export?page_size=2")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == [f"recE{i}" for i in range(5)]
+    assert [line["fields"]["discovery_newsletter"] for line in lines] == [True, False, True, False, True]
+    assert [line["fields"]["etl_newsletter"] for line in lines] == [False, True, False, True, False]
+
+    # One newsletters request per page, other relationships are left as IDs
+    assert len(airtable.requests_to(NEWSLETTERS_TABLE_NAME)) == 3
+    assert airtable.requests_to(LANGUAGES_TABLE_NAME) == []
+
+
+def test_export_educators_loads_relationships(client, airtable):
+    add_educators(airtable, 3)
+
+    response = client.get("/educators/export?page_size=2&load_relationships=true")
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 3
+    assert lines[0]["fields"]["discovery_newsletter"] is True
+    assert lines[0]["relationships"]["languages"]["data"][0]["fields"]["language_dropdown"] == "English"
+    assert len(airtable.requests_to(LANGUAGES_TABLE_NAME)) == 2
+
+
+def test_export_educators_reports_airtable_errors(client, airtable):
+    airtable.failures[EDUCATORS_TABLE_NAME] = (422, {"error": {"type": "INVALID_REQUEST_UNKNOWN"}})
+
+    response = client.get("/educators/export")
+
+    assert response.status_code == 422
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_export_educators_bounds_page_size(client, airtable):
+    assert client.get("/educators/export?page_size=101").status_code == 422
+    assert client.get("/educators/export?page_size=0").status_code == 422
+    assert airtable.requests == []
@@ -0,0 +1,61 @@
+from app.airtable.base_school_db import EDUCATORS_SCHOOLS_TABLE_NAME, EDUCATORS_TABLE_NAME, SCHOOLS_TABLE_NAME
+
+
+def add_educator_and_school(airtable):
+    airtable.add(EDUCATORS_TABLE_NAME, "recE1", {"Full Name": "Maria Montessori"})
+    airtable.add(SCHOOLS_TABLE_NAME, "recS1", {"Name": "Casa dei Bambini"})
+
+
+def test_create_educator_school_creates_the_link(client, airtable):
+    add_educator_and_school(airtable)
+
+    response = client.post(
+        "/educators_schools",
+        json={"educator_id": "recE1", "school_id": "recS1", "email": "maria@example.org", "roles": ["Teacher Leader"]},
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["relationships"]["educator"]["data"]["id"] == "recE1"
+    assert data["relationships"]["school"]["data"]["id"] == "recS1"
+    assert data["fields"]["roles"] == ["Teacher Leader"]
+
+    writes = [r for r in airtable.requests_to(EDUCATORS_SCHOOLS_TABLE_NAME) if r.method != "GET"]
+    assert len(writes) == 1
+    assert writes[0].method == "POST"
+    assert writes[0].record_id is None
+    assert writes[0].json == {
+        "fields": {
+            "Educator": ["recE1"],
+            "School": ["recS1"],
+            "Email at School": "maria@example.org",
+            "Roles (staging)": ["Teacher Leader"],
+            "Currently Active": None,
+            "Start Date": None,
+            "End Date": None,
+            "Mark for deletion": None,
+        },
+        "typecast": False,
+    }
+
+
+def test_create_educator_school_rejects_existing_link(client, airtable):
+    add_educator_and_school(airtable)
+    airtable.add(
+        EDUCATORS_SCHOOLS_TABLE_NAME,
+        "recES1",
+        {"Educator": ["recE1"], "School": ["recS1"], "Educator Record ID": ["recE1"], "School Record ID": ["recS1"]},
+    )
+
+    response = client.post("/educators_schools", json={"educator_id": "recE1", "school_id": "recS1"})
+
+    assert response.status_code == 409
+    assert airtable.requests_to(EDUCATORS_SCHOOLS_TABLE_NAME, "POST") == []
+    assert len(airtable.tables[EDUCATORS_SCHOOLS_TABLE_NAME]) == 1
+
+
+def test_create_educator_school_requires_educator_and_school(client, airtable):
+    response = client.post("/educators_schools", json={"educator_id": "recE1"})
+
+    assert response.status_code == 400
+    assert airtable.requests == []
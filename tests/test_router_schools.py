@@ -0,0 +1,35 @@
+import json
+
+from app.airtable.base_school_db import SCHOOLS_TABLE_NAME
+
+
+def test_export_schools_streams_every_page(client, airtable):
+    for i in range(5):
+        airtable.add(SCHOOLS_TABLE_NAME, f"recS{i}", {"Name": f"School {i}"})
+
+    response = client.get("/schools/export?page_size=2")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [f"recS{i}" for i in range(5)]
+    assert len(airtable.requests_to(SCHOOLS_TABLE_NAME)) == 3
+
+
+def test_export_schools_of_an_empty_table(client, airtable):
+    response = client.get("/schools/export")
+
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+def test_export_schools_reports_airtable_errors(client, airtable):
+    airtable.failures[SCHOOLS_TABLE_NAME] = (503, {"error": "SERVICE_UNAVAILABLE"})
+
+    response = client.get("/schools/export")
+
+    assert response.status_code == 503
+
+
+def test_export_schools_bounds_page_size(client, airtable):
+    assert client.get("/schools/export?page_size=500").status_code == 422
+    assert airtable.requests == []